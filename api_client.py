@@ -0,0 +1,100 @@
+import os
+import threading
+import time
+import logging
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+# Timeout (connessione, lettura) in secondi e durata della cache dei materiali
+API_CONNECT_TIMEOUT = float(os.getenv('API_CONNECT_TIMEOUT', '5'))
+API_READ_TIMEOUT = float(os.getenv('API_READ_TIMEOUT', '60'))
+MATERIALS_CACHE_TTL = float(os.getenv('MATERIALS_CACHE_TTL', '60'))
+
+class BackendClient:
+    """
+    Client HTTP condiviso verso il backend
+
+    Usa una requests.Session con pool di connessioni keep-alive, timeout di default e
+    retry con backoff esponenziale sugli errori transitori. La lista dei materiali è
+    tenuta in cache per MATERIALS_CACHE_TTL secondi e poi rivalidata con If-None-Match.
+    """
+
+    def __init__(self, base_url: str, pool_size: int = 10, max_retries: int = 3):
+        self.base_url = base_url.rstrip('/')
+        self.timeout = (API_CONNECT_TIMEOUT, API_READ_TIMEOUT)
+
+        retry = Retry(
+            total=max_retries,
+            backoff_factor=0.3,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset(['GET', 'HEAD', 'OPTIONS', 'PATCH', 'DELETE']),
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+        self.session = requests.Session()
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+        self._materials = None
+        self._materials_etag = None
+        self._materials_fetched_at = 0.0
+        self._lock = threading.Lock()
+
+    def request(self, method: str, path: str, **kwargs) -> requests.Response:
+        kwargs.setdefault('timeout', self.timeout)
+        return self.session.request(method, f"{self.base_url}{path}", **kwargs)
+
+    def get(self, path: str, **kwargs) -> requests.Response:
+        return self.request('GET', path, **kwargs)
+
+    def post(self, path: str, **kwargs) -> requests.Response:
+        return self.request('POST', path, **kwargs)
+
+    def patch(self, path: str, **kwargs) -> requests.Response:
+        return self.request('PATCH', path, **kwargs)
+
+    def delete(self, path: str, **kwargs) -> requests.Response:
+        return self.request('DELETE', path, **kwargs)
+
+    def get_materials(self, force: bool = False) -> list:
+        """Lista dei materiali, dalla cache se ancora valida"""
+        with self._lock:
+            if not force and self._materials is not None and \
+                    time.monotonic() - self._materials_fetched_at < MATERIALS_CACHE_TTL:
+                return self._materials
+
+            headers = {}
+            if self._materials is not None and self._materials_etag:
+                headers['If-None-Match'] = self._materials_etag
+
+            response = self.get('/materials/', headers=headers)
+            if response.status_code == 304:
+                logger.debug("Materials not modified, keeping cached list")
+            else:
+                response.raise_for_status()
+                self._materials = response.json()
+                self._materials_etag = response.headers.get('ETag')
+            self._materials_fetched_at = time.monotonic()
+            return self._materials
+
+    def invalidate_materials(self):
+        """Scarta la lista in cache, da chiamare dopo ogni modifica ai materiali"""
+        with self._lock:
+            self._materials = None
+            self._materials_etag = None
+            self._materials_fetched_at = 0.0
+
+_clients = {}
+_clients_lock = threading.Lock()
+
+def get_client(base_url: str) -> BackendClient:
+    """Restituisce il client condiviso per l'URL del backend"""
+    with _clients_lock:
+        client = _clients.get(base_url)
+        if client is None:
+            client = _clients[base_url] = BackendClient(base_url)
+        return client
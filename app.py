@@ -1,31 +1,31 @@
 import streamlit as st
-import plotly.graph_objects as go
 import numpy as np
-import requests
-import pandas as pd
-import json
 import base64
-import io
-import trimesh
-import tempfile
 import os
 import logging
+import time
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+from log_config import setup_logging
+
+setup_logging()
 logger = logging.getLogger(__name__)
 
 # Get backend URL from environment variable with fallback
 # In production on Render, this will point to the backend service
 BACKEND_URL = os.getenv('BACKEND_URL', 'https://3d-print-calculator-backend.onrender.com')
 
-logger.info(f"Using backend URL: {BACKEND_URL}")
+logger.info("Using backend URL: %s", BACKEND_URL)
 
+from api_client import get_client
 from materials_manager import materials_manager_page, fetch_materials
-from stl_processor import process_stl, calculate_print_cost  # Add these imports
+from stl_processor import (
+    MESH_EXTENSIONS, PART_SPACING, PLATE_DEPTH, PLATE_WIDTH, analyze_stl_cached, analyze_stl_batch,
+    calculate_print_cost, content_hash, extract_stl_files, order_totals, plate_quote, preview_glb,
+    price_grid, quote_row
+)
+
+# Estensioni accettate dagli uploader (il formato è poi riconosciuto dal contenuto)
+MESH_UPLOAD_TYPES = [extension.lstrip('.') for extension in MESH_EXTENSIONS]
 
 def get_materials_from_api():
     """Recupera i materiali dal backend"""
@@ -38,55 +38,176 @@ def get_materials_from_api():
         'hourly_cost': mat.get('hourly_cost', 30)
     } for mat in materials}
 
-def convert_stl_to_glb(stl_content):
-    """Converte il contenuto STL in GLB"""
-    temp_stl_path = None
-    temp_glb_path = None
+# Secondi per cui un'anteprima verificata sul backend si considera ancora disponibile:
+# nel frattempo i rerun riusano l'URL senza interrogare il backend
+PREVIEW_CHECK_INTERVAL = float(os.getenv('PREVIEW_CHECK_INTERVAL', '300'))
+
+def upload_key(uploaded_file):
+    """
+    Hash del contenuto di un file caricato, calcolato una sola volta per upload
+
+    Streamlit assegna un file_id a ogni caricamento: i rerun successivi (slider,
+    copie, materiale) riusano l'hash invece di rileggere tutto il file.
+    """
+    keys = st.session_state.setdefault('upload_keys', {})
+    file_id = getattr(uploaded_file, 'file_id', None) or (uploaded_file.name, uploaded_file.size)
+    if file_id not in keys:
+        keys[file_id] = content_hash(uploaded_file.getvalue())
+    return keys[file_id]
+
+def preview_model_url(stl_content, file_key):
+    """
+    URL del modello GLB di anteprima per il viewer
+
+    L'anteprima viene caricata sul backend una sola volta per file: il browser la
+    scarica da un URL indirizzato per contenuto e la tiene in cache. La presenza sul
+    backend è verificata al più ogni PREVIEW_CHECK_INTERVAL secondi; se manca (404)
+    viene caricata di nuovo. Se il backend non è raggiungibile il modello viene
+    incluso nella pagina come data URL.
+    """
+    previews = st.session_state.setdefault('preview_urls', {})
+    entry = previews.get(file_key)
+    if entry is not None:
+        url, checked_at = entry
+        if url.startswith("data:") or time.monotonic() - checked_at < PREVIEW_CHECK_INTERVAL:
+            return url
+        if preview_available(url):
+            previews[file_key] = (url, time.monotonic())
+            return url
 
     try:
-        logger.info("Iniziando la conversione STL -> GLB")
-
-        # Crea un file temporaneo per il contenuto STL
-        with tempfile.NamedTemporaryFile(suffix='.stl', delete=False) as temp_stl:
-            temp_stl.write(stl_content)
-            temp_stl_path = temp_stl.name
-            logger.info(f"File STL temporaneo creato: {temp_stl_path}")
-
-        # Carica la mesh STL
-        mesh = trimesh.load(temp_stl_path)
-        if not mesh.is_valid:
-            raise ValueError("Mesh STL non valida")
-        logger.info("Mesh STL caricata correttamente")
-
-        # Crea un file temporaneo per il GLB
-        with tempfile.NamedTemporaryFile(suffix='.glb', delete=False) as temp_glb:
-            temp_glb_path = temp_glb.name
-
-        # Esporta come GLB
-        mesh.export(temp_glb_path, file_type='glb')
-        logger.info("Mesh esportata come GLB")
+        response = get_client(BACKEND_URL).post(
+            "/previews",
+            files={'file': ('model.stl', stl_content, 'application/octet-stream')}
+        )
+        response.raise_for_status()
+        url = f"{BACKEND_URL}{response.json()['url']}"
+    except Exception as e:
+        logger.warning("Anteprima non disponibile dal backend, uso il modello locale: %s", e)
+        url = "data:model/gltf-binary;base64," + base64.b64encode(preview_glb(stl_content, key=file_key)).decode()
 
-        # Leggi il contenuto GLB
-        with open(temp_glb_path, 'rb') as f:
-            glb_content = f.read()
+    previews[file_key] = (url, time.monotonic())
+    return url
 
-        logger.info("Conversione completata con successo")
-        return base64.b64encode(glb_content).decode()
+def preview_available(url):
+    """False se il backend non ha più l'anteprima (404): va caricata di nuovo"""
+    try:
+        return get_client(BACKEND_URL).request('HEAD', url[len(BACKEND_URL):]).status_code != 404
+    except Exception:
+        return True  # backend non raggiungibile: il viewer mostrerà l'errore di caricamento
+
+# Bundle three.js del viewer, servito dal backend come application/javascript: lo
+# static serving di Streamlit lo servirebbe come text/plain con nosniff
+VIEWER_SCRIPT = 'three-r140-viewer.min.js'
+VIEWER_SCRIPT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'static', VIEWER_SCRIPT)
+
+@st.cache_resource
+def inline_viewer_script():
+    """Bundle da includere nella pagina quando il backend non è raggiungibile"""
+    with open(VIEWER_SCRIPT_PATH, encoding='utf-8') as f:
+        return f.read().replace('</script', '<\\/script')
+
+def viewer_script_tag(model_url):
+    if model_url.startswith("data:"):
+        return f"<script>{inline_viewer_script()}</script>"
+    return f'<script src="{BACKEND_URL}/viewer/{VIEWER_SCRIPT}"></script>'
+
+def options_comparison_table(volume, materials_data, num_copies, profile=None, step=0.05, per_plate=None):
+    """Tabella con il costo di ogni combinazione materiale × altezza layer"""
+    import pandas as pd  # importato al primo uso: riduce il tempo di avvio a freddo
+    min_layer = min(props['min_layer_height'] for props in materials_data.values())
+    max_layer = max(props['max_layer_height'] for props in materials_data.values())
+    layer_heights = np.round(np.arange(min_layer, max_layer + step / 2, step), 2)
+
+    grid = price_grid([volume], materials_data, layer_heights, [num_copies],
+                      profiles=None if profile is None else [profile], per_plate=per_plate)
+    material_idx, layer_idx = np.nonzero(grid['valid'])
+    return pd.DataFrame({
+        'Materiale': np.array(grid['materials'])[material_idx],
+        'Layer (mm)': layer_heights[layer_idx],
+        'Peso (kg)': grid['weight_kg'][0, material_idx, layer_idx].round(3),
+        'Tempo (ore)': grid['tempo_stampa'][0, material_idx, layer_idx].round(2),
+        'Costo pezzo (€)': grid['total_cost'][0, material_idx, layer_idx].round(2),
+        f'Costo x{num_copies} (€)': grid['order_total_cost'][0, material_idx, layer_idx, 0].round(2)
+    })
+
+def plate_layout_figure(layout, dimensions, plate_width, plate_depth):
+    """Disegno dall'alto di un piatto pieno, un rettangolo per copia"""
+    import plotly.graph_objects as go  # serve solo con più copie per piatto
+    fig = go.Figure()
+    fig.add_shape(type="rect", x0=0, y0=0, x1=plate_width, y1=plate_depth, line=dict(color="#888"))
+    for x, y, rotated in layout:
+        width, depth = dimensions['width'], dimensions['depth']
+        if rotated:
+            width, depth = depth, width
+        fig.add_shape(type="rect", x0=x, y0=y, x1=x + width, y1=y + depth,
+                      line=dict(color="#1f77b4"), fillcolor="rgba(31, 119, 180, 0.3)")
+    fig.update_xaxes(range=[-5, plate_width + 5], title="mm")
+    fig.update_yaxes(range=[-5, plate_depth + 5], scaleanchor="x", scaleratio=1)
+    fig.update_layout(height=400, margin=dict(l=20, r=20, t=20, b=20), showlegend=False)
+    return fig
+
+def batch_quote_section(material_props, layer_height, num_copies):
+    """Preventivo di un ordine composto da più file STL o archivi ZIP"""
+    st.subheader("Preventivo Ordine")
+    uploaded_files = st.file_uploader(
+        "Scegli file STL, 3MF, PLY, OBJ o archivi ZIP",
+        type=MESH_UPLOAD_TYPES + ['zip'],
+        help="Sono accettati anche file compressi gzip (.gz) e zstd (.zst)",
+        accept_multiple_files=True
+    )
+    if not uploaded_files:
+        return
+    import pandas as pd
 
+    try:
+        stl_files = []
+        for uploaded_file in uploaded_files:
+            stl_files.extend(extract_stl_files(uploaded_file.name, uploaded_file.getvalue()))
     except Exception as e:
-        logger.error(f"Errore durante la conversione: {str(e)}")
-        raise Exception(f"Errore nella conversione STL->GLB: {str(e)}")
-
-    finally:
-        # Pulisci i file temporanei
-        try:
-            if temp_stl_path and os.path.exists(temp_stl_path):
-                os.unlink(temp_stl_path)
-            if temp_glb_path and os.path.exists(temp_glb_path):
-                os.unlink(temp_glb_path)
-            logger.info("File temporanei rimossi")
-        except Exception as e:
-            logger.warning(f"Errore nella pulizia dei file temporanei: {str(e)}")
+        logger.error("Errore nella lettura dei file dell'ordine: %s", e)
+        st.error(f"Errore nella lettura dei file: {str(e)}")
+        return
+
+    # Le righe compaiono man mano che i processi terminano l'analisi
+    progress = st.progress(0.0, text=f"Analisi di {len(stl_files)} file in corso...")
+    table = st.empty()
+    rows = []
+    for name, analysis, error in analyze_stl_batch(stl_files):
+        if error:
+            rows.append({'file': name, 'error': error})
+        else:
+            rows.append(quote_row(name, analysis, material_props, layer_height, num_copies))
+        progress.progress(len(rows) / len(stl_files), text=f"Analizzati {len(rows)} di {len(stl_files)} file")
+        table.dataframe(
+            pd.DataFrame(rows).reindex(columns=[
+                'file', 'volume_cm3', 'weight_kg', 'tempo_stampa', 'total_cost', 'order_total_cost', 'error'
+            ]).rename(columns={
+                'file': 'File',
+                'volume_cm3': 'Volume (cm³)',
+                'weight_kg': 'Peso (kg)',
+                'tempo_stampa': 'Tempo (ore)',
+                'total_cost': 'Costo pezzo (€)',
+                'order_total_cost': f'Costo x{num_copies} (€)',
+                'error': 'Errore'
+            }),
+            hide_index=True
+        )
+    progress.empty()
+
+    totals = order_totals(rows)
+    st.markdown("##### Totale Ordine")
+    tcol1, tcol2, tcol3, tcol4 = st.columns(4)
+    with tcol1:
+        st.metric("Pezzi", totals['pieces'], help=f"Su {totals['plates']} piatti di stampa")
+    with tcol2:
+        st.metric("Peso Totale", f"{totals['weight_kg']:.3f} kg")
+    with tcol3:
+        st.metric("Tempo Totale", f"{totals['tempo_stampa']:.1f} ore")
+    with tcol4:
+        st.metric("Costo Totale", f"€{totals['total_cost']:.2f}")
+    if totals['failed']:
+        st.warning(f"{totals['failed']} file non sono stati elaborati e sono esclusi dal totale")
 
 def main():
     # Configura la pagina
@@ -133,6 +254,7 @@ def main():
 
         # Sposta la tabella dei materiali in un expander
         with st.expander("📋 Mostra dettagli materiali"):
+            import pandas as pd
             materials_df = pd.DataFrame.from_dict(materials_data, orient='index')
             materials_df.index.name = 'Materiale'
 
@@ -181,9 +303,18 @@ def main():
                     help="Inserisci il numero di copie da stampare"
                 )
 
+            batch_mode = st.toggle("Ordine con più file o archivio ZIP")
+            if batch_mode:
+                batch_quote_section(material_props, layer_height, num_copies)
+                return
+
             # Caricamento file
             st.subheader("Anteprima Modello")
-            uploaded_file = st.file_uploader("Scegli un file STL", type=['stl'])
+            uploaded_file = st.file_uploader(
+                "Scegli un file STL, 3MF, PLY o OBJ",
+                type=MESH_UPLOAD_TYPES,
+                help="Sono accettati anche file compressi gzip (.gz) e zstd (.zst)"
+            )
 
             # Prepare the STL viewer HTML/JavaScript
             js_code = """
@@ -204,13 +335,12 @@ def main():
             renderer.shadowMap.enabled = true;
             renderer.shadowMap.type = THREE.PCFSoftShadowMap;
             container.appendChild(renderer.domElement);
-            controls = new THREE.OrbitControls(camera, renderer.domElement);
-            controls.enableDamping = true;
-            controls.dampingFactor = 0.05;
-            controls.screenSpacePanning = true;
+            controls = new THREE.TrackballControls(camera, renderer.domElement);
+            controls.rotateSpeed = 2.0;
+            controls.staticMoving = false;
+            controls.dynamicDampingFactor = 0.05;
             controls.minDistance = 50;
             controls.maxDistance = 300;
-            controls.maxPolarAngle = Math.PI;
             const ambientLight = new THREE.AmbientLight(0x404040, 0.8);
             scene.add(ambientLight);
             const mainLight = new THREE.DirectionalLight(0xffffff, 1.0);
@@ -239,39 +369,54 @@ def main():
             }
             """
 
+            model_url = ""
             if uploaded_file:
+                # L'anteprima usa una mesh semplificata; i calcoli restano sulla geometria originale
+                file_key = upload_key(uploaded_file)
+                try:
+                    model_url = preview_model_url(uploaded_file.getvalue(), file_key)
+                except Exception as e:
+                    # Il viewer mostrerà l'errore di caricamento, i dettagli arrivano dall'analisi
+                    logger.error("Errore nella generazione dell'anteprima: %s", e)
+                    model_url = ""
                 js_code += f"""
-                const loader = new THREE.STLLoader();
-                const modelData = atob("{base64.b64encode(uploaded_file.getvalue()).decode()}");
-                const buffer = new Uint8Array(modelData.length);
-                for (let i = 0; i < modelData.length; i++) {{
-                    buffer[i] = modelData.charCodeAt(i);
-                }}
-                try {{
-                    const geometry = loader.parse(buffer.buffer);
-                    const material = new THREE.MeshPhongMaterial({{
-                        color: 0x1E88E5,
-                        shininess: 50,
-                        specular: 0x444444,
-                        flatShading: false
-                    }});
-                    const mesh = new THREE.Mesh(geometry, material);
-                    mesh.castShadow = true;
-                    mesh.receiveShadow = true;
-                    geometry.computeBoundingBox();
-                    const center = new THREE.Vector3();
-                    geometry.boundingBox.getCenter(center);
-                    mesh.position.sub(center);
-                    const size = new THREE.Vector3();
-                    geometry.boundingBox.getSize(size);
-                    const maxDim = Math.max(size.x, size.y, size.z);
-                    const scale = 100 / maxDim;
-                    mesh.scale.multiplyScalar(scale);
-                    scene.add(mesh);
-                }} catch (error) {{
-                    console.error('Errore nel parsing STL:', error);
+                const loader = new THREE.GLTFLoader();
+                function showModelError(error) {{
+                    console.error('Errore nel caricamento del modello:', error);
                     container.innerHTML = '<div style="color: red; padding: 20px;">Errore nel caricamento del modello</div>';
                 }}
+                fetch("{model_url}")
+                    .then(response => {{
+                        if (!response.ok) throw new Error('HTTP ' + response.status);
+                        return response.arrayBuffer();
+                    }})
+                    .then(buffer => loader.parse(buffer, '', gltf => {{
+                        const model = gltf.scene;
+                        const material = new THREE.MeshPhongMaterial({{
+                            color: 0x1E88E5,
+                            shininess: 50,
+                            specular: 0x444444,
+                            flatShading: false
+                        }});
+                        model.traverse(child => {{
+                            if (child.isMesh) {{
+                                child.material = material;
+                                child.castShadow = true;
+                                child.receiveShadow = true;
+                            }}
+                        }});
+                        const box = new THREE.Box3().setFromObject(model);
+                        const size = new THREE.Vector3();
+                        box.getSize(size);
+                        const maxDim = Math.max(size.x, size.y, size.z);
+                        const scale = 100 / maxDim;
+                        const center = new THREE.Vector3();
+                        box.getCenter(center);
+                        model.scale.multiplyScalar(scale);
+                        model.position.sub(center.multiplyScalar(scale));
+                        scene.add(model);
+                    }}, showModelError))
+                    .catch(showModelError);
                 """
 
             js_code += """
@@ -303,9 +448,7 @@ def main():
                     </button>
                 </div>
             </div>
-            <script src="https://cdnjs.cloudflare.com/ajax/libs/three.js/r113/three.min.js"></script>
-            <script src="https://cdn.rawgit.com/mrdoob/three.js/r113/examples/js/loaders/STLLoader.js"></script>
-            <script src="https://cdn.rawgit.com/mrdoob/three.js/r113/examples/js/controls/OrbitControls.js"></script>
+            {viewer_script_tag(model_url)}
             <script>
             {js_code}
             </script>
@@ -315,11 +458,27 @@ def main():
 
             if uploaded_file is not None:
                 try:
-                    # Processa file STL
-                    volume, vertices, dimensions = process_stl(uploaded_file.getvalue())
+                    # Processa file STL (riusa l'analisi se il file non è cambiato)
+                    analysis = analyze_stl_cached(uploaded_file.getvalue(), file_key)
+                    volume, dimensions = analysis['volume'], analysis['dimensions']
+
+                    # Avvisi sulla validità della mesh
+                    report = analysis.get('mesh_report')
+                    if report and not report['watertight']:
+                        st.warning(
+                            f"La mesh non è chiusa ({report['open_edges']} spigoli aperti, "
+                            f"{report['non_manifold_edges']} non manifold): il volume è approssimato"
+                        )
+                    if report and report['repaired']:
+                        st.info(
+                            f"Mesh riparata: {report['flipped']} facce riorientate, "
+                            f"{report['duplicates']} duplicate e {report['degenerate']} degeneri rimosse"
+                        )
 
                     # Calcola costi per un singolo pezzo
-                    calculations = calculate_print_cost(volume, material_props, layer_height)
+                    calculations = calculate_print_cost(
+                        volume, material_props, layer_height, profile=analysis.get('profile')
+                    )
 
                     # Mostra risultati per pezzo singolo
                     st.subheader("Risultati per Singolo Pezzo")
@@ -350,23 +509,59 @@ def main():
                     st.write(f"Costo Macchina: €{calculations['machine_cost']:.2f}")
 
                     # Mostra totale per tutte le copie se num_copies > 1
+                    plates = None
                     if num_copies > 1:
                         st.markdown("##### Totale per più pezzi")
-                        total_cost = calculations['total_cost'] * num_copies
+                        with st.expander("Piatto di stampa"):
+                            pcol1, pcol2, pcol3 = st.columns(3)
+                            with pcol1:
+                                plate_width = st.number_input("Larghezza piatto (mm)", min_value=10.0, value=PLATE_WIDTH, step=10.0)
+                            with pcol2:
+                                plate_depth = st.number_input("Profondità piatto (mm)", min_value=10.0, value=PLATE_DEPTH, step=10.0)
+                            with pcol3:
+                                spacing = st.number_input("Distanza tra i pezzi (mm)", min_value=0.0, value=PART_SPACING, step=1.0)
+
+                        # Le copie vengono disposte sui piatti e condividono i movimenti per layer
+                        try:
+                            plates = plate_quote(analysis, material_props, layer_height, num_copies,
+                                                 plate_width, plate_depth, spacing)
+                            total_cost = plates['total_cost']
+                            total_time = plates['tempo_stampa']
+                        except ValueError as e:
+                            st.warning(f"{str(e)}: le copie sono prezzate come stampe separate")
+                            total_cost = calculations['total_cost'] * num_copies
+                            total_time = calculations['tempo_stampa'] * num_copies
                         total_volume = calculations['volume_cm3'] * num_copies
                         total_weight = calculations['weight_kg'] * num_copies
-                        total_time = calculations['tempo_stampa'] * num_copies
 
-                        tcol1, tcol2, tcol3 = st.columns(3)
+                        tcol1, tcol2, tcol3, tcol4 = st.columns(4)
                         with tcol1:
                             st.metric("Volume Totale", f"{total_volume:.2f} cm³")
                         with tcol2:
                             st.metric("Peso Totale", f"{total_weight:.3f} kg")
                         with tcol3:
+                            st.metric("Tempo Totale", f"{total_time:.1f} ore")
+                        with tcol4:
                             st.metric("Costo Totale", f"€{total_cost:.2f}")
 
+                        if plates:
+                            st.write(f"Piatti di stampa: {plates['plates']} "
+                                     f"(fino a {plates['per_plate']} copie per piatto)")
+                            st.plotly_chart(
+                                plate_layout_figure(plates['layout'], dimensions, plate_width, plate_depth),
+                                use_container_width=True
+                            )
+
+                    # Confronto di tutte le opzioni calcolato in un unico passaggio
+                    st.markdown("##### Confronto Materiali e Altezze Layer")
+                    st.dataframe(
+                        options_comparison_table(volume, materials_data, num_copies, analysis.get('profile'),
+                                                 per_plate=plates['per_plate'] if plates else None),
+                        hide_index=True
+                    )
+
                 except Exception as e:
-                    logger.error(f"Errore nel processare il file: {str(e)}")
+                    logger.error("Errore nel processare il file: %s", e)
                     st.error(f"Errore nel processare il file: {str(e)}")
 
     elif page == "⚙️ Gestione Materiali":
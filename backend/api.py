@@ -1,18 +1,376 @@
+import asyncio
+import base64
+import csv
+import gzip
+import hashlib
+import io
+import json
 import logging
-from fastapi import FastAPI, Depends, HTTPException
+import os
+import tempfile
+import zipfile
+from fastapi import FastAPI, Depends, HTTPException, UploadFile, File, Form, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi.responses import FileResponse, Response, StreamingResponse
+from pydantic import ValidationError
+from sqlalchemy import insert, select, tuple_, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Literal, Optional
 import time
 
 from . import models, schemas, database
+from .jobs import job_queue, shutdown_manager
+from .metrics import REGISTRY, STAGE_LATENCY, MetricsMiddleware
+from stl_processor import (
+    analyze_stl, analyze_stl_file, analyze_streamed_stl, analysis_cache, build_preview_glb, content_hash,
+    extract_stl_files, get_process_pool, mesh_format, order_totals, preview_cache, preview_cache_key, quote_row,
+    PREVIEW_KEY, report_stage_times, run_with_stage_times, set_stage_observer, shutdown_process_pool,
+    STL_SNIFF_SIZE, StreamingSTLParser
+)
+from scheduler import schedule_jobs
+from log_config import setup_logging
+
+try:
+    import brotli
+except ImportError:  # brotli è opzionale: senza, le anteprime sono servite in gzip
+    brotli = None
 
-# Configura logging
-logging.basicConfig(level=logging.INFO)
+setup_logging()
 logger = logging.getLogger(__name__)
 
 app = FastAPI(title="3D Print Cost Calculator API")
 
+# Le anteprime sono indirizzate per contenuto: possono restare in cache per sempre
+PREVIEW_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+# Dimensione dei blocchi letti dall'upload e limite massimo del file
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+MAX_UPLOAD_SIZE = int(os.getenv("MAX_UPLOAD_MB", "512")) * 1024 * 1024
+
+async def read_upload(file: UploadFile) -> bytes:
+    """Legge l'upload a blocchi, rifiutando i file oltre MAX_UPLOAD_SIZE"""
+    buffer = bytearray()
+    while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+        buffer += chunk
+        if len(buffer) > MAX_UPLOAD_SIZE:
+            raise HTTPException(status_code=413, detail="File STL troppo grande")
+    return bytes(buffer)
+
+# Tempi delle fasi di stl_processor (process_stl, calculate_print_cost, ...) nelle metriche
+set_stage_observer(lambda stage, seconds: STAGE_LATENCY.observe(seconds, stage=stage))
+
+async def run_in_pool(func, *args):
+    """Esegue func nel pool di processi, riportando nelle metriche i tempi delle sue fasi"""
+    loop = asyncio.get_running_loop()
+    result, stage_times = await loop.run_in_executor(get_process_pool(), run_with_stage_times, func, *args)
+    report_stage_times(stage_times)
+    return result
+
+async def analyze_upload(content: bytes) -> dict:
+    """Analisi della mesh tramite cache condivisa e pool di processi"""
+    # I file già visti riusano l'analisi dalla cache condivisa
+    key = await asyncio.to_thread(content_hash, content)
+    analysis = analysis_cache.get(key)
+    if analysis is None:
+        # L'analisi della mesh è CPU-bound: la eseguiamo fuori dall'event loop
+        analysis = await run_in_pool(analyze_stl, content)
+        analysis_cache.put(key, analysis)
+    return analysis
+
+# Oltre questa dimensione /quote non bufferizza il file: lo salva su disco a blocchi
+STL_STREAM_THRESHOLD = int(os.getenv("STL_STREAM_THRESHOLD_MB", "64")) * 1024 * 1024
+
+async def stream_stl_analysis(chunks, expected_size: int | None = None) -> dict:
+    """
+    Analisi di un file mesh letto a blocchi, senza tenerlo in memoria.
+
+    Il file è salvato su disco da spool_upload, che per gli STL non compressi ricava
+    già durante l'upload hash, volume, dimensioni e impronta: senza un'analisi in cache
+    resta solo il profilo di sezione (analyze_streamed_stl), senza rileggere né hashare
+    il file. Gli altri formati sono analizzati da analyze_stl_file, che decomprime gzip
+    e zstd a blocchi.
+    """
+    spool = await spool_upload(chunks, expected_size)
+    try:
+        analysis = analysis_cache.get(spool.key)
+        if analysis is None:
+            try:
+                if spool.stats is not None:
+                    analysis = await run_in_pool(analyze_streamed_stl, spool.path, spool.stats, spool.vectors_path)
+                else:
+                    analysis = await run_in_pool(analyze_stl_file, spool.path)
+            except ValueError as e:
+                raise HTTPException(status_code=422, detail=str(e))
+            analysis_cache.put(spool.key, analysis)
+        return analysis
+    finally:
+        spool.discard()
+
+class UploadSpool:
+    """
+    File temporaneo scritto a blocchi, con l'hash del contenuto e, per gli STL non
+    compressi, validazione e proprietà di massa calcolate da StreamingSTLParser nello
+    stesso passaggio: ogni byte è letto una volta sola. I triangoli degli STL ASCII
+    sono salvati anche in binario in vectors_path, per il profilo di sezione.
+    """
+
+    def __init__(self, expected_size: int | None = None):
+        self.expected_size = expected_size
+        self.file = tempfile.NamedTemporaryFile(delete=False)
+        self.vectors = None
+        self.parser = None
+        self.key = None
+        self.stats = None
+        self._hasher = None
+        self._head = bytearray()  # primi byte, finché il formato non è riconosciuto
+
+    @property
+    def path(self) -> str:
+        return self.file.name
+
+    @property
+    def vectors_path(self) -> str | None:
+        return self.vectors.name if self.vectors is not None and self.parser.format == 'ascii' else None
+
+    def _start(self):
+        head, self._head = bytes(self._head), None
+        if mesh_format(head, self.expected_size) == 'stl':
+            self.vectors = tempfile.NamedTemporaryFile(delete=False)
+            self.parser = StreamingSTLParser(self.expected_size, ascii_vectors=self.vectors)
+            self.parser.feed(head)
+        else:
+            self._hasher = hashlib.sha256(head)
+
+    def write(self, chunk: bytes):
+        self.file.write(chunk)
+        if self._head is None:
+            (self.parser.feed if self.parser is not None else self._hasher.update)(chunk)
+            return
+        self._head += chunk
+        if len(self._head) >= STL_SNIFF_SIZE:
+            self._start()
+
+    def finish(self):
+        """
+        Chiude i file e calcola key (hash del contenuto) e stats (StreamingSTLParser.finish(),
+        None se il file non è un STL non compresso); ValueError se l'STL non è valido
+        """
+        self.file.close()
+        if self._head is not None:
+            self._start()
+        if self.parser is None:
+            self.key = self._hasher.hexdigest()
+            return
+        self.stats = self.parser.finish()
+        self.vectors.close()
+        self.key = self.stats['hash']
+
+    def discard(self):
+        for f in (self.file, self.vectors):
+            if f is not None:
+                f.close()
+                os.unlink(f.name)
+
+async def spool_upload(chunks, expected_size: int | None = None) -> UploadSpool:
+    """
+    Salva un upload a blocchi in un file temporaneo, hashandolo man mano.
+
+    Scrittura, hash e parsing di ogni blocco girano in un thread mentre arriva il
+    successivo: l'event loop non esegue calcoli NumPy. Gli STL non compressi sono
+    validati in streaming: un file troncato o malformato è rifiutato con 422 prima
+    di qualunque analisi.
+
+    Returns:
+        UploadSpool: file salvato, con hash e statistiche; il chiamante lo elimina con discard()
+    """
+    loop = asyncio.get_running_loop()
+    spool = UploadSpool(expected_size)
+    pending = None
+    received = 0
+    try:
+        try:
+            async for chunk in chunks:
+                received += len(chunk)
+                if received > MAX_UPLOAD_SIZE:
+                    raise HTTPException(status_code=413, detail="File STL troppo grande")
+                if pending is not None:
+                    await pending
+                pending = loop.run_in_executor(None, spool.write, chunk)
+            if pending is not None:
+                await pending
+            await loop.run_in_executor(None, spool.finish)
+        except ValueError as e:
+            raise HTTPException(status_code=422, detail=f"Errore nel processare il file STL: {str(e)}")
+    except BaseException:
+        # Il blocco in scrittura nel thread va concluso prima di chiudere il file
+        if pending is not None:
+            await asyncio.wait([pending])
+        spool.discard()
+        raise
+    return spool
+
+async def upload_chunks(file: UploadFile):
+    while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+        yield chunk
+
+def material_properties(material: models.Material) -> dict:
+    """Proprietà del materiale nel formato atteso da calculate_print_cost"""
+    return {
+        'density': material.density,
+        'cost_per_kg': material.cost_per_kg,
+        'min_layer_height': material.min_layer_height,
+        'max_layer_height': material.max_layer_height,
+        'hourly_cost': material.hourly_cost if material.hourly_cost is not None else 30
+    }
+
+async def get_quote_material(db: AsyncSession, material_id: int, layer_height: float) -> dict:
+    """Recupera il materiale del preventivo e verifica l'altezza layer richiesta"""
+    db_material = await db.get(models.Material, material_id)
+    if not db_material:
+        raise HTTPException(status_code=404, detail="Material not found")
+
+    properties = material_properties(db_material)
+    if not properties['min_layer_height'] <= layer_height <= properties['max_layer_height']:
+        raise HTTPException(
+            status_code=422,
+            detail=f"Altezza layer fuori dal range del materiale "
+                   f"({properties['min_layer_height']}-{properties['max_layer_height']} mm)"
+        )
+    return properties
+
+class MaterialsCache:
+    """
+    Snapshot in memoria della tabella materiali
+
+    La lista viene letta dal database alla prima richiesta dopo ogni modifica
+    (create/update/delete incrementano la versione) e comunque dopo ttl secondi, così
+    le modifiche fatte da altri worker diventano visibili. L'ETag è ricavato dal
+    contenuto, quindi è lo stesso su tutti i worker che vedono gli stessi dati.
+    """
+
+    MAX_RELOADS = 3  # letture ripetute se la tabella cambia durante il caricamento
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self.version = 0
+        self._loaded_at = 0.0
+        self._items = None
+        self._digest = None
+        self._bodies = {}  # (skip, limit) -> JSON già serializzato
+        self._lock = asyncio.Lock()
+
+    async def _load(self, db: AsyncSession) -> tuple[list, str]:
+        # populate_existing: la sessione può già contenere i materiali letti prima della modifica
+        materials = (await db.scalars(
+            select(models.Material).order_by(models.Material.id).execution_options(populate_existing=True)
+        )).all()
+        items = [schemas.Material.model_validate(m).model_dump() for m in materials]
+        return items, hashlib.sha1(json.dumps(items, sort_keys=True).encode()).hexdigest()
+
+    async def page(self, db: AsyncSession, skip: int, limit: int) -> tuple[bytes, str]:
+        """Corpo JSON ed ETag della pagina richiesta"""
+        async with self._lock:
+            if self._items is None or time.monotonic() - self._loaded_at > self.ttl:
+                for _ in range(self.MAX_RELOADS):
+                    version = self.version
+                    items, digest = await self._load(db)
+                    # Una modifica confermata durante la lettura invalida il risultato: i dati
+                    # letti sono precedenti al commit e non vanno salvati come snapshot
+                    if self.version == version:
+                        self._store(items, digest)
+                        break
+                else:
+                    # Modifiche continue: la pagina è servita senza aggiornare lo snapshot
+                    body = json.dumps(items[skip:skip + limit]).encode()
+                    return body, f'"{digest}-{skip}-{limit}"'
+            key = (skip, limit)
+            body = self._bodies.get(key)
+            if body is None:
+                body = json.dumps(self._items[skip:skip + limit]).encode()
+                if len(self._bodies) < 64:
+                    self._bodies[key] = body
+            return body, f'"{self._digest}-{skip}-{limit}"'
+
+    def _store(self, items: list, digest: str):
+        self._items = items
+        self._digest = digest
+        self._bodies = {}
+        self._loaded_at = time.monotonic()
+        logger.info("Loaded materials snapshot v%s (%s materials)", self.version, len(items))
+
+    def invalidate(self):
+        # Nessun await: sull'event loop l'azzeramento è atomico rispetto a page(), e un
+        # caricamento in corso vede la versione cambiata e scarta il proprio risultato
+        self.version += 1
+        self._items = None
+        self._digest = None
+        self._bodies = {}
+
+materials_cache = MaterialsCache(ttl=float(os.getenv("MATERIALS_SNAPSHOT_TTL", "30")))
+
+# Colonne ammesse per l'ordinamento con paginazione a cursore
+MATERIAL_SORT_COLUMNS = {
+    'id': models.Material.id,
+    'name': models.Material.name,
+    'cost_per_kg': models.Material.cost_per_kg,
+}
+
+def encode_cursor(sort_value, material_id: int) -> str:
+    """Cursore opaco con la chiave di ordinamento dell'ultimo elemento della pagina"""
+    return base64.urlsafe_b64encode(json.dumps([sort_value, material_id]).encode()).decode()
+
+def decode_cursor(cursor: str) -> tuple:
+    try:
+        sort_value, material_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return sort_value, int(material_id)
+    except Exception:
+        raise HTTPException(status_code=422, detail="Cursore non valido")
+
+def material_filters(name_prefix, min_cost, max_cost, layer_height_min, layer_height_max) -> list:
+    """Condizioni SQL dei filtri di /materials/, tutte risolvibili con gli indici"""
+    conditions = []
+    if name_prefix:
+        # Intervallo [prefisso, prefisso successivo) al posto di LIKE: usa l'indice su name
+        upper = name_prefix[:-1] + chr(ord(name_prefix[-1]) + 1)
+        conditions += [models.Material.name >= name_prefix, models.Material.name < upper]
+    if min_cost is not None:
+        conditions.append(models.Material.cost_per_kg >= min_cost)
+    if max_cost is not None:
+        conditions.append(models.Material.cost_per_kg <= max_cost)
+    if layer_height_min is not None or layer_height_max is not None:
+        # Il materiale deve supportare tutto l'intervallo richiesto
+        lower = layer_height_min if layer_height_min is not None else layer_height_max
+        upper = layer_height_max if layer_height_max is not None else layer_height_min
+        conditions += [models.Material.min_layer_height <= lower, models.Material.max_layer_height >= upper]
+    return conditions
+
+async def read_materials_page(db: AsyncSession, limit: int, cursor: Optional[str], sort: str, order: str,
+                              conditions: list) -> tuple[list, Optional[str]]:
+    """Pagina di materiali con paginazione a cursore (keyset) su (sort, id)"""
+    column = MATERIAL_SORT_COLUMNS[sort]
+    key = tuple_(column, models.Material.id) if sort != 'id' else models.Material.id
+    query = select(models.Material).where(*conditions)
+
+    if cursor:
+        sort_value, last_id = decode_cursor(cursor)
+        last = tuple_(sort_value, last_id) if sort != 'id' else last_id
+        query = query.where(key > last if order == 'asc' else key < last)
+
+    if order == 'asc':
+        query = query.order_by(column.asc(), models.Material.id.asc())
+    else:
+        query = query.order_by(column.desc(), models.Material.id.desc())
+
+    # Un elemento in più per sapere se esiste una pagina successiva
+    materials = (await db.scalars(query.limit(limit + 1))).all()
+    next_cursor = None
+    if len(materials) > limit:
+        materials = materials[:limit]
+        last_material = materials[-1]
+        next_cursor = encode_cursor(getattr(last_material, sort), last_material.id)
+    return materials, next_cursor
+
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
@@ -20,7 +378,9 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "X-Next-Cursor"],
 )
+app.add_middleware(MetricsMiddleware)
 
 # Initialize database tables at startup with retry mechanism
 @app.on_event("startup")
@@ -30,24 +390,29 @@ async def startup_event():
 
     for attempt in range(max_retries):
         try:
-            logger.info(f"Initializing database (attempt {attempt + 1}/{max_retries})...")
-            database.init_db()
+            logger.info("Initializing database (attempt %s/%s)...", attempt + 1, max_retries)
+            await database.init_db_async()
             logger.info("Database initialized successfully")
 
             # Log available routes
             routes = [{"path": route.path, "name": route.name} for route in app.routes]
-            logger.info(f"Available routes: {routes}")
+            logger.info("Available routes: %s", routes)
             return
 
         except Exception as e:
-            logger.error(f"Error during startup attempt {attempt + 1}: {str(e)}")
+            logger.error("Error during startup attempt %s: %s", attempt + 1, e)
             if attempt < max_retries - 1:
-                logger.info(f"Retrying in {retry_delay} seconds...")
-                time.sleep(retry_delay)
+                logger.info("Retrying in %s seconds...", retry_delay)
+                await asyncio.sleep(retry_delay)
             else:
                 logger.error("Max retries reached, failing startup")
                 raise
 
+@app.on_event("shutdown")
+def shutdown_event():
+    shutdown_process_pool()
+    shutdown_manager()
+
 # Root endpoint with health check
 @app.get("/")
 def read_root():
@@ -58,37 +423,79 @@ def read_root():
         "version": "1.0.0"
     }
 
+@app.get("/metrics", include_in_schema=False)
+def read_metrics():
+    """Metriche di richieste, pool del database e fasi di calcolo in formato Prometheus"""
+    return Response(REGISTRY.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
 # Materials endpoints
 @app.get("/materials/", response_model=List[schemas.Material])
-def read_materials(skip: int = 0, limit: int = 100, db: Session = Depends(database.get_db)):
-    try:
-        logger.info("Fetching materials from database")
-        materials = db.query(models.Material).offset(skip).limit(limit).all()
-        logger.info(f"Found {len(materials)} materials")
+async def read_materials(
+    request: Request,
+    response: Response,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = None,
+    sort: Optional[Literal['id', 'name', 'cost_per_kg']] = None,
+    order: Literal['asc', 'desc'] = 'asc',
+    name_prefix: Optional[str] = Query(None, min_length=1),
+    min_cost: Optional[float] = Query(None, ge=0),
+    max_cost: Optional[float] = Query(None, ge=0),
+    layer_height_min: Optional[float] = Query(None, gt=0),
+    layer_height_max: Optional[float] = Query(None, gt=0),
+    db: AsyncSession = Depends(database.get_db)
+):
+    """
+    Lista dei materiali.
+
+    Senza cursore, ordinamento o filtri la lista arriva dallo snapshot in memoria
+    (skip/limit, con ETag). Altrimenti la pagina è letta dal database con paginazione
+    a cursore: l'header X-Next-Cursor contiene il cursore della pagina successiva.
+    """
+    conditions = material_filters(name_prefix, min_cost, max_cost, layer_height_min, layer_height_max)
+    if cursor or sort or order != 'asc' or conditions:
+        if skip:
+            raise HTTPException(status_code=422, detail="skip non è compatibile con cursor, sort e filtri")
+        try:
+            materials, next_cursor = await read_materials_page(db, limit, cursor, sort or 'id', order, conditions)
+        except HTTPException:
+            raise
+        except Exception as e:
+            logger.error("Error fetching materials page: %s", e)
+            raise HTTPException(status_code=500, detail=str(e))
+        if next_cursor:
+            response.headers["X-Next-Cursor"] = next_cursor
         return materials
+
+    try:
+        body, etag = await materials_cache.page(db, skip, limit)
+        if etag in request.headers.get("if-none-match", ""):
+            return Response(status_code=304, headers={"ETag": etag})
+        return Response(content=body, media_type="application/json", headers={"ETag": etag})
     except Exception as e:
-        logger.error(f"Error fetching materials: {str(e)}")
+        logger.error("Error fetching materials: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/materials/", response_model=schemas.Material)
-def create_material(material: schemas.MaterialCreate, db: Session = Depends(database.get_db)):
+async def create_material(material: schemas.MaterialCreate, db: AsyncSession = Depends(database.get_db)):
     try:
-        logger.info(f"Creating new material: {material.dict()}")
+        logger.info("Creating new material: %s", material.dict())
         db_material = models.Material(**material.dict())
         db.add(db_material)
-        db.commit()
-        db.refresh(db_material)
-        logger.info(f"Material created successfully: {db_material.id}")
+        await db.commit()
+        await db.refresh(db_material)
+        materials_cache.invalidate()
+        logger.info("Material created successfully: %s", db_material.id)
         return db_material
     except Exception as e:
-        db.rollback()
-        logger.error(f"Error creating material: {str(e)}")
+        await db.rollback()
+        logger.error("Error creating material: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.patch("/materials/{material_id}", response_model=schemas.Material)
-def update_material(material_id: int, material: schemas.MaterialUpdate, db: Session = Depends(database.get_db)):
+async def update_material(material_id: int, material: schemas.MaterialUpdate, db: AsyncSession = Depends(database.get_db)):
     try:
-        db_material = db.query(models.Material).filter(models.Material.id == material_id).first()
+        db_material = await db.get(models.Material, material_id)
         if not db_material:
             raise HTTPException(status_code=404, detail="Material not found")
 
@@ -96,30 +503,610 @@ def update_material(material_id: int, material: schemas.MaterialUpdate, db: Sess
             setattr(db_material, field, value)
 
         try:
-            db.commit()
-            db.refresh(db_material)
-            logger.info(f"Material {material_id} updated successfully")
+            await db.commit()
+            await db.refresh(db_material)
+            materials_cache.invalidate()
+            logger.info("Material %s updated successfully", material_id)
             return db_material
         except Exception as e:
-            logger.error(f"Database error while updating material: {str(e)}")
-            db.rollback()
+            logger.error("Database error while updating material: %s", e)
+            await db.rollback()
             raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
     except Exception as e:
-        logger.error(f"Error updating material: {str(e)}")
+        logger.error("Error updating material: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.delete("/materials/{material_id}")
-def delete_material(material_id: int, db: Session = Depends(database.get_db)):
+async def delete_material(material_id: int, db: AsyncSession = Depends(database.get_db)):
     try:
-        db_material = db.query(models.Material).filter(models.Material.id == material_id).first()
+        db_material = await db.get(models.Material, material_id)
         if not db_material:
             raise HTTPException(status_code=404, detail="Material not found")
 
-        db.delete(db_material)
-        db.commit()
+        await db.delete(db_material)
+        await db.commit()
+        materials_cache.invalidate()
         return {"message": "Material deleted successfully"}
     except Exception as e:
-        db.rollback()
-        logger.error(f"Error deleting material: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
+        await db.rollback()
+        logger.error("Error deleting material: %s", e)
+        raise HTTPException(status_code=500, detail=str(e))
+
+# Import/export massivo dei materiali
+MATERIALS_IMPORT_BATCH = int(os.getenv("MATERIALS_IMPORT_BATCH", "1000"))
+MATERIAL_FIELDS = list(schemas.MaterialCreate.model_fields)
+MAX_IMPORT_ERRORS = 50
+
+async def iter_lines(request: Request):
+    """Righe del corpo della richiesta, lette a blocchi senza caricarlo tutto in memoria"""
+    pending = b""
+    received = 0
+    async for chunk in request.stream():
+        received += len(chunk)
+        if received > MAX_UPLOAD_SIZE:
+            raise HTTPException(status_code=413, detail="File di import troppo grande")
+        pending += chunk
+        *lines, pending = pending.split(b"\n")
+        for line in lines:
+            yield line.decode("utf-8-sig").rstrip("\r")
+    if pending:
+        yield pending.decode("utf-8-sig").rstrip("\r")
+
+async def iter_import_records(request: Request, fmt: str):
+    """Record grezzi (numero di riga, dizionario) da un corpo NDJSON o CSV, un record per riga"""
+    header = None
+    line_number = 0
+    async for line in iter_lines(request):
+        line_number += 1
+        if not line.strip():
+            continue
+        if fmt == "ndjson":
+            try:
+                yield line_number, json.loads(line)
+            except json.JSONDecodeError as e:
+                yield line_number, e
+        elif header is None:
+            header = next(csv.reader([line]))
+        else:
+            values = next(csv.reader([line]))
+            # I campi vuoti prendono il valore di default dello schema
+            yield line_number, {k: v for k, v in zip(header, values) if v != ""}
+
+async def insert_materials(db: AsyncSession, rows: list[dict]):
+    """Inserisce un blocco di materiali: COPY su PostgreSQL, executemany altrimenti"""
+    if db.bind.dialect.name == "postgresql" and db.bind.dialect.driver == "asyncpg":
+        connection = await db.connection()
+        raw = await connection.get_raw_connection()
+        import asyncpg
+        try:
+            await raw.driver_connection.copy_records_to_table(
+                models.Material.__tablename__,
+                columns=MATERIAL_FIELDS,
+                records=[tuple(row[field] for field in MATERIAL_FIELDS) for row in rows]
+            )
+        except asyncpg.IntegrityConstraintViolationError as e:
+            # COPY passa dal driver senza SQLAlchemy: l'errore va riportato come con executemany
+            raise IntegrityError("COPY materials", None, e) from e
+    else:
+        await db.execute(insert(models.Material), rows)
+
+def import_format(request: Request, fmt: Optional[str]) -> str:
+    if fmt:
+        return fmt
+    return "csv" if "csv" in request.headers.get("content-type", "") else "ndjson"
+
+@app.post("/materials/import", response_model=schemas.MaterialImportResult)
+async def import_materials(
+    request: Request,
+    format: Optional[Literal["ndjson", "csv"]] = None,
+    db: AsyncSession = Depends(database.get_db)
+):
+    """
+    Importa materiali da NDJSON o CSV (con intestazione), letti in streaming.
+
+    I record sono inseriti a blocchi di MATERIALS_IMPORT_BATCH in un'unica transazione:
+    se una riga non è valida o un nome è duplicato non viene importato nulla.
+    """
+    fmt = import_format(request, format)
+    errors = []
+    batch = []
+    imported = 0
+    try:
+        async for line_number, record in iter_import_records(request, fmt):
+            try:
+                if isinstance(record, Exception):
+                    raise ValueError(str(record))
+                material = schemas.MaterialCreate.model_validate(record)
+            except ValidationError as e:
+                if len(errors) < MAX_IMPORT_ERRORS:
+                    errors.append({"line": line_number, "error": e.errors(include_url=False, include_input=False)})
+                continue
+            except ValueError as e:
+                if len(errors) < MAX_IMPORT_ERRORS:
+                    errors.append({"line": line_number, "error": str(e)})
+                continue
+            if errors:
+                continue  # l'import verrà annullato: basta validare il resto
+            batch.append(material.model_dump())
+            if len(batch) >= MATERIALS_IMPORT_BATCH:
+                await insert_materials(db, batch)
+                imported += len(batch)
+                batch = []
+
+        if errors:
+            await db.rollback()
+            raise HTTPException(status_code=422, detail=errors)
+        if batch:
+            await insert_materials(db, batch)
+            imported += len(batch)
+        await db.commit()
+    except HTTPException:
+        await db.rollback()
+        raise
+    except IntegrityError as e:
+        await db.rollback()
+        logger.error("Integrity error while importing materials: %s", e)
+        raise HTTPException(status_code=409, detail="Import annullato: nomi di materiale duplicati")
+    except Exception as e:
+        await db.rollback()
+        logger.error("Error importing materials: %s", e)
+        raise HTTPException(status_code=500, detail=str(e))
+
+    materials_cache.invalidate()
+    logger.info("Imported %s materials (%s)", imported, fmt)
+    return {"imported": imported}
+
+@app.get("/materials/export")
+async def export_materials(format: Literal["ndjson", "csv"] = "ndjson"):
+    """Esporta tutti i materiali in NDJSON o CSV, in streaming dal database"""
+    columns = ["id", *MATERIAL_FIELDS]
+
+    async def rows():
+        # Sessione propria: quella della dipendenza può essere chiusa prima dello streaming
+        async with database.AsyncSessionLocal() as db:
+            result = await db.stream_scalars(
+                select(models.Material).order_by(models.Material.id).execution_options(yield_per=MATERIALS_IMPORT_BATCH)
+            )
+            if format == "csv":
+                yield ",".join(columns) + "\n"
+            async for partition in result.partitions():
+                buffer = io.StringIO()
+                if format == "csv":
+                    writer = csv.writer(buffer, lineterminator="\n")
+                    writer.writerows([getattr(m, c) for c in columns] for m in partition)
+                else:
+                    for m in partition:
+                        buffer.write(json.dumps({c: getattr(m, c) for c in columns}) + "\n")
+                yield buffer.getvalue()
+
+    media_type = "text/csv" if format == "csv" else "application/x-ndjson"
+    return StreamingResponse(
+        rows(),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="materials.{format}"'}
+    )
+
+@app.patch("/materials/", response_model=List[schemas.Material])
+async def update_materials(updates: List[schemas.MaterialBatchUpdate], db: AsyncSession = Depends(database.get_db)):
+    """Aggiorna più materiali in un'unica transazione: o tutti o nessuno"""
+    ids = [u.id for u in updates]
+    if len(set(ids)) != len(ids):
+        raise HTTPException(status_code=422, detail="Lo stesso materiale compare più volte")
+    if not ids:
+        return []
+    try:
+        found = set((await db.scalars(select(models.Material.id).where(models.Material.id.in_(ids)))).all())
+        missing = [i for i in ids if i not in found]
+        if missing:
+            raise HTTPException(status_code=404, detail=f"Materials not found: {missing}")
+
+        # UPDATE per chiave primaria in executemany, raggruppato per insieme di colonne
+        await db.execute(update(models.Material), [u.model_dump(exclude_unset=True) for u in updates])
+        await db.commit()
+    except HTTPException:
+        await db.rollback()
+        raise
+    except IntegrityError as e:
+        await db.rollback()
+        logger.error("Integrity error while updating materials: %s", e)
+        raise HTTPException(status_code=409, detail="Aggiornamento annullato: nomi di materiale duplicati")
+    except Exception as e:
+        await db.rollback()
+        logger.error("Error updating materials: %s", e)
+        raise HTTPException(status_code=500, detail=str(e))
+
+    materials_cache.invalidate()
+    logger.info("Updated %s materials in batch", len(ids))
+    materials = (await db.scalars(
+        select(models.Material).where(models.Material.id.in_(ids)).order_by(models.Material.id)
+    )).all()
+    return materials
+
+# Printer endpoints
+@app.get("/printers/", response_model=List[schemas.Printer])
+async def read_printers(db: AsyncSession = Depends(database.get_db)):
+    return (await db.scalars(select(models.Printer).order_by(models.Printer.id))).all()
+
+@app.post("/printers/", response_model=schemas.Printer)
+async def create_printer(printer: schemas.PrinterCreate, db: AsyncSession = Depends(database.get_db)):
+    try:
+        db_printer = models.Printer(**printer.model_dump())
+        db.add(db_printer)
+        await db.commit()
+        await db.refresh(db_printer)
+        logger.info("Printer created successfully: %s", db_printer.id)
+        return db_printer
+    except Exception as e:
+        await db.rollback()
+        logger.error("Error creating printer: %s", e)
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.delete("/printers/{printer_id}")
+async def delete_printer(printer_id: int, db: AsyncSession = Depends(database.get_db)):
+    db_printer = await db.get(models.Printer, printer_id)
+    if not db_printer:
+        raise HTTPException(status_code=404, detail="Printer not found")
+    await db.delete(db_printer)
+    await db.commit()
+    return {"message": "Printer deleted successfully"}
+
+# Energy cost endpoints
+@app.get("/energy-costs/", response_model=List[schemas.EnergyCost])
+async def read_energy_costs(db: AsyncSession = Depends(database.get_db)):
+    return (await db.scalars(select(models.EnergyCost).order_by(models.EnergyCost.id))).all()
+
+@app.post("/energy-costs/", response_model=schemas.EnergyCost)
+async def create_energy_cost(energy_cost: schemas.EnergyCostCreate, db: AsyncSession = Depends(database.get_db)):
+    try:
+        db_energy_cost = models.EnergyCost(**energy_cost.model_dump())
+        db.add(db_energy_cost)
+        await db.commit()
+        await db.refresh(db_energy_cost)
+        return db_energy_cost
+    except Exception as e:
+        await db.rollback()
+        logger.error("Error creating energy cost: %s", e)
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.delete("/energy-costs/{energy_cost_id}")
+async def delete_energy_cost(energy_cost_id: int, db: AsyncSession = Depends(database.get_db)):
+    db_energy_cost = await db.get(models.EnergyCost, energy_cost_id)
+    if not db_energy_cost:
+        raise HTTPException(status_code=404, detail="Energy cost not found")
+    await db.delete(db_energy_cost)
+    await db.commit()
+    return {"message": "Energy cost deleted successfully"}
+
+# Schedule endpoints
+@app.post("/schedule", response_model=schemas.Schedule)
+async def create_schedule(request: schemas.ScheduleRequest, db: AsyncSession = Depends(database.get_db)):
+    """
+    Pianifica i lavori preventivati sulle stampanti: ogni copia è un lavoro separato.
+    Il costo di ogni lavoro usa costo orario e consumo della stampante assegnata.
+    """
+    query = select(models.Printer).order_by(models.Printer.id)
+    if request.printer_ids is not None:
+        query = query.where(models.Printer.id.in_(request.printer_ids))
+    printers = (await db.scalars(query)).all()
+    if not printers:
+        raise HTTPException(status_code=422, detail="Nessuna stampante disponibile")
+    if request.printer_ids is not None and len(printers) != len(set(request.printer_ids)):
+        missing = sorted(set(request.printer_ids) - {p.id for p in printers})
+        raise HTTPException(status_code=404, detail=f"Printers not found: {missing}")
+
+    if request.energy_cost_id is not None:
+        energy_cost = await db.get(models.EnergyCost, request.energy_cost_id)
+        if not energy_cost:
+            raise HTTPException(status_code=404, detail="Energy cost not found")
+    else:
+        energy_cost = await db.scalar(select(models.EnergyCost).order_by(models.EnergyCost.id).limit(1))
+    cost_per_kwh = energy_cost.cost_per_kwh if energy_cost else 0.0
+
+    job_ids = [job.id for job in request.jobs for _ in range(job.copies)]
+    copy_numbers = [n for job in request.jobs for n in range(1, job.copies + 1)]
+    durations = [job.tempo_stampa for job in request.jobs for _ in range(job.copies)]
+
+    # Il calcolo è CPU-bound ma breve: lo teniamo fuori dall'event loop
+    result = await asyncio.to_thread(
+        schedule_jobs,
+        durations,
+        [p.hourly_cost for p in printers],
+        [p.power_consumption for p in printers],
+        cost_per_kwh,
+        request.cost_weight,
+        [request.ready_hours.get(p.id, 0.0) for p in printers]
+    )
+    logger.info("Scheduled %s jobs on %s printers: makespan %.2f h (bound %.2f h), %s moves",
+                len(durations), len(printers), result['makespan'], result['lower_bound'], result['moves'])
+
+    printer_index = result['printer'].tolist()
+    start, end, cost = result['start'].tolist(), result['end'].tolist(), result['cost'].tolist()
+    jobs_per_printer = [0] * len(printers)
+    cost_per_printer = [0.0] * len(printers)
+    for i, c in zip(printer_index, cost):
+        jobs_per_printer[i] += 1
+        cost_per_printer[i] += c
+
+    return {
+        'makespan': result['makespan'],
+        'lower_bound': result['lower_bound'],
+        'total_cost': result['total_cost'],
+        'energy_kwh': result['energy_kwh'],
+        'assignments': [
+            {'job_id': job_ids[i], 'copy_number': copy_numbers[i], 'printer_id': printers[p].id,
+             'start': start[i], 'end': end[i], 'cost': cost[i]}
+            for i, p in enumerate(printer_index)
+        ],
+        'printers': [
+            {'printer_id': p.id, 'name': p.name, 'busy_until': float(load),
+             'jobs': jobs_per_printer[i], 'cost': cost_per_printer[i]}
+            for i, (p, load) in enumerate(zip(printers, result['loads']))
+        ],
+    }
+
+# Quote endpoints
+@app.post("/quote", response_model=schemas.Quote)
+async def create_quote(
+    file: UploadFile = File(...),
+    material_id: int = Form(...),
+    layer_height: float = Form(..., gt=0),
+    copies: int = Form(1, ge=1),
+    db: AsyncSession = Depends(database.get_db)
+):
+    """Calcola il preventivo completo per un file STL caricato"""
+    try:
+        properties = await get_quote_material(db, material_id, layer_height)
+
+        if file.size is not None and file.size > STL_STREAM_THRESHOLD:
+            # File grandi: niente buffer completo, analisi dal file su disco
+            logger.info("Quoting %s (%s bytes, streaming) with material %s", file.filename, file.size, material_id)
+            analysis = await stream_stl_analysis(upload_chunks(file), file.size)
+        else:
+            content = await read_upload(file)
+            logger.info("Quoting %s (%s bytes) with material %s", file.filename, len(content), material_id)
+
+            try:
+                analysis = await analyze_upload(content)
+            except ValueError as e:
+                raise HTTPException(status_code=422, detail=str(e))
+
+        return {
+            **quote_row(file.filename, analysis, properties, layer_height, copies),
+            'material_id': material_id,
+            'layer_height': layer_height
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error("Error creating quote: %s", e)
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.post("/quote/stream", response_model=schemas.Quote)
+async def create_stream_quote(
+    request: Request,
+    material_id: int,
+    layer_height: float = Query(..., gt=0),
+    copies: int = Query(1, ge=1),
+    filename: Optional[str] = None,
+    db: AsyncSession = Depends(database.get_db)
+):
+    """
+    Preventivo di un file STL inviato come corpo grezzo della richiesta.
+
+    Il file è validato man mano che arrivano i blocchi e analizzato dal disco, con
+    memoria costante anche per mesh da diversi GB.
+    """
+    try:
+        properties = await get_quote_material(db, material_id, layer_height)
+        content_length = request.headers.get("content-length")
+        analysis = await stream_stl_analysis(request.stream(), int(content_length) if content_length else None)
+        logger.info("Quoted %s (%s triangles) with material %s",
+                    filename or 'stream', analysis.get('triangle_count'), material_id)
+        return {
+            **quote_row(filename, analysis, properties, layer_height, copies),
+            'material_id': material_id,
+            'layer_height': layer_height
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error("Error creating streamed quote: %s", e)
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.post("/quote/batch")
+async def create_batch_quote(
+    files: List[UploadFile] = File(...),
+    material_id: int = Form(...),
+    layer_height: float = Form(..., gt=0),
+    copies: int = Form(1, ge=1),
+    db: AsyncSession = Depends(database.get_db)
+):
+    """
+    Preventivo di un ordine con più file STL o archivi ZIP.
+
+    La risposta è NDJSON: una riga {"type": "item", ...} per file, nell'ordine in cui
+    le analisi terminano, seguita da una riga {"type": "total", ...} con i totali.
+    """
+    properties = await get_quote_material(db, material_id, layer_height)
+
+    stl_files = []
+    for file in files:
+        content = await read_upload(file)
+        try:
+            stl_files.extend(extract_stl_files(file.filename, content, MAX_UPLOAD_SIZE))
+        except (ValueError, zipfile.BadZipFile) as e:
+            raise HTTPException(status_code=422, detail=str(e))
+    logger.info("Batch quote of %s files with material %s", len(stl_files), material_id)
+
+    async def quote_file(name: str, content: bytes) -> dict:
+        try:
+            analysis = await analyze_upload(content)
+        except Exception as e:
+            return {'file': name, 'error': str(e)}
+        return quote_row(name, analysis, properties, layer_height, copies)
+
+    async def stream_rows():
+        rows = []
+        for task in asyncio.as_completed([quote_file(name, content) for name, content in stl_files]):
+            row = await task
+            rows.append(row)
+            yield json.dumps({'type': 'item', **row}) + "\n"
+        yield json.dumps({'type': 'total', **order_totals(rows)}) + "\n"
+
+    return StreamingResponse(stream_rows(), media_type="application/x-ndjson")
+
+# Job endpoints
+# Intervallo dei commenti inviati sullo stream SSE durante le fasi lunghe, per i proxy
+SSE_KEEPALIVE = float(os.getenv("SSE_KEEPALIVE", "15"))
+
+def get_job(job_id: str):
+    job = job_queue.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+@app.post("/jobs", response_model=schemas.Job, status_code=202)
+async def create_job(
+    file: UploadFile = File(...),
+    material_id: int = Form(...),
+    layer_height: float = Form(..., gt=0),
+    copies: int = Form(1, ge=1),
+    db: AsyncSession = Depends(database.get_db)
+):
+    """
+    Accoda il preventivo di un file mesh e restituisce subito l'id del job.
+
+    Il file è salvato su disco e validato durante l'upload; l'analisi è eseguita nel
+    pool di processi. Lo stato è su GET /jobs/{id}, le fasi su GET /jobs/{id}/events.
+    """
+    properties = await get_quote_material(db, material_id, layer_height)
+    spool = await spool_upload(upload_chunks(file), file.size)
+
+    def price(analysis: dict) -> dict:
+        analysis_cache.put(spool.key, analysis)
+        quote = schemas.Quote(**quote_row(file.filename, analysis, properties, layer_height, copies),
+                              material_id=material_id, layer_height=layer_height)
+        return quote.model_dump()
+
+    try:
+        cached = await asyncio.to_thread(analysis_cache.get, spool.key)
+        job = job_queue.submit(analyze_stl_file, (spool.path,), price, filename=file.filename,
+                               analysis=cached, cleanup=spool.discard)
+    except BaseException:
+        # Senza job nessuno eliminerebbe il file salvato
+        spool.discard()
+        raise
+    logger.info("Job %s: quoting %s with material %s", job.id, file.filename, material_id)
+    return job.summary()
+
+@app.get("/jobs/{job_id}", response_model=schemas.Job)
+def read_job(job_id: str):
+    return get_job(job_id).summary()
+
+@app.delete("/jobs/{job_id}", response_model=schemas.Job)
+def cancel_job(job_id: str):
+    """Annulla un job: subito se in coda, al termine della fase in corso se in esecuzione"""
+    job = get_job(job_id)
+    if not job_queue.cancel(job):
+        raise HTTPException(status_code=409, detail=f"Job already {job.status}")
+    return job.summary()
+
+@app.get("/jobs/{job_id}/events")
+async def stream_job_events(job_id: str, request: Request):
+    """
+    Eventi del job come Server-Sent Events: queued, running, progress (una per fase:
+    parse, validate, slice, price), cancelling e infine done, failed o cancelled.
+
+    Ogni evento ha come id la sua posizione: un client che si riconnette con
+    Last-Event-ID riceve solo quelli successivi. Lo stream termina con il job.
+    """
+    job = get_job(job_id)
+    last_event_id = request.headers.get("last-event-id", "")
+    start = int(last_event_id) + 1 if last_event_id.isdigit() else 0
+
+    async def events():
+        index = start
+        while True:
+            batch = await job.wait_events(index, SSE_KEEPALIVE)
+            for event in batch:
+                yield f"id: {index}\nevent: {event['event']}\ndata: {json.dumps(event)}\n\n"
+                index += 1
+            if job.finished and index >= len(job.events):
+                return
+            if not batch:
+                yield ": keepalive\n\n"
+
+    return StreamingResponse(events(), media_type="text/event-stream",
+                             headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+
+# Preview endpoints
+# Bundle three.js del viewer: Streamlit serve i .js di static/ come text/plain con
+# X-Content-Type-Options: nosniff e il browser si rifiuterebbe di eseguirlo
+VIEWER_SCRIPT = "three-r140-viewer.min.js"
+VIEWER_SCRIPT_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "static", VIEWER_SCRIPT)
+
+@app.get(f"/viewer/{VIEWER_SCRIPT}", include_in_schema=False)
+def read_viewer_script():
+    return FileResponse(VIEWER_SCRIPT_PATH, media_type="application/javascript",
+                        headers={"Cache-Control": "public, max-age=86400"})
+
+@app.post("/previews")
+async def create_preview(file: UploadFile = File(...)):
+    """Genera l'anteprima GLB di un file STL e ne restituisce l'URL indirizzato per contenuto"""
+    try:
+        content = await read_upload(file)
+        key = await asyncio.to_thread(content_hash, content)
+        cache_key = preview_cache_key(key)
+        if preview_cache.get(cache_key) is None:
+            try:
+                glb_content = await run_in_pool(build_preview_glb, content)
+            except ValueError as e:
+                raise HTTPException(status_code=422, detail=str(e))
+            preview_cache.put(cache_key, glb_content)
+            logger.info("Preview %s created (%s bytes)", cache_key, len(glb_content))
+        return {"key": cache_key, "url": f"/previews/{cache_key}.glb"}
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error("Error creating preview: %s", e)
+        raise HTTPException(status_code=500, detail=str(e))
+
+def encoded_preview(cache_key: str, encoding: str) -> bytes | None:
+    """Anteprima compressa con la codifica richiesta, compressa una sola volta"""
+    encoded_key = f"{cache_key}-{encoding}"
+    encoded = preview_cache.get(encoded_key)
+    if encoded is None:
+        glb_content = preview_cache.get(cache_key)
+        if glb_content is None:
+            return None
+        encoded = brotli.compress(glb_content) if encoding == "br" else gzip.compress(glb_content)
+        preview_cache.put(encoded_key, encoded)
+    return encoded
+
+@app.api_route("/previews/{cache_key}.glb", methods=["GET", "HEAD"])
+def read_preview(cache_key: str, request: Request):
+    """
+    Restituisce l'anteprima GLB con ETag forte e cache immutabile
+
+    Con HEAD il frontend verifica che un URL ricordato nella sessione sia ancora valido
+    (404 dopo l'espulsione dalla directory delle anteprime) e in caso contrario la rigenera.
+    Chiavi diverse dai digest di preview_cache_key sono rifiutate prima di toccare la cache.
+    """
+    if not PREVIEW_KEY.fullmatch(cache_key):
+        raise HTTPException(status_code=404, detail="Preview not found")
+    etag = f'"{cache_key}"'
+    headers = {"ETag": etag, "Cache-Control": PREVIEW_CACHE_CONTROL, "Vary": "Accept-Encoding"}
+    if etag in request.headers.get("if-none-match", ""):
+        return Response(status_code=304, headers=headers)
+
+    accepted = request.headers.get("accept-encoding", "")
+    encoding = "br" if brotli is not None and "br" in accepted else "gzip" if "gzip" in accepted else None
+
+    content = encoded_preview(cache_key, encoding) if encoding else preview_cache.get(cache_key)
+    if content is None:
+        raise HTTPException(status_code=404, detail="Preview not found")
+    if encoding:
+        headers["Content-Encoding"] = encoding
+    return Response(content=content, media_type="model/gltf-binary", headers=headers)
@@ -1,71 +1,309 @@
 import os
+import asyncio
 import logging
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, event, select, func, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+import sqlite3
 import time
 
-# Configura logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+from log_config import SampledLogger, setup_logging
+from .metrics import DB_POOL_CHECKOUTS, DB_POOL_HOLD, DB_POOL_TIMEOUTS, DB_POOL_WAIT, Gauge
+
 logger = logging.getLogger(__name__)
 
-# Get database URL from environment
+# Get database URL from environment; senza DATABASE_URL si usa un database SQLite locale
 SQLALCHEMY_DATABASE_URL = os.getenv("DATABASE_URL")
 if not SQLALCHEMY_DATABASE_URL:
-    logger.error("DATABASE_URL environment variable is not set")
-    raise ValueError("DATABASE_URL environment variable is not set")
+    SQLALCHEMY_DATABASE_URL = "sqlite:///./edcalculator.db"
+    logger.warning("DATABASE_URL environment variable is not set, using embedded database %s", SQLALCHEMY_DATABASE_URL)
 
 # Fix per la compatibilità con SQLAlchemy
 if SQLALCHEMY_DATABASE_URL.startswith("postgres://"):
     logger.info("Converting postgres:// to postgresql:// in database URL")
     SQLALCHEMY_DATABASE_URL = SQLALCHEMY_DATABASE_URL.replace("postgres://", "postgresql://", 1)
 
-logger.info("Configuring database connection...")
+# PRAGMA applicati a ogni connessione SQLite
+SQLITE_PRAGMAS = {
+    'journal_mode': 'WAL',  # lettori e scrittore non si bloccano a vicenda
+    'synchronous': 'NORMAL',  # sicuro con WAL, evita un fsync per commit
+    'foreign_keys': 'ON',
+    'busy_timeout': '30000',  # ms
+    'cache_size': '-65536',  # 64 MB
+    'temp_store': 'MEMORY',
+    'mmap_size': '268435456',  # 256 MB
+}
+
+def is_sqlite_memory(url) -> bool:
+    """True per i database SQLite in memoria (sqlite://, :memory:, mode=memory)"""
+    return url.database in (None, '', ':memory:') or url.query.get('mode') == 'memory'
+
+# Nome del database SQLite in memoria condiviso dagli engine del processo
+SQLITE_MEMORY_NAME = "edcalculator-memory"
+
+def shared_memory_url(url):
+    """
+    URL di un database in memoria con nome e cache condivisa
+
+    Un :memory: anonimo è privato della connessione che lo apre: l'engine sincrono e
+    quello asincrono vedrebbero due database diversi. Con un nome e cache=shared tutte
+    le connessioni del processo vedono lo stesso database.
+    """
+    if url.database and url.database.startswith("file:") and url.query.get('cache') == 'shared':
+        return url
+    return url.set(database=f"file:{SQLITE_MEMORY_NAME}").update_query_dict(
+        {'mode': 'memory', 'cache': 'shared', 'uri': 'true'}
+    )
+
+def async_database_url(url: str):
+    """Converte l'URL sincrono nel corrispondente driver asyncio (asyncpg/aiosqlite)"""
+    url = make_url(url)
+    if url.get_backend_name() == "postgresql":
+        return url.set(drivername="postgresql+asyncpg")
+    if url.get_backend_name() == "sqlite":
+        return url.set(drivername="sqlite+aiosqlite")
+    return url
+
+class _TimedConnectMixin:
+    """Misura l'attesa per ottenere una connessione, compresa l'eventuale apertura"""
 
-# Create engine with enhanced logging and longer timeout
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL,
-    echo=True,  # Enable SQL logging
-    pool_pre_ping=True,  # Enable connection health checks
-    pool_size=5,
-    max_overflow=10,
-    pool_timeout=30,
-    pool_recycle=1800,
-    connect_args={
-        'connect_timeout': 30,
-        'options': '-c statement_timeout=30000'
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            return super().connect()
+        except PoolTimeoutError:
+            DB_POOL_TIMEOUTS.inc()
+            raise
+        finally:
+            DB_POOL_WAIT.observe(time.perf_counter() - start)
+
+class TimedQueuePool(_TimedConnectMixin, QueuePool):
+    pass
+
+class TimedAsyncQueuePool(_TimedConnectMixin, AsyncAdaptedQueuePool):
+    pass
+
+def engine_options(url, async_driver: bool = False) -> tuple:
+    """
+    URL e parametri di create_engine adatti al dialetto
+
+    PostgreSQL usa un pool di connessioni con timeout; SQLite su file usa il pool di
+    default con check_same_thread disattivato. SQLite in memoria usa un database con
+    nome a cache condivisa e un pool di una sola connessione: ogni sessione ha la
+    connessione in esclusiva per tutta la transazione e le altre attendono il proprio
+    turno, invece di mescolare commit e rollback su una connessione condivisa
+    (StaticPool). È quindi adatto ai test e alle istanze con un solo utente, non ai
+    test di carico concorrenti, per i quali serve SQLite su file o PostgreSQL.
+    """
+    pool_class = TimedAsyncQueuePool if async_driver else TimedQueuePool
+    if url.get_backend_name() == "sqlite":
+        options = {'connect_args': {'check_same_thread': False, 'timeout': 30}, 'poolclass': pool_class}
+        if is_sqlite_memory(url):
+            url = shared_memory_url(url)
+            options.update(pool_size=1, max_overflow=0, pool_timeout=30)
+        return url, options
+
+    options = {
+        'poolclass': pool_class,
+        'pool_pre_ping': True,  # Enable connection health checks
+        'pool_size': 5,
+        'max_overflow': 10,
+        'pool_timeout': 30,
+        'pool_recycle': 1800,
     }
-)
+    if url.get_backend_name() != "postgresql":
+        return url, options
+
+    if not async_driver:
+        options['connect_args'] = {
+            'connect_timeout': 30,
+            'options': '-c statement_timeout=30000'
+        }
+        return url, options
+
+    options['connect_args'] = {
+        'timeout': 30,
+        'server_settings': {'statement_timeout': '30000'}
+    }
+    # asyncpg non riconosce sslmode nell'URL: lo passiamo come parametro ssl
+    sslmode = url.query.get("sslmode")
+    if sslmode:
+        url = url.difference_update_query(["sslmode"])
+        if sslmode != "disable":
+            options['connect_args']['ssl'] = sslmode
+    return url, options
+
+def apply_sqlite_pragmas(engine, url):
+    """Registra i PRAGMA di SQLITE_PRAGMAS su ogni nuova connessione"""
+    pragmas = dict(SQLITE_PRAGMAS)
+    if is_sqlite_memory(url):
+        pragmas.pop('journal_mode')  # WAL non è disponibile in memoria
+        pragmas.pop('mmap_size')
+
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+        cursor.close()
+
+logger.info("Configuring database connection...")
+
+DATABASE_URL, _engine_options = engine_options(make_url(SQLALCHEMY_DATABASE_URL))
+
+# Create engine with longer timeout; le query si vedono con LOG_LEVELS=backend.database=DEBUG (campionate)
+engine = create_engine(DATABASE_URL, **_engine_options)
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-def get_db():
+ASYNC_DATABASE_URL, _async_engine_options = engine_options(
+    async_database_url(SQLALCHEMY_DATABASE_URL), async_driver=True
+)
+
+# Engine asincrono usato dagli endpoint: non blocca l'event loop durante le query
+async_engine = create_async_engine(ASYNC_DATABASE_URL, **_async_engine_options)
+
+if engine.dialect.name == "sqlite":
+    apply_sqlite_pragmas(engine, DATABASE_URL)
+    apply_sqlite_pragmas(async_engine.sync_engine, ASYNC_DATABASE_URL)
+
+# Il database in memoria sparisce quando si chiude la sua ultima connessione: questa
+# resta aperta per tutta la vita del processo, anche se i pool chiudono le proprie
+_memory_keeper = None
+if engine.dialect.name == "sqlite" and is_sqlite_memory(DATABASE_URL):
+    _memory_keeper = sqlite3.connect(
+        f"{DATABASE_URL.database}?mode=memory&cache=shared", uri=True, check_same_thread=False
+    )
+
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+def log_sampled_queries(engine):
+    """Registra a DEBUG una query ogni round(1 / LOG_SAMPLE_RATE), con la sua durata"""
+    sampled = SampledLogger(logger)
+    if not sampled.enabled():
+        return  # nessun listener: zero costo per query con DEBUG disattivato
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault('query_start', []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def after_execute(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info['query_start'].pop()
+        sampled.debug("SQL (%.1f ms): %s", elapsed * 1000, statement)
+
+def instrument_pool(engine):
+    """Conta i checkout e misura per quanto tempo ogni connessione resta fuori dal pool"""
+
+    @event.listens_for(engine, "checkout")
+    def on_checkout(dbapi_connection, connection_record, connection_proxy):
+        DB_POOL_CHECKOUTS.inc()
+        connection_record.info['checked_out_at'] = time.perf_counter()
+
+    @event.listens_for(engine, "checkin")
+    def on_checkin(dbapi_connection, connection_record):
+        checked_out_at = connection_record.info.pop('checked_out_at', None)
+        if checked_out_at is not None:
+            DB_POOL_HOLD.observe(time.perf_counter() - checked_out_at)
+
+def pool_connections() -> dict:
+    """Connessioni del pool usato dall'API, per stato"""
+    pool = async_engine.pool
+    if not isinstance(pool, QueuePool):
+        return {}
+    return {
+        ('size',): pool.size(),
+        ('checked_out',): pool.checkedout(),
+        ('idle',): pool.checkedin(),
+        ('overflow',): max(pool.overflow(), 0),
+    }
+
+instrument_pool(async_engine.sync_engine)
+
+setup_logging()  # i livelli per modulo servono già qui per decidere se campionare le query
+log_sampled_queries(engine)
+log_sampled_queries(async_engine.sync_engine)
+
+DB_POOL_CONNECTIONS = Gauge('db_pool_connections', 'Connessioni del pool per stato (size è pool_size)',
+                            ('state',), collect=pool_connections)
+
+async def get_db():
     """Database dependency"""
-    db = SessionLocal()
-    try:
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
+
+# Materiali inseriti al primo avvio su un database vuoto
+DEFAULT_MATERIALS = [
+    dict(
+        name="PLA",
+        density=1.24,
+        cost_per_kg=20.0,
+        min_layer_height=0.1,
+        max_layer_height=0.3,
+        default_temperature=200.0,
+        default_bed_temperature=60.0,
+        retraction_enabled=True,
+        retraction_distance=6.0,
+        retraction_speed=25.0,
+        print_speed=60.0,
+        first_layer_speed=30.0,
+        fan_speed=100,
+        flow_rate=100,
+        hourly_cost=30.0
+    ),
+    dict(
+        name="PETG",
+        density=1.27,
+        cost_per_kg=25.0,
+        min_layer_height=0.1,
+        max_layer_height=0.3,
+        default_temperature=240.0,
+        default_bed_temperature=80.0,
+        retraction_enabled=True,
+        retraction_distance=7.0,
+        retraction_speed=30.0,
+        print_speed=50.0,
+        first_layer_speed=25.0,
+        fan_speed=50,
+        flow_rate=100,
+        hourly_cost=30.0
+    )
+]
+
+# Query per la versione del server, per dialetto
+VERSION_QUERIES = {
+    'postgresql': "SELECT version()",
+    'sqlite': "SELECT sqlite_version()",
+}
+
+def create_missing_indexes(conn):
+    """create_all non aggiunge indici a tabelle esistenti: li creiamo se mancano"""
+    from backend.base import Base
+
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(conn, checkfirst=True)
 
 def wait_for_db(max_retries=10, retry_delay=5):
     """Wait for database to be available"""
-    logger.info(f"Waiting for database to be available (max retries: {max_retries}, delay: {retry_delay}s)...")
+    logger.info("Waiting for database to be available (max retries: %s, delay: %ss)...", max_retries, retry_delay)
 
     for attempt in range(max_retries):
         try:
             # Try to connect to the database
             with engine.connect() as conn:
                 # Test query
-                result = conn.execute(text("SELECT version()"))
+                result = conn.execute(text(VERSION_QUERIES.get(engine.dialect.name, "SELECT 1")))
                 version = result.scalar()
-                logger.info(f"Successfully connected to database. PostgreSQL version: {version}")
+                logger.info("Successfully connected to database. %s version: %s", engine.dialect.name, version)
                 return True
         except Exception as e:
             if attempt < max_retries - 1:
-                logger.warning(f"Database connection attempt {attempt + 1} failed: {str(e)}")
-                logger.info(f"Retrying in {retry_delay} seconds...")
+                logger.warning("Database connection attempt %s failed: %s", attempt + 1, e)
+                logger.info("Retrying in %s seconds...", retry_delay)
                 time.sleep(retry_delay)
             else:
                 logger.error("Max retries reached, could not connect to database")
@@ -83,6 +321,8 @@ def init_db():
 
         logger.info("Creating database tables...")
         Base.metadata.create_all(bind=engine)
+        with engine.begin() as conn:
+            create_missing_indexes(conn)
         logger.info("Database tables created successfully")
 
         # Add default materials if needed
@@ -91,42 +331,7 @@ def init_db():
             logger.info("Checking for existing materials...")
             if db.query(Material).count() == 0:
                 logger.info("No materials found. Adding default materials...")
-                default_materials = [
-                    Material(
-                        name="PLA",
-                        density=1.24,
-                        cost_per_kg=20.0,
-                        min_layer_height=0.1,
-                        max_layer_height=0.3,
-                        default_temperature=200.0,
-                        default_bed_temperature=60.0,
-                        retraction_enabled=True,
-                        retraction_distance=6.0,
-                        retraction_speed=25.0,
-                        print_speed=60.0,
-                        first_layer_speed=30.0,
-                        fan_speed=100,
-                        flow_rate=100,
-                        hourly_cost=30.0
-                    ),
-                    Material(
-                        name="PETG",
-                        density=1.27,
-                        cost_per_kg=25.0,
-                        min_layer_height=0.1,
-                        max_layer_height=0.3,
-                        default_temperature=240.0,
-                        default_bed_temperature=80.0,
-                        retraction_enabled=True,
-                        retraction_distance=7.0,
-                        retraction_speed=30.0,
-                        print_speed=50.0,
-                        first_layer_speed=25.0,
-                        fan_speed=50,
-                        flow_rate=100,
-                        hourly_cost=30.0
-                    )
-                ]
+                default_materials = [Material(**data) for data in DEFAULT_MATERIALS]
                 for material in default_materials:
                     db.add(material)
                 db.commit()
@@ -134,12 +339,65 @@ def init_db():
             else:
                 logger.info("Materials already exist in database")
         except Exception as e:
-            logger.error(f"Error adding default materials: {str(e)}")
+            logger.error("Error adding default materials: %s", e)
             db.rollback()
             raise
         finally:
             db.close()
 
     except Exception as e:
-        logger.error(f"Error initializing database: {str(e)}")
-        raise
\ No newline at end of file
+        logger.error("Error initializing database: %s", e)
+        raise
+
+async def wait_for_db_async(max_retries=10, retry_delay=5):
+    """Come wait_for_db, senza bloccare l'event loop tra un tentativo e l'altro"""
+    logger.info("Waiting for database to be available (max retries: %s, delay: %ss)...", max_retries, retry_delay)
+
+    for attempt in range(max_retries):
+        try:
+            async with async_engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+                logger.info("Successfully connected to database")
+                return True
+        except Exception as e:
+            if attempt < max_retries - 1:
+                logger.warning("Database connection attempt %s failed: %s", attempt + 1, e)
+                logger.info("Retrying in %s seconds...", retry_delay)
+                await asyncio.sleep(retry_delay)
+            else:
+                logger.error("Max retries reached, could not connect to database")
+                raise
+
+async def init_db_async():
+    """Versione asincrona di init_db, usata all'avvio dell'API"""
+    try:
+        logger.info("Starting database initialization...")
+        await wait_for_db_async()
+
+        from backend.base import Base
+        from backend.models import Material
+
+        logger.info("Creating database tables...")
+        async with async_engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+            await conn.run_sync(create_missing_indexes)
+        logger.info("Database tables created successfully")
+
+        async with AsyncSessionLocal() as db:
+            try:
+                logger.info("Checking for existing materials...")
+                if await db.scalar(select(func.count()).select_from(Material)) == 0:
+                    logger.info("No materials found. Adding default materials...")
+                    db.add_all([Material(**data) for data in DEFAULT_MATERIALS])
+                    await db.commit()
+                    logger.info("Default materials added successfully")
+                else:
+                    logger.info("Materials already exist in database")
+            except Exception as e:
+                logger.error("Error adding default materials: %s", e)
+                await db.rollback()
+                raise
+
+    except Exception as e:
+        logger.error("Error initializing database: %s", e)
+        raise
@@ -0,0 +1,233 @@
+"""
+Job in background per le analisi pesanti
+
+Un job analizza un file nel pool di processi di stl_processor (al massimo JOB_WORKERS
+alla volta, gli altri restano in coda) e poi calcola il preventivo. Ogni passo è
+registrato come evento: /jobs/{id}/events li invia come Server-Sent Events, dall'inizio
+o dall'ultimo ricevuto. La coda è in memoria nel processo: con più worker uvicorn un
+job è visibile solo dal worker che lo ha creato.
+"""
+import asyncio
+import logging
+import multiprocessing
+import os
+import queue
+import threading
+import time
+import uuid
+
+from stl_processor import JobCancelled, get_process_pool, report_stage_times, run_with_stage_events
+from .metrics import Gauge
+
+logger = logging.getLogger(__name__)
+
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "2"))  # analisi in esecuzione contemporaneamente
+JOB_RETENTION = float(os.getenv("JOB_RETENTION", "3600"))  # secondi per cui un job concluso resta consultabile
+
+# Fasi riportate ai client e fase di stl_processor che conclude ciascuna
+PROGRESS_STAGES = ('parse', 'validate', 'slice', 'price')
+STAGE_NAMES = {'load_mesh': 'parse', 'repair_mesh': 'validate', 'slice_profile': 'slice'}
+EVENT_POLL_INTERVAL = 0.5  # secondi, attesa massima sulla coda degli eventi del pool
+FINISHED_STATUSES = ('done', 'failed', 'cancelled')
+
+# Il Manager tiene le code degli eventi e i flag di annullamento condivisi con il pool
+_manager = None
+_manager_lock = threading.Lock()
+
+def get_manager():
+    """Restituisce il Manager condiviso, avviandone il processo al primo job"""
+    global _manager
+    with _manager_lock:
+        if _manager is None:
+            _manager = multiprocessing.Manager()
+        return _manager
+
+def shutdown_manager():
+    global _manager
+    with _manager_lock:
+        if _manager is not None:
+            _manager.shutdown()
+            _manager = None
+
+class Job:
+    """Stato ed eventi di un job; modificato solo dall'event loop"""
+
+    def __init__(self, filename: str | None = None):
+        self.id = uuid.uuid4().hex
+        self.filename = filename
+        self.status = 'queued'
+        self.stage = None
+        self.progress = 0.0
+        self.result = None
+        self.error = None
+        self.events = []
+        self.finished_at = None
+        self.cancel_requested = False
+        self.task = None
+        self._cancel = None  # Event del Manager letto dal processo del pool
+        self._updated = asyncio.Event()
+
+    @property
+    def finished(self) -> bool:
+        return self.status in FINISHED_STATUSES
+
+    def publish(self, event: str, **data):
+        self.events.append({
+            'event': event, 'status': self.status, 'stage': self.stage, 'progress': self.progress, **data
+        })
+        # Sveglia chi attende e prepara un nuovo Event per gli eventi successivi
+        self._updated.set()
+        self._updated = asyncio.Event()
+
+    def advance(self, stage: str, seconds: float):
+        self.stage = stage
+        self.progress = (PROGRESS_STAGES.index(stage) + 1) / len(PROGRESS_STAGES)
+        self.publish('progress', seconds=round(seconds, 3))
+
+    def finish(self, status: str, **data):
+        self.status = status
+        self.error = data.get('error', self.error)
+        self.finished_at = time.monotonic()
+        self.publish(status, **data)
+
+    async def wait_events(self, start: int, timeout: float) -> list:
+        """Eventi da start in poi; se non ce ne sono attende fino a timeout secondi"""
+        if len(self.events) <= start and not self.finished:
+            try:
+                await asyncio.wait_for(self._updated.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+        return self.events[start:]
+
+    def summary(self) -> dict:
+        return {
+            'id': self.id,
+            'status': self.status,
+            'stage': self.stage,
+            'progress': self.progress,
+            'file': self.filename,
+            'result': self.result,
+            'error': self.error,
+        }
+
+class JobQueue:
+    """Coda dei job del processo, eseguiti al massimo workers alla volta"""
+
+    def __init__(self, workers: int = JOB_WORKERS, retention: float = JOB_RETENTION):
+        self.workers = workers
+        self.retention = retention
+        self.jobs = {}
+        self._slots = None
+
+    def get(self, job_id: str) -> Job | None:
+        return self.jobs.get(job_id)
+
+    def submit(self, func, args: tuple, price, filename: str | None = None, analysis: dict | None = None,
+               cleanup=None) -> Job:
+        """
+        Accoda l'analisi func(*args) nel pool e il calcolo price(analisi) -> risultato
+
+        Args:
+            func: Funzione di analisi di stl_processor, eseguita in un processo del pool
+            args: Argomenti di func (picklable)
+            price: Funzione chiamata con l'analisi in un thread del processo del backend
+            filename: Nome del file, riportato nello stato del job
+            analysis: Analisi già disponibile (cache): func non viene eseguita
+            cleanup: Funzione chiamata alla fine del job, qualunque sia l'esito
+
+        Returns:
+            Job: il job in coda
+        """
+        self._expire()
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.workers)
+        job = Job(filename)
+        self.jobs[job.id] = job
+        job.publish('queued')
+        job.task = asyncio.create_task(self._run(job, func, args, price, analysis, cleanup))
+        return job
+
+    def cancel(self, job: Job) -> bool:
+        """Richiede l'annullamento: subito se in coda, al termine della fase in corso se in esecuzione"""
+        if job.finished:
+            return False
+        job.cancel_requested = True
+        if job.status == 'queued':
+            job.finish('cancelled', error="Annullato in coda")
+        else:
+            if job._cancel is not None:
+                job._cancel.set()
+            job.publish('cancelling')
+        return True
+
+    async def _run(self, job: Job, func, args: tuple, price, analysis: dict | None, cleanup):
+        try:
+            async with self._slots:
+                if job.finished:  # annullato mentre era in coda
+                    return
+                job.status = 'running'
+                job.publish('running')
+                if analysis is None:
+                    analysis = await self._analyze(job, func, args)
+                if job.cancel_requested:
+                    raise JobCancelled("Annullato prima del calcolo dei costi")
+                # Preventivo, impaginazione sul piatto e scrittura in cache non bloccano l'event loop
+                start = time.perf_counter()
+                result = await asyncio.get_running_loop().run_in_executor(None, price, analysis)
+                job.advance('price', time.perf_counter() - start)
+            job.result = result
+            job.finish('done', result=result)
+        except JobCancelled as e:
+            job.finish('cancelled', error=str(e))
+        except Exception as e:
+            logger.error("Job %s failed: %s", job.id, e)
+            job.finish('failed', error=str(e))
+        finally:
+            if cleanup is not None:
+                cleanup()
+
+    def _channels(self) -> tuple:
+        manager = get_manager()
+        return manager.Queue(), manager.Event()
+
+    async def _analyze(self, job: Job, func, args: tuple) -> dict:
+        """Esegue func nel pool inoltrando al job le fasi concluse"""
+        events, job._cancel = await asyncio.to_thread(self._channels)
+        if job.cancel_requested:
+            job._cancel.set()
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(get_process_pool(), run_with_stage_events, func, events, job._cancel, *args)
+
+        # Il processo invia ogni fase prima di terminare: a future conclusa e coda vuota
+        # non arriveranno altri eventi
+        while True:
+            try:
+                stage, seconds = await asyncio.to_thread(events.get, timeout=EVENT_POLL_INTERVAL)
+            except queue.Empty:
+                if future.done():
+                    break
+                continue
+            if stage in STAGE_NAMES:
+                job.advance(STAGE_NAMES[stage], seconds)
+
+        result, stage_times = await future
+        report_stage_times(stage_times)
+        return result
+
+    def _expire(self):
+        """Dimentica i job conclusi da più di retention secondi"""
+        now = time.monotonic()
+        for job_id in [job_id for job_id, job in self.jobs.items()
+                       if job.finished and now - job.finished_at > self.retention]:
+            del self.jobs[job_id]
+
+    def counts(self) -> dict:
+        """Job per stato, per la metrica jobs"""
+        counts = {}
+        for job in list(self.jobs.values()):
+            counts[(job.status,)] = counts.get((job.status,), 0) + 1
+        return counts
+
+job_queue = JobQueue()
+
+JOBS = Gauge('jobs', 'Job in background per stato', ('status',), collect=job_queue.counts)
@@ -0,0 +1,200 @@
+"""
+Metriche del backend nel formato testuale di Prometheus
+
+Contatori, gauge e istogrammi con etichette, tenuti in memoria nel processo: con più
+worker uvicorn ogni worker espone i propri valori e Prometheus li aggrega per istanza.
+"""
+import math
+import threading
+import time
+
+from starlette.routing import Match
+
+# Limiti degli istogrammi di latenza, in secondi
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+def _escape(value) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+def _format_labels(names, values, extra: str = '') -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return '+Inf' if value > 0 else '-Inf'
+    return repr(float(value))
+
+class Registry:
+    """Insieme delle metriche esposte da /metrics"""
+
+    def __init__(self):
+        self._metrics = []
+        self._lock = threading.Lock()
+
+    def register(self, metric):
+        with self._lock:
+            self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics)
+        return ''.join(metric.render() for metric in metrics)
+
+REGISTRY = Registry()
+
+class Metric:
+    kind = 'untyped'
+
+    def __init__(self, name: str, documentation: str, labelnames=(), registry: Registry = REGISTRY):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+        registry.register(self)
+
+    def _key(self, labels: dict) -> tuple:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"Etichette attese per {self.name}: {self.labelnames}")
+        return tuple(labels[name] for name in self.labelnames)
+
+    def _header(self) -> str:
+        return f"# HELP {self.name} {self.documentation}\n# TYPE {self.name} {self.kind}\n"
+
+    def samples(self) -> dict:
+        with self._lock:
+            return dict(self._values)
+
+    def render(self) -> str:
+        lines = [self._header()]
+        for key, value in sorted(self.samples().items()):
+            lines.append(f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}\n")
+        return ''.join(lines)
+
+class Counter(Metric):
+    kind = 'counter'
+
+    def inc(self, amount: float = 1.0, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+class Gauge(Metric):
+    """Gauge aggiornato dal codice o, con collect, letto al momento della richiesta"""
+    kind = 'gauge'
+
+    def __init__(self, name: str, documentation: str, labelnames=(), registry: Registry = REGISTRY, collect=None):
+        super().__init__(name, documentation, labelnames, registry)
+        self.collect = collect  # funzione che restituisce {valori etichette: valore}
+
+    def inc(self, amount: float = 1.0, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels):
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def samples(self) -> dict:
+        return self.collect() if self.collect is not None else super().samples()
+
+class Histogram(Metric):
+    kind = 'histogram'
+
+    def __init__(self, name: str, documentation: str, labelnames=(), registry: Registry = REGISTRY,
+                 buckets=LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames, registry)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                entry = self._values[key] = [[0] * len(self.buckets), 0.0, 0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    entry[0][i] += 1
+                    break
+            entry[1] += value
+            entry[2] += 1
+
+    def render(self) -> str:
+        with self._lock:
+            values = {key: (list(counts), total, count) for key, (counts, total, count) in self._values.items()}
+        lines = [self._header()]
+        for key, (counts, total, count) in sorted(values.items()):
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {cumulative}\n")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}\n")
+            lines.append(f"{self.name}_count{labels} {count}\n")
+        return ''.join(lines)
+
+# Richieste HTTP, etichettate con il percorso della route (non l'URL) per limitare le serie
+HTTP_REQUESTS = Counter('http_requests_total', 'Richieste HTTP completate', ('method', 'route', 'status'))
+HTTP_LATENCY = Histogram('http_request_duration_seconds',
+                         'Durata delle richieste HTTP, corpo della risposta compreso', ('method', 'route'))
+HTTP_IN_FLIGHT = Gauge('http_requests_in_flight', 'Richieste HTTP in corso', ('method', 'route'))
+
+# Pool di connessioni del database
+DB_POOL_CHECKOUTS = Counter('db_pool_checkouts_total', 'Connessioni prese dal pool')
+DB_POOL_WAIT = Histogram('db_pool_wait_seconds', 'Attesa per ottenere una connessione dal pool',
+                         buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0))
+DB_POOL_TIMEOUTS = Counter('db_pool_timeouts_total', 'Richieste di connessione scadute dopo pool_timeout')
+DB_POOL_HOLD = Histogram('db_pool_connection_hold_seconds', 'Tempo per cui una connessione resta fuori dal pool')
+
+# Fasi dell'elaborazione STL e del calcolo dei costi
+STAGE_LATENCY = Histogram('stl_stage_duration_seconds', 'Durata delle fasi di stl_processor', ('stage',))
+
+def route_template(scope) -> str:
+    """Percorso della route che gestirà la richiesta, es. /materials/{material_id}"""
+    partial = 'unmatched'
+    for route in scope['app'].router.routes:
+        match, _ = route.matches(scope)
+        if match == Match.FULL:
+            return route.path
+        if match == Match.PARTIAL and partial == 'unmatched':
+            partial = route.path  # percorso giusto, metodo non ammesso (405)
+    return partial
+
+class MetricsMiddleware:
+    """Middleware ASGI che misura durata, esito e concorrenza delle richieste per route"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        labels = {'method': scope['method'], 'route': route_template(scope)}
+        status = 500
+
+        async def send_with_status(message):
+            nonlocal status
+            if message['type'] == 'http.response.start':
+                status = message['status']
+            await send(message)
+
+        HTTP_IN_FLIGHT.inc(**labels)
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            HTTP_LATENCY.observe(time.perf_counter() - start, **labels)
+            HTTP_REQUESTS.inc(status=str(status), **labels)
+            HTTP_IN_FLIGHT.dec(**labels)
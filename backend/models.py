@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float, Boolean
+from sqlalchemy import Column, Integer, String, Float, Boolean, Index
 from .base import Base
 
 class Material(Base):
@@ -23,6 +23,13 @@ class Material(Base):
     fan_speed = Column(Integer, default=100)  # %
     flow_rate = Column(Integer, default=100)  # %
 
+    # Indici per la paginazione a cursore e i filtri di /materials/
+    __table_args__ = (
+        Index('ix_materials_name_id', 'name', 'id'),
+        Index('ix_materials_cost_per_kg_id', 'cost_per_kg', 'id'),
+        Index('ix_materials_layer_range', 'min_layer_height', 'max_layer_height'),
+    )
+
 class Printer(Base):
     __tablename__ = "printers"
 
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import Dict, List, Optional
 
 # Material schemas
 class MaterialBase(BaseModel):
@@ -41,6 +41,12 @@ class MaterialUpdate(BaseModel):
     fan_speed: Optional[int] = Field(None, ge=0, le=100)
     flow_rate: Optional[int] = Field(None, ge=50, le=200)
 
+class MaterialBatchUpdate(MaterialUpdate):
+    id: int
+
+class MaterialImportResult(BaseModel):
+    imported: int = Field(..., description="Numero di materiali inseriti")
+
 class Material(MaterialBase):
     id: int
 
@@ -74,4 +80,87 @@ class EnergyCost(EnergyCostBase):
     id: int
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+# Quote schemas
+class Dimensions(BaseModel):
+    width: float = Field(..., description="Larghezza in mm")
+    depth: float = Field(..., description="Profondità in mm")
+    height: float = Field(..., description="Altezza in mm")
+
+class MeshReport(BaseModel):
+    triangles: int = Field(..., description="Triangoli del file originale")
+    vertices: int = Field(..., description="Vertici dopo la saldatura")
+    degenerate: int = Field(..., description="Facce degeneri rimosse")
+    duplicates: int = Field(..., description="Facce duplicate rimosse")
+    flipped: int = Field(..., description="Facce con il verso corretto")
+    components: int
+    open_edges: int = Field(..., description="Spigoli di bordo (mesh aperta)")
+    non_manifold_edges: int = Field(..., description="Spigoli condivisi da più di due facce")
+    non_orientable_edges: int
+    watertight: bool
+    repaired: bool
+
+class Quote(BaseModel):
+    file: Optional[str] = None
+    volume_cm3: float
+    weight_kg: float
+    material_cost: float
+    tempo_stampa: float
+    machine_cost: float
+    total_cost: float
+    material_id: int
+    layer_height: float
+    copies: int
+    dimensions: Dimensions
+    mesh_report: Optional[MeshReport] = None
+    plates: int = Field(1, description="Piatti di stampa necessari per tutte le copie")
+    per_plate: int = Field(1, description="Copie per piatto")
+    order_tempo_stampa: float = Field(..., description="Tempo totale per tutte le copie in ore")
+    order_total_cost: float = Field(..., description="Costo totale per tutte le copie in EUR")
+
+# Job schemas
+class Job(BaseModel):
+    id: str
+    status: str = Field(..., description="queued, running, done, failed o cancelled")
+    stage: Optional[str] = Field(None, description="Ultima fase conclusa: parse, validate, slice o price")
+    progress: float = Field(..., description="Frazione delle fasi concluse, da 0 a 1")
+    file: Optional[str] = None
+    result: Optional[Quote] = Field(None, description="Preventivo, a job concluso")
+    error: Optional[str] = None
+
+# Schedule schemas
+class ScheduleJob(BaseModel):
+    id: str = Field(..., description="Identificativo del lavoro, es. nome del file")
+    tempo_stampa: float = Field(..., gt=0, description="Durata stimata di una copia in ore")
+    copies: int = Field(1, ge=1, description="Copie, pianificate come lavori separati")
+
+class ScheduleRequest(BaseModel):
+    jobs: List[ScheduleJob]
+    printer_ids: Optional[List[int]] = Field(None, description="Stampanti da usare (default: tutte)")
+    energy_cost_id: Optional[int] = Field(None, description="Tariffa energetica (default: la prima)")
+    cost_weight: float = Field(0.0, ge=0, description="Ore di makespan scambiabili con 1 EUR di risparmio")
+    ready_hours: Dict[int, float] = Field(default_factory=dict, description="Ore dopo cui ogni stampante è libera")
+
+class ScheduledJob(BaseModel):
+    job_id: str
+    copy_number: int = Field(..., description="Numero della copia, da 1")
+    printer_id: int
+    start: float = Field(..., description="Inizio in ore dall'istante di pianificazione")
+    end: float = Field(..., description="Fine in ore dall'istante di pianificazione")
+    cost: float = Field(..., description="Costo macchina ed energia in EUR")
+
+class PrinterLoad(BaseModel):
+    printer_id: int
+    name: str
+    busy_until: float = Field(..., description="Fine dell'ultimo lavoro in ore")
+    jobs: int
+    cost: float
+
+class Schedule(BaseModel):
+    makespan: float = Field(..., description="Fine dell'ultimo lavoro in ore")
+    lower_bound: float = Field(..., description="Limite inferiore del makespan in ore")
+    total_cost: float
+    energy_kwh: float
+    assignments: List[ScheduledJob]
+    printers: List[PrinterLoad]
@@ -0,0 +1,455 @@
+"""
+Benchmark di stl_processor e dell'API su un corpus di mesh sintetiche
+
+Le mesh sono generate in modo deterministico (stesso seed, stessi triangoli):
+sfere, reticoli di cubi separati e sfere con rumore radiale simili a scansioni.
+Per ogni mesh si misurano parsing, volume, bounding box, analisi completa e prezzi;
+gli endpoint FastAPI sono chiamati in-process con un database SQLite in memoria.
+
+Uso:
+    python benchmark.py                                   # mesh da 1k a 1M triangoli
+    python benchmark.py --sizes 1k,100k,10M --repeat 5 --output risultati.json
+    python benchmark.py --skip-api --meshes sphere,scan
+    python benchmark.py --compare prima.json dopo.json    # confronto tra due commit
+    python benchmark.py --skip-api --skip-processor       # solo tempi di import (avvio a freddo)
+
+Il risultato è un JSON con i metadati del run (commit, versioni, CPU) e una voce per
+misura con i tempi di ogni ripetizione, minimo, mediana e picco di memoria allocata
+(tracemalloc, misurato in un'esecuzione separata per non falsare i tempi).
+I tempi di import dei punti di ingresso sono misurati in processi nuovi con
+python -X importtime, con il dettaglio per package e i moduli pesanti caricati.
+"""
+import argparse
+import json
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+import numpy as np
+from numpy.typing import NDArray
+
+# Mesh generate di default e limiti del run
+DEFAULT_SIZES = "1k,10k,100k,1M"
+DEFAULT_MESHES = "sphere,lattice,scan"
+API_MAX_TRIANGLES = 100_000  # le mesh più grandi non passano per l'API
+BENCHMARK_MATERIALS = 10_000  # materiali importati prima dei benchmark di lettura
+
+# Punti di ingresso misurati all'avvio e dipendenze che non dovrebbero caricare subito
+IMPORT_MODULES = ('app', 'backend.api', 'backend.database', 'stl_processor')
+HEAVY_MODULES = ('plotly', 'pandas', 'trimesh', 'scipy', 'fastapi', 'sqlalchemy', 'streamlit')
+
+def parse_size(value: str) -> int:
+    """'1k' -> 1000, '10M' -> 10000000"""
+    value = value.strip()
+    multiplier = {'k': 1_000, 'm': 1_000_000}.get(value[-1:].lower(), 1)
+    return int(float(value[:-1] if multiplier > 1 else value) * multiplier)
+
+# Corpus sintetico
+
+def _cube_faces(k: int) -> list[NDArray]:
+    """Superficie del cubo [-1, 1]³, k×k quadrati per faccia, triangoli orientati verso l'esterno"""
+    t = np.linspace(-1.0, 1.0, k + 1)
+    u, v = np.meshgrid(t, t, indexing='ij')
+    faces = []
+    for axis in range(3):
+        first, second = [a for a in range(3) if a != axis]
+        for sign in (-1.0, 1.0):
+            grid = np.empty((k + 1, k + 1, 3))
+            grid[..., axis] = sign
+            grid[..., first] = u
+            grid[..., second] = v
+            a, b, c, d = grid[:-1, :-1], grid[1:, :-1], grid[1:, 1:], grid[:-1, 1:]
+            triangles = np.concatenate([
+                np.stack([a, b, c], axis=-2).reshape(-1, 3, 3),
+                np.stack([a, c, d], axis=-2).reshape(-1, 3, 3)
+            ])
+            normal = np.cross(triangles[0, 1] - triangles[0, 0], triangles[0, 2] - triangles[0, 0])
+            if normal[axis] * sign < 0:
+                triangles = triangles[:, ::-1]
+            faces.append(triangles)
+    return faces
+
+def sphere_mesh(triangles: int, radius: float = 50.0, noise: float = 0.0, seed: int = 0) -> NDArray:
+    """
+    Sfera chiusa da un cubo suddiviso e proiettato, circa triangles triangoli
+
+    Con noise > 0 il raggio varia con una somma di onde dipendente solo dalla posizione:
+    la mesh resta chiusa (i vertici condivisi si spostano allo stesso modo) e somiglia
+    alla superficie irregolare di una scansione.
+    """
+    k = max(1, int(round(np.sqrt(triangles / 12))))
+    rng = np.random.default_rng(seed)
+    frequencies = rng.normal(scale=4.0, size=(8, 3))
+    phases = rng.uniform(0, 2 * np.pi, size=8)
+
+    parts = []
+    for face in _cube_faces(k):
+        points = face / np.linalg.norm(face, axis=-1, keepdims=True)
+        if noise:
+            points *= (1 + noise * np.sin(points @ frequencies.T + phases).mean(axis=-1))[..., None]
+        parts.append((points * radius).astype(np.float32))
+    return np.concatenate(parts)
+
+def lattice_mesh(triangles: int, cell: float = 4.0, seed: int = 0) -> NDArray:
+    """Reticolo di cubi separati (12 triangoli ciascuno) con lati variabili: molte componenti"""
+    count = max(1, triangles // 12)
+    side = int(np.ceil(count ** (1 / 3)))
+    rng = np.random.default_rng(seed)
+    index = np.arange(count)
+    origins = np.stack([index % side, index // side % side, index // side ** 2], axis=1) * cell
+    sizes = rng.uniform(0.3, 0.8, size=(count, 1, 1, 1)) * cell
+    template = np.concatenate(_cube_faces(1)) / 2
+    return (template[None] * sizes + origins[:, None, None, :]).reshape(-1, 3, 3).astype(np.float32)
+
+MESH_GENERATORS = {
+    'sphere': lambda n, seed: sphere_mesh(n, seed=seed),
+    'lattice': lambda n, seed: lattice_mesh(n, seed=seed),
+    'scan': lambda n, seed: sphere_mesh(n, noise=0.08, seed=seed),
+}
+
+def generate_mesh(kind: str, triangles: int, seed: int = 0) -> NDArray:
+    """Mesh sintetica deterministica (n, 3, 3) float32 in mm"""
+    if kind not in MESH_GENERATORS:
+        raise ValueError(f"Mesh sconosciuta {kind}: scegliere tra {', '.join(MESH_GENERATORS)}")
+    return MESH_GENERATORS[kind](triangles, seed)
+
+# Misure
+
+def measure(func, repeat: int, setup=None, memory: bool = True) -> dict:
+    """Tempi di repeat esecuzioni e picco di memoria allocata in un'esecuzione in più"""
+    times = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+
+    result = {
+        'times': times,
+        'min': min(times),
+        'median': statistics.median(times),
+    }
+    if memory:
+        if setup:
+            setup()
+        tracemalloc.start()
+        try:
+            func()
+            result['peak_bytes'] = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return result
+
+class Recorder:
+    """Raccoglie le misure e stampa una riga per ognuna"""
+
+    def __init__(self, repeat: int, memory: bool = True):
+        self.repeat = repeat
+        self.memory = memory
+        self.results = []
+
+    def run(self, suite: str, name: str, func, mesh: str | None = None, triangles: int | None = None,
+            setup=None, repeat: int | None = None, memory: bool | None = None, **extra):
+        try:
+            result = measure(func, repeat or self.repeat, setup, self.memory if memory is None else memory)
+        except Exception as e:
+            result = {'error': f"{type(e).__name__}: {str(e)}"}
+        return self.add(suite, name, result, mesh, triangles, **extra)
+
+    def add(self, suite: str, name: str, result: dict, mesh: str | None = None, triangles: int | None = None,
+            **extra):
+        """Registra una misura già eseguita (tempi, oppure error)"""
+        entry = {
+            'id': ':'.join(str(p) for p in (suite, name, mesh, triangles) if p is not None),
+            'suite': suite,
+            'name': name,
+            'mesh': mesh,
+            'triangles': triangles,
+            **extra,
+            **result,
+        }
+        self.results.append(entry)
+        if 'error' in result:
+            print(f"{entry['id']:<48} ERRORE {result['error']}")
+        else:
+            peak = f"{result['peak_bytes'] / 2 ** 20:10.1f} MB" if 'peak_bytes' in result else ''
+            print(f"{entry['id']:<48} {result['median'] * 1000:12.2f} ms {peak}")
+        return entry
+
+def bench_processor(recorder: Recorder, meshes: list[str], sizes: list[int], seed: int,
+                    out_of_core_min: int):
+    """Funzioni di stl_processor su ogni mesh del corpus"""
+    from stl_processor import (
+        analyze_stl, analyze_stl_file, calculate_print_cost, mesh_volume, parse_stl, price_grid,
+        process_stl, write_stl
+    )
+    from materials import MATERIALS_DATA as materials
+
+    material = materials['PLA']
+    layer_heights = np.arange(0.1, 0.31, 0.05)
+
+    for kind in meshes:
+        for size in sizes:
+            start = time.perf_counter()
+            triangles = generate_mesh(kind, size, seed)
+            generated = time.perf_counter() - start
+            content = write_stl(triangles)
+            count = len(triangles)
+            del triangles
+            common = {'mesh': kind, 'triangles': count}
+            print(f"-- {kind} {count} triangoli ({len(content) / 2 ** 20:.1f} MB, generata in {generated:.2f} s)")
+
+            view = parse_stl(content)['vectors']
+            recorder.run('processor', 'parse', lambda: parse_stl(content), **common)
+            recorder.run('processor', 'volume', lambda: mesh_volume(view), **common)
+            recorder.run('processor', 'bbox', lambda: (view.min(axis=(0, 1)), view.max(axis=(0, 1))), **common)
+            recorder.run('processor', 'process_stl', lambda: process_stl(content), **common)
+            recorder.run('processor', 'process_stl_no_repair', lambda: process_stl(content, repair=False), **common)
+
+            analysis = analyze_stl(content)
+            recorder.run('processor', 'analyze_stl', lambda: analyze_stl(content), **common)
+            recorder.run(
+                'processor', 'calculate_print_cost',
+                lambda: calculate_print_cost(analysis['volume'], material, 0.2, profile=analysis['profile']),
+                **common
+            )
+            recorder.run(
+                'processor', 'price_grid',
+                lambda: price_grid([analysis['volume']], materials, layer_heights, copies=(1, 10, 100),
+                                   profiles=[analysis['profile']]),
+                **common
+            )
+
+            if count >= out_of_core_min:
+                with tempfile.NamedTemporaryFile(suffix='.stl', delete=False) as f:
+                    f.write(content)
+                try:
+                    recorder.run('processor', 'analyze_stl_file_out_of_core',
+                                 lambda: analyze_stl_file(f.name, max_in_core=0), **common)
+                finally:
+                    os.unlink(f.name)
+
+def import_times(module: str) -> dict:
+    """
+    Import di module in un processo nuovo con -X importtime
+
+    Returns:
+        dict: seconds (import di module, cumulativo), packages (tempo proprio per
+            package di primo livello, in secondi, dal più lento) e modules caricati
+    """
+    root = os.path.dirname(os.path.abspath(__file__))
+    env = {**os.environ, 'PYTHONPATH': os.pathsep.join(filter(None, (root, os.environ.get('PYTHONPATH'))))}
+    completed = subprocess.run([sys.executable, '-X', 'importtime', '-c', f"import {module}"],
+                               capture_output=True, text=True, cwd=root, env=env)
+    if completed.returncode != 0:
+        raise RuntimeError(completed.stderr.strip().splitlines()[-1])
+
+    packages, modules, total = {}, [], None
+    for line in completed.stderr.splitlines():
+        if not line.startswith('import time:') or 'imported package' in line:
+            continue
+        own, cumulative, name = line[len('import time:'):].split('|')
+        name = name.strip()
+        modules.append(name)
+        top = name.split('.')[0]
+        packages[top] = packages.get(top, 0.0) + int(own) / 1e6
+        if name == module:
+            total = int(cumulative) / 1e6
+    return {
+        'seconds': total,
+        'packages': dict(sorted(packages.items(), key=lambda item: -item[1])),
+        'modules': modules,
+    }
+
+def bench_imports(recorder: Recorder, modules: list[str], repeat: int, top: int = 15):
+    """Tempo di import dei punti di ingresso, ognuno in un processo nuovo"""
+    for module in modules:
+        try:
+            runs = [import_times(module) for _ in range(repeat)]
+        except Exception as e:
+            recorder.add('imports', module, {'error': f"{type(e).__name__}: {str(e)}"})
+            continue
+        times = [run['seconds'] for run in runs]
+        fastest = runs[times.index(min(times))]
+        loaded = {name.split('.')[0] for name in fastest['modules']}
+        recorder.add('imports', module, {
+            'times': times,
+            'min': min(times),
+            'median': statistics.median(times),
+            'packages': dict(list(fastest['packages'].items())[:top]),
+            'heavy_modules': [name for name in HEAVY_MODULES if name in loaded],
+        })
+
+class CheckedClient:
+    """Client di test che trasforma le risposte 4xx/5xx in errori della misura"""
+
+    def __init__(self, client):
+        self.client = client
+
+    def request(self, method: str, url: str, **kwargs):
+        response = self.client.request(method, url, **kwargs)
+        if response.status_code >= 400:
+            raise RuntimeError(f"{method} {url} -> {response.status_code}: {response.text[:200]}")
+        return response
+
+    def get(self, url: str, **kwargs):
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url: str, **kwargs):
+        return self.request('POST', url, **kwargs)
+
+def bench_api(recorder: Recorder, meshes: list[str], sizes: list[int], seed: int, n_materials: int,
+              database_url: str):
+    """Endpoint FastAPI in-process su un database embedded (SQLite in memoria di default)"""
+    try:
+        from fastapi.testclient import TestClient
+    except ImportError as e:  # TestClient richiede httpx
+        print(f"Benchmark API saltati: {str(e)}")
+        return
+
+    # Il database va scelto prima di importare il backend, che crea l'engine all'import
+    os.environ['DATABASE_URL'] = database_url
+    os.environ.pop('STL_CACHE_DIR', None)
+    from backend import api
+    from stl_processor import analysis_cache, write_stl
+
+    with TestClient(api.app) as test_client:
+        client = CheckedClient(test_client)
+        lines = "\n".join(json.dumps({
+            'name': f"Benchmark {i:06d}",
+            'density': round(1.0 + (i % 50) / 100, 2),
+            'cost_per_kg': round(15 + (i * 7919 % 4000) / 100, 2),
+            'min_layer_height': 0.1,
+            'max_layer_height': 0.3,
+        }) for i in range(n_materials)).encode()
+        recorder.run('api', 'POST /materials/import', lambda: client.post(
+            '/materials/import?format=ndjson', content=lines), repeat=1, memory=False,
+            materials=n_materials)
+
+        def invalidate():
+            api.materials_cache.invalidate()
+
+        recorder.run('api', 'GET /materials/ (snapshot, cold)', lambda: client.get('/materials/?limit=1000'),
+                     setup=invalidate, materials=n_materials)
+        recorder.run('api', 'GET /materials/ (snapshot, warm)', lambda: client.get('/materials/?limit=1000'),
+                     materials=n_materials)
+        recorder.run('api', 'GET /materials/ (keyset)', lambda: client.get(
+            '/materials/?limit=100&sort=cost_per_kg&min_cost=20'), materials=n_materials)
+        recorder.run('api', 'GET /materials/export', lambda: client.get('/materials/export?format=ndjson'),
+                     materials=n_materials)
+
+        material_id = client.get('/materials/?limit=1').json()[0]['id']
+        form = {'material_id': material_id, 'layer_height': 0.2, 'copies': 1}
+        # La prima richiesta avvia il pool di processi: non va nelle misure
+        client.post('/quote', files={'file': ('warmup.stl', write_stl(sphere_mesh(100)))}, data=form)
+
+        for kind in meshes:
+            for size in (s for s in sizes if s <= API_MAX_TRIANGLES):
+                content = write_stl(generate_mesh(kind, size, seed))
+                common = {'mesh': kind, 'triangles': size}
+                recorder.run('api', 'POST /quote (cold)', lambda: client.post(
+                    '/quote', files={'file': ('mesh.stl', content)}, data=form), setup=analysis_cache.clear, **common)
+                recorder.run('api', 'POST /quote (cached)', lambda: client.post(
+                    '/quote', files={'file': ('mesh.stl', content)}, data=form), **common)
+                recorder.run('api', 'POST /quote/stream (cold)', lambda: client.post(
+                    f'/quote/stream?material_id={material_id}&layer_height=0.2', content=content),
+                    setup=analysis_cache.clear, **common)
+
+        printers = [client.post('/printers/', json={
+            'name': f"Benchmark {i}", 'hourly_cost': 1 + i % 5, 'power_consumption': 0.1 + i % 3 / 10
+        }).json()['id'] for i in range(20)]
+        jobs = [{'id': f"job-{i}", 'tempo_stampa': 0.5 + (i * 37 % 200) / 10, 'copies': 1 + i % 3}
+                for i in range(500)]
+        recorder.run('api', 'POST /schedule', lambda: client.post(
+            '/schedule', json={'jobs': jobs, 'printer_ids': printers}), jobs=len(jobs), printers=len(printers))
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True,
+                              check=True, cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except Exception:
+        return None
+
+def run_metadata(args) -> dict:
+    return {
+        'timestamp': datetime.now(timezone.utc).isoformat(),
+        'commit': git_commit(),
+        'python': sys.version.split()[0],
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'sizes': args.sizes,
+        'meshes': args.meshes,
+        'repeat': args.repeat,
+        'seed': args.seed,
+    }
+
+def compare(base_path: str, new_path: str):
+    """Rapporto tra le mediane di due run, per le misure presenti in entrambi"""
+    with open(base_path) as f:
+        base = {r['id']: r for r in json.load(f)['results'] if 'median' in r}
+    with open(new_path) as f:
+        new = {r['id']: r for r in json.load(f)['results'] if 'median' in r}
+
+    print(f"{'misura':<48} {'prima':>12} {'dopo':>12} {'rapporto':>9}")
+    for key in (k for k in new if k in base):
+        before, after = base[key]['median'], new[key]['median']
+        ratio = after / before if before else float('inf')
+        flag = '  più lento' if ratio > 1.1 else '  più veloce' if ratio < 0.9 else ''
+        print(f"{key:<48} {before * 1000:10.2f}ms {after * 1000:10.2f}ms {ratio:8.2f}x{flag}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark di stl_processor e dell'API")
+    parser.add_argument('--sizes', default=DEFAULT_SIZES, help="Triangoli per mesh, es. 1k,10k,10M")
+    parser.add_argument('--meshes', default=DEFAULT_MESHES, help=f"Tipi di mesh ({', '.join(MESH_GENERATORS)})")
+    parser.add_argument('--repeat', type=int, default=3, help="Ripetizioni per misura")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', default='benchmark_results.json', help="File JSON dei risultati")
+    parser.add_argument('--skip-api', action='store_true', help="Salta i benchmark degli endpoint")
+    parser.add_argument('--skip-processor', action='store_true', help="Salta i benchmark di stl_processor")
+    parser.add_argument('--skip-imports', action='store_true', help="Salta i tempi di import")
+    parser.add_argument('--import-modules', default=','.join(IMPORT_MODULES), help="Moduli di cui misurare l'import")
+    parser.add_argument('--no-memory', action='store_true', help="Non misura il picco di memoria")
+    parser.add_argument('--materials', type=int, default=BENCHMARK_MATERIALS, help="Materiali per i benchmark API")
+    parser.add_argument('--database-url', default='sqlite://', help="Database del backend (default: SQLite in memoria)")
+    parser.add_argument('--out-of-core-min', default='1M', help="Triangoli da cui misurare anche analyze_stl_file")
+    parser.add_argument('--compare', nargs=2, metavar=('PRIMA', 'DOPO'), help="Confronta due file di risultati")
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+        return
+
+    # I log dei moduli misurati falserebbero i tempi
+    logging.disable(logging.WARNING)
+
+    sizes = [parse_size(s) for s in args.sizes.split(',')]
+    meshes = [m.strip() for m in args.meshes.split(',')]
+    recorder = Recorder(args.repeat, memory=not args.no_memory)
+
+    if not args.skip_imports:
+        bench_imports(recorder, [m.strip() for m in args.import_modules.split(',')], args.repeat)
+    if not args.skip_processor:
+        bench_processor(recorder, meshes, sizes, args.seed, parse_size(args.out_of_core_min))
+    if not args.skip_api:
+        bench_api(recorder, meshes, sizes, args.seed, args.materials, args.database_url)
+
+    import resource
+    output = {
+        'metadata': {**run_metadata(args), 'max_rss_bytes': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024},
+        'results': recorder.results,
+    }
+    with open(args.output, 'w') as f:
+        json.dump(output, f, indent=2)
+    print(f"Risultati salvati in {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""
+Configurazione centralizzata del logging per frontend, backend e stl_processor
+
+I record passano da una coda: il thread che logga non formatta e non scrive mai,
+lo fa un QueueListener in un thread dedicato. L'uscita è JSON (una riga per record)
+o testo, i livelli sono configurabili per modulo e i log di debug dei percorsi caldi
+(prezzi, SQL) possono essere campionati.
+
+Variabili d'ambiente:
+    LOG_LEVEL: livello di default (INFO)
+    LOG_LEVELS: livelli per modulo, es. "stl_processor=WARNING,sqlalchemy.engine=INFO"
+    LOG_FORMAT: "json" (default) o "text"
+    LOG_SAMPLE_RATE: frazione dei log di debug campionati registrata (0.01)
+"""
+import atexit
+import itertools
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+import threading
+from datetime import datetime, timezone
+
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+LOG_LEVELS = os.getenv("LOG_LEVELS", "")
+LOG_FORMAT = os.getenv("LOG_FORMAT", "json").lower()
+LOG_SAMPLE_RATE = float(os.getenv("LOG_SAMPLE_RATE", "0.01"))
+
+TEXT_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+# Attributi standard di LogRecord: gli altri arrivano da extra= e finiscono nel JSON
+_RECORD_ATTRIBUTES = set(vars(logging.LogRecord('', 0, '', 0, '', (), None))) | {'message', 'asctime', 'taskName'}
+
+class JsonFormatter(logging.Formatter):
+    """Un oggetto JSON per record, con i campi passati in extra="""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            'time': datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRIBUTES and not key.startswith('_'):
+                entry[key] = value
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+class LazyQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler che accoda il record senza formattarlo: la coda è nello stesso processo,
+    quindi messaggio e argomenti sono composti dal listener. Gli argomenti non vanno
+    modificati dopo la chiamata di log.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+_listener = None
+_setup_lock = threading.Lock()
+
+def _direct_output_in_child():
+    """
+    Nei processi figli creati con fork (il pool di analisi) il thread del listener
+    non esiste: i record vanno scritti direttamente, altrimenti resterebbero in coda
+    """
+    root = logging.getLogger()
+    for existing in list(root.handlers):
+        if isinstance(existing, LazyQueueHandler):
+            root.removeHandler(existing)
+            root.addHandler(_output_handler())
+
+def _output_handler() -> logging.Handler:
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(JsonFormatter() if LOG_FORMAT == 'json' else logging.Formatter(TEXT_FORMAT))
+    return handler
+
+def parse_levels(spec: str) -> dict:
+    """'a=DEBUG,b.c=WARNING' -> {'a': 'DEBUG', 'b.c': 'WARNING'}"""
+    levels = {}
+    for item in filter(None, (part.strip() for part in spec.split(','))):
+        name, _, level = item.partition('=')
+        levels[name.strip()] = level.strip().upper()
+    return levels
+
+def setup_logging():
+    """Configura il logging del processo; le chiamate successive non hanno effetto"""
+    global _listener
+    with _setup_lock:
+        if _listener is not None:
+            return
+
+        handler = _output_handler()
+        log_queue = queue.SimpleQueue()
+        root = logging.getLogger()
+        for existing in list(root.handlers):
+            root.removeHandler(existing)
+        root.addHandler(LazyQueueHandler(log_queue))
+        root.setLevel(LOG_LEVEL)
+        for name, level in parse_levels(LOG_LEVELS).items():
+            logging.getLogger(name).setLevel(level)
+
+        _listener = logging.handlers.QueueListener(log_queue, handler, respect_handler_level=True)
+        _listener.start()
+        atexit.register(_listener.stop)
+        if hasattr(os, 'register_at_fork'):
+            os.register_at_fork(after_in_child=_direct_output_in_child)
+
+class SampledLogger:
+    """
+    Log di debug campionati per i percorsi chiamati molte volte (prezzi, SQL)
+
+    Con il livello DEBUG disattivato il costo è un solo controllo; altrimenti viene
+    registrata una chiamata ogni round(1 / rate).
+    """
+
+    def __init__(self, logger: logging.Logger, rate: float = LOG_SAMPLE_RATE):
+        self.logger = logger
+        self.every = max(1, round(1 / rate)) if rate > 0 else 0
+        self._calls = itertools.count()
+
+    def enabled(self) -> bool:
+        return self.every > 0 and self.logger.isEnabledFor(logging.DEBUG)
+
+    def debug(self, msg: str, *args, **kwargs):
+        if self.enabled() and next(self._calls) % self.every == 0:
+            self.logger.debug(msg, *args, **kwargs)
@@ -1,39 +1,84 @@
 import streamlit as st
 import requests
-import pandas as pd
 import os
-import time
 import logging
 
-# Configure logger
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+from api_client import get_client
+
 logger = logging.getLogger(__name__)
 
 def fetch_materials(backend_url):
     """Recupera la lista dei materiali dal backend"""
     with st.spinner('🔄 Caricamento materiali in corso...'):
         try:
-            endpoint = f"{backend_url}/materials/"
-            logger.info(f"Fetching materials from: {endpoint}")
-            response = requests.get(endpoint)
-            response.raise_for_status()  # This will raise an exception for error status codes
-
-            if response.status_code == 200:
-                time.sleep(0.5)  # Small delay to show loading spinner
-                return response.json()
-            else:
-                logger.error(f"Error response: {response.text}")
-                st.error(f"Errore nel recupero dei materiali. Status code: {response.status_code}")
-                return []
+            return get_client(backend_url).get_materials()
+        except requests.exceptions.HTTPError as e:
+            logger.error("Error response: %s", e.response.text)
+            st.error(f"Errore nel recupero dei materiali. Status code: {e.response.status_code}")
+            return []
         except requests.exceptions.RequestException as e:
-            logger.error(f"Request exception during materials fetch: {str(e)}")
+            logger.error("Request exception during materials fetch: %s", e)
             st.error(f"Errore di connessione al backend: {str(e)}")
             return []
         except Exception as e:
-            logger.error(f"Unexpected exception during materials fetch: {str(e)}")
+            logger.error("Unexpected exception during materials fetch: %s", e)
             st.error(f"Errore imprevisto: {str(e)}")
             return []
 
+# Materiali per pagina nella lista di gestione
+MATERIALS_PAGE_SIZE = 20
+
+def fetch_materials_page(backend_url, limit=MATERIALS_PAGE_SIZE, cursor=None, **filters):
+    """Recupera una pagina di materiali con paginazione a cursore; restituisce (materiali, cursore successivo)"""
+    params = {'limit': limit, **{k: v for k, v in filters.items() if v not in (None, '')}}
+    if cursor:
+        params['cursor'] = cursor
+    try:
+        response = get_client(backend_url).get('/materials/', params=params)
+        response.raise_for_status()
+        return response.json(), response.headers.get('X-Next-Cursor')
+    except requests.exceptions.HTTPError as e:
+        logger.error("Error response: %s", e.response.text)
+        st.error(f"Errore nel recupero dei materiali. Status code: {e.response.status_code}")
+    except requests.exceptions.RequestException as e:
+        logger.error("Request exception during materials fetch: %s", e)
+        st.error(f"Errore di connessione al backend: {str(e)}")
+    return [], None
+
+def import_materials(file, backend_url):
+    """Importa materiali da un file CSV o NDJSON in un'unica transazione"""
+    fmt = 'csv' if file.name.lower().endswith('.csv') else 'ndjson'
+    try:
+        client = get_client(backend_url)
+        response = client.post("/materials/import", params={'format': fmt}, data=file.getvalue())
+        if response.status_code == 200:
+            client.invalidate_materials()
+            st.success(f"✅ Importati {response.json()['imported']} materiali")
+            return True
+
+        detail = response.json().get('detail', 'Errore sconosciuto')
+        if isinstance(detail, list):
+            st.error("Import annullato, righe non valide:")
+            st.json(detail)
+        else:
+            st.error(f"Errore nell'import dei materiali: {detail}")
+        return False
+    except Exception as e:
+        logger.error("Exception during materials import: %s", e)
+        st.error(f"Errore durante l'import dei materiali: {str(e)}")
+        return False
+
+def export_materials(backend_url, fmt):
+    """Scarica l'esportazione completa dei materiali"""
+    try:
+        response = get_client(backend_url).get("/materials/export", params={'format': fmt})
+        response.raise_for_status()
+        return response.content
+    except Exception as e:
+        logger.error("Exception during materials export: %s", e)
+        st.error(f"Errore durante l'esportazione dei materiali: {str(e)}")
+        return None
+
 def validate_material_data(data):
     """Valida i dati del materiale"""
     required_fields = ['name', 'density', 'cost_per_kg', 'min_layer_height', 'max_layer_height', 'print_speed', 'hourly_cost']
@@ -62,19 +107,17 @@ def add_material(material_data, backend_url):
         return False
 
     try:
-        logger.info(f"Adding material to: {backend_url}/materials/")
-        logger.info(f"Material data: {material_data}")
+        logger.info("Adding material to: %s/materials/", backend_url)
+        logger.info("Material data: %s", material_data)
 
-        response = requests.post(
-            f"{backend_url}/materials/",
-            json=material_data,
-            headers={"Content-Type": "application/json"}
-        )
+        client = get_client(backend_url)
+        response = client.post("/materials/", json=material_data)
 
-        logger.info(f"Response status: {response.status_code}")
-        logger.info(f"Response content: {response.text}")
+        logger.info("Response status: %s", response.status_code)
+        logger.info("Response content: %s", response.text)
 
         if response.status_code == 200:
+            client.invalidate_materials()
             st.success("✅ Materiale aggiunto con successo!")
             return True
         else:
@@ -87,7 +130,7 @@ def add_material(material_data, backend_url):
             st.error(f"Errore nell'aggiunta del materiale: {error_detail}")
             return False
     except Exception as e:
-        logger.error(f"Exception during material addition: {str(e)}")
+        logger.error("Exception during material addition: %s", e)
         st.error(f"Errore durante l'aggiunta del materiale: {str(e)}")
         return False
 
@@ -95,15 +138,13 @@ def update_material(material_id, material_data):
     """Aggiorna un materiale esistente"""
     try:
         # Log di debug
-        logger.info(f"Aggiornamento materiale {material_id} con dati: {material_data}")
+        logger.info("Aggiornamento materiale %s con dati: %s", material_id, material_data)
 
-        response = requests.patch(
-            f"{BACKEND_URL}/materials/{material_id}",
-            json=material_data,
-            headers={"Content-Type": "application/json"}
-        )
+        client = get_client(BACKEND_URL)
+        response = client.patch(f"/materials/{material_id}", json=material_data)
 
         if response.status_code == 200:
+            client.invalidate_materials()
             st.success("✅ Materiale aggiornato con successo!")
             return True
         else:
@@ -117,8 +158,10 @@ def update_material(material_id, material_data):
 def delete_material(material_id):
     """Elimina un materiale"""
     try:
-        response = requests.delete(f"{BACKEND_URL}/materials/{material_id}")
+        client = get_client(BACKEND_URL)
+        response = client.delete(f"/materials/{material_id}")
         if response.status_code == 200:
+            client.invalidate_materials()
             st.success("✅ Materiale eliminato con successo!")
             return True
         else:
@@ -187,12 +230,52 @@ def materials_manager_page():
             if add_material(material_data, BACKEND_URL):
                 st.rerun()
 
+    # Import ed esportazione massivi
+    with st.expander("📦 Importa / Esporta Materiali", expanded=False):
+        st.markdown("""
+        Importa un file **CSV** (con intestazione) o **NDJSON** (un materiale per riga) con gli stessi
+        campi del modulo. L'import è atomico: se una riga non è valida non viene salvato nulla.
+        """)
+        uploaded = st.file_uploader("File materiali", type=['csv', 'ndjson', 'jsonl'], key="materials_import")
+        if uploaded is not None and st.button("📥 Importa"):
+            if import_materials(uploaded, BACKEND_URL):
+                st.rerun()
+
+        export_format = st.radio("Formato esportazione", ['csv', 'ndjson'], horizontal=True)
+        if st.button("📤 Prepara esportazione"):
+            st.session_state.materials_export = (export_format, export_materials(BACKEND_URL, export_format))
+        if st.session_state.get('materials_export') and st.session_state.materials_export[1]:
+            fmt, content = st.session_state.materials_export
+            st.download_button("💾 Scarica", content, file_name=f"materials.{fmt}",
+                               mime='text/csv' if fmt == 'csv' else 'application/x-ndjson')
+
     # Lista dei materiali esistenti
     st.markdown("### 📋 Materiali Esistenti")
-    materials = fetch_materials(BACKEND_URL)
+    col_search, col_sort = st.columns([3, 1])
+    with col_search:
+        name_prefix = st.text_input("🔍 Cerca per nome", placeholder="Inizio del nome, es. PLA")
+    with col_sort:
+        sort_labels = {'Nome': 'name', 'Costo per kg': 'cost_per_kg', 'Inserimento': 'id'}
+        sort = sort_labels[st.selectbox("Ordina per", list(sort_labels))]
+
+    # La pila dei cursori permette di tornare alle pagine precedenti; riparte
+    # dalla prima pagina quando cambiano ricerca o ordinamento
+    query_key = (name_prefix, sort)
+    if st.session_state.get('materials_query') != query_key:
+        st.session_state.materials_query = query_key
+        st.session_state.materials_cursors = [None]
+    cursors = st.session_state.materials_cursors
+
+    with st.spinner('🔄 Caricamento materiali in corso...'):
+        materials, next_cursor = fetch_materials_page(
+            BACKEND_URL, cursor=cursors[-1], sort=sort, name_prefix=name_prefix.strip()
+        )
 
     if not materials:
-        st.info("Nessun materiale presente. Aggiungi il tuo primo materiale!")
+        if name_prefix.strip():
+            st.info("Nessun materiale corrisponde alla ricerca.")
+        else:
+            st.info("Nessun materiale presente. Aggiungi il tuo primo materiale!")
         return
 
     # Visualizza i materiali come cards con CSS migliorato
@@ -288,5 +371,18 @@ def materials_manager_page():
 
             st.markdown("---")
 
+    # Navigazione tra le pagine
+    col_prev, col_page, col_next = st.columns([1, 2, 1])
+    with col_prev:
+        if len(cursors) > 1 and st.button("⬅️ Precedente"):
+            cursors.pop()
+            st.rerun()
+    with col_page:
+        st.caption(f"Pagina {len(cursors)}")
+    with col_next:
+        if next_cursor and st.button("Successiva ➡️"):
+            cursors.append(next_cursor)
+            st.rerun()
+
 # Ottieni l'URL del backend dall'ambiente o usa un default
 BACKEND_URL = os.getenv('BACKEND_URL', 'http://localhost:8000')
\ No newline at end of file
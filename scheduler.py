@@ -0,0 +1,155 @@
+import numpy as np
+from numpy.typing import NDArray
+import os
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Limiti della ricerca locale dopo l'assegnazione LPT
+SCHEDULE_MAX_ITERATIONS = int(os.getenv("SCHEDULE_MAX_ITERATIONS", "2000"))
+SCHEDULE_TIME_LIMIT = float(os.getenv("SCHEDULE_TIME_LIMIT", "0.25"))  # secondi
+
+def printer_rates(hourly_costs, power_consumption, cost_per_kwh: float = 0.0) -> NDArray:
+    """Costo orario di ogni stampante comprensivo dell'energia, in EUR/h"""
+    return np.asarray(hourly_costs, dtype=np.float64) + np.asarray(power_consumption, dtype=np.float64) * cost_per_kwh
+
+def lpt_assign(durations: NDArray, rates: NDArray, ready: NDArray, cost_weight: float = 0.0) -> tuple[NDArray, NDArray]:
+    """
+    Assegnazione Longest Processing Time: i lavori, dal più lungo, vanno sulla stampante
+    che minimizza fine lavoro + cost_weight * costo
+
+    Returns:
+        tuple: (stampante di ogni lavoro, carico in ore di ogni stampante)
+    """
+    loads = ready.astype(np.float64).copy()
+    assignment = np.empty(len(durations), dtype=np.int64)
+    weighted_rates = cost_weight * rates
+    for job in np.argsort(-durations, kind='stable'):
+        d = durations[job]
+        printer = int(np.argmin(loads + d * weighted_rates))
+        assignment[job] = printer
+        loads[printer] += d
+    return assignment, loads
+
+def improve_schedule(durations: NDArray, assignment: NDArray, loads: NDArray, rates: NDArray,
+                     cost_weight: float = 0.0, max_iterations: int = SCHEDULE_MAX_ITERATIONS,
+                     time_limit: float = SCHEDULE_TIME_LIMIT) -> int:
+    """
+    Ricerca locale sulla stampante critica: sposta un suo lavoro su un'altra stampante
+    o lo scambia con un lavoro più corto, scegliendo a ogni passo la mossa con il
+    miglior guadagno su makespan + cost_weight * costo. Modifica assignment e loads.
+
+    Returns:
+        int: Numero di mosse applicate
+    """
+    n_printers = len(loads)
+    if n_printers < 2 or len(durations) == 0:
+        return 0
+
+    deadline = time.perf_counter() + time_limit
+    moves = 0
+    for _ in range(max_iterations):
+        if time.perf_counter() > deadline:
+            break
+
+        critical = int(np.argmax(loads))
+        makespan = loads[critical]
+        second = np.partition(loads, n_printers - 2)[n_printers - 2]
+        jobs = np.flatnonzero(assignment == critical)
+        if len(jobs) == 0:
+            break  # il makespan è l'ora in cui la stampante critica si libera: nessuna mossa lo riduce
+        d = durations[jobs]
+
+        # Spostamenti: lavoro j della stampante critica -> stampante p
+        moved = np.maximum(np.maximum(second, makespan - d)[:, None], loads[None, :] + d[:, None])
+        gain = makespan - moved - cost_weight * d[:, None] * (rates[None, :] - rates[critical])
+        gain[:, critical] = -np.inf
+        j, p = np.unravel_index(np.argmax(gain), gain.shape)
+        best_gain, best_move = gain[j, p], ('move', jobs[j], p)
+
+        # Scambi: lavoro j della stampante critica <-> lavoro k più corto di un'altra stampante
+        others = np.flatnonzero(assignment != critical)
+        if len(others):
+            delta = d[:, None] - durations[others][None, :]
+            other_loads = loads[assignment[others]]
+            swapped = np.maximum(np.maximum(second, makespan - delta), other_loads[None, :] + delta)
+            swap_gain = makespan - swapped - cost_weight * delta * (rates[assignment[others]][None, :] - rates[critical])
+            swap_gain[delta <= 0] = -np.inf
+            sj, sk = np.unravel_index(np.argmax(swap_gain), swap_gain.shape)
+            if swap_gain[sj, sk] > best_gain:
+                best_gain, best_move = swap_gain[sj, sk], ('swap', jobs[sj], others[sk])
+
+        if best_gain <= 1e-9:
+            break
+
+        kind, job, target = best_move
+        if kind == 'move':
+            loads[critical] -= durations[job]
+            loads[target] += durations[job]
+            assignment[job] = target
+        else:
+            printer = assignment[target]
+            diff = durations[job] - durations[target]
+            loads[critical] -= diff
+            loads[printer] += diff
+            assignment[job], assignment[target] = printer, critical
+        moves += 1
+
+    return moves
+
+def schedule_jobs(durations, hourly_costs, power_consumption, cost_per_kwh: float = 0.0,
+                  cost_weight: float = 0.0, ready=None) -> dict:
+    """
+    Pianifica i lavori di stampa sulla flotta: LPT seguita da ricerca locale
+
+    Args:
+        durations: Durata stimata di ogni lavoro in ore (da estimate_print_time)
+        hourly_costs: Costo orario di ogni stampante in EUR/h
+        power_consumption: Consumo di ogni stampante in kW
+        cost_per_kwh: Costo dell'energia in EUR/kWh
+        cost_weight: Ore di makespan che si è disposti a cedere per risparmiare 1 EUR;
+            con 0 si minimizza solo il makespan
+        ready: Ore dopo cui ogni stampante è libera (default: tutte subito)
+
+    Returns:
+        dict: printer, start, end e cost per lavoro; loads per stampante; makespan,
+            lower_bound, total_cost, energy_kwh e moves della ricerca locale
+    """
+    durations = np.asarray(durations, dtype=np.float64)
+    rates = printer_rates(hourly_costs, power_consumption, cost_per_kwh)
+    n_printers = len(rates)
+    if n_printers == 0:
+        raise ValueError("Nessuna stampante disponibile")
+    if np.any(durations < 0):
+        raise ValueError("Le durate dei lavori devono essere positive")
+    ready = np.zeros(n_printers) if ready is None else np.asarray(ready, dtype=np.float64)
+
+    assignment, loads = lpt_assign(durations, rates, ready, cost_weight)
+    moves = improve_schedule(durations, assignment, loads, rates, cost_weight)
+
+    # Sequenza su ogni stampante: dal lavoro più lungo, a partire da quando è libera
+    order = np.lexsort((-durations, assignment))
+    group_start = np.searchsorted(assignment[order], np.arange(1, n_printers))
+    end = np.empty_like(durations)
+    for printer, jobs in enumerate(np.split(order, group_start)):
+        end[jobs] = ready[printer] + np.cumsum(durations[jobs])
+    start = end - durations
+
+    cost = durations * rates[assignment]
+    power = np.asarray(power_consumption, dtype=np.float64)
+    lower_bound = max(float(durations.max(initial=0.0)) + float(ready.min()),
+                      (float(durations.sum()) + float(ready.sum())) / n_printers)
+
+    return {
+        'printer': assignment,
+        'start': start,
+        'end': end,
+        'cost': cost,
+        'loads': loads,
+        'makespan': float(loads.max()),
+        'lower_bound': lower_bound,
+        'total_cost': float(cost.sum()),
+        'energy_kwh': float((durations * power[assignment]).sum()),
+        'moves': moves,
+    }
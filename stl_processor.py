@@ -1,60 +1,1975 @@
 import numpy as np
 from numpy.typing import NDArray
-from stl import mesh  # Modifica dell'import per numpy-stl
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
+from typing import BinaryIO
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import contextmanager
+import hashlib
 import io
-import tempfile
 import os
+import pickle
+import re
+import tempfile
+import threading
+import time
+import zipfile
+import zlib
 import logging
+from xml.etree import ElementTree
+
+from log_config import SampledLogger
+
+try:
+    import zstandard
+except ImportError:  # zstandard è opzionale: senza, i file .zst sono rifiutati
+    zstandard = None
 
-# Configure logger
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-def process_stl(file_content: bytes) -> tuple[float, NDArray, dict]:
+# calculate_print_cost è chiamata per ogni cella delle griglie di prezzo: debug campionato
+_pricing_log = SampledLogger(logger)
+
+# Tempi delle fasi di elaborazione: li riceve l'osservatore registrato (le metriche
+# dell'API) o, nei processi del pool, la lista attiva di run_with_stage_times; i job
+# in background ricevono anche ogni fase conclusa tramite run_with_stage_events
+_stage_observer = None
+_stage_local = threading.local()
+
+class JobCancelled(Exception):
+    """Analisi interrotta su richiesta al termine di una fase"""
+
+def set_stage_observer(observer):
+    """Registra la funzione observer(fase, secondi) chiamata alla fine di ogni fase"""
+    global _stage_observer
+    _stage_observer = observer
+
+@contextmanager
+def stage_timer(stage: str):
+    """Misura una fase; usabile anche come decoratore"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        collected = getattr(_stage_local, 'times', None)
+        if collected is not None:
+            collected.append((stage, elapsed))
+        elif _stage_observer is not None:
+            _stage_observer(stage, elapsed)
+    # Solo le fasi concluse senza errori sono inviate ai job
+    listener = getattr(_stage_local, 'listener', None)
+    if listener is not None:
+        listener(stage, elapsed)
+
+def run_with_stage_times(func, *args) -> tuple:
     """
-    Process STL file and return volume, vertices and dimensions for visualization
+    Esegue func(*args) raccogliendo i tempi delle fasi, per le chiamate nel pool di
+    processi dove l'osservatore del processo principale non è disponibile
+
+    Returns:
+        tuple: (risultato, lista di coppie (fase, secondi))
+    """
+    previous = getattr(_stage_local, 'times', None)
+    _stage_local.times = []
+    try:
+        return func(*args), _stage_local.times
+    finally:
+        _stage_local.times = previous
+
+def run_with_stage_events(func, events, cancel, *args) -> tuple:
+    """
+    Come run_with_stage_times, per i job in background: ogni fase conclusa è inviata
+    subito con events.put((fase, secondi)) e, se cancel.is_set(), l'esecuzione si
+    interrompe con JobCancelled. events e cancel sono proxy di multiprocessing.Manager
+    (Queue ed Event), utilizzabili dai processi del pool.
+    """
+    def listener(stage: str, elapsed: float):
+        events.put((stage, elapsed))
+        if cancel.is_set():
+            raise JobCancelled(f"Annullato dopo la fase {stage}")
+
+    if cancel.is_set():
+        raise JobCancelled("Annullato prima dell'avvio")
+    previous = getattr(_stage_local, 'listener', None)
+    _stage_local.listener = listener
+    try:
+        return run_with_stage_times(func, *args)
+    finally:
+        _stage_local.listener = previous
+
+def report_stage_times(times: Iterable[tuple[str, float]]):
+    """Inoltra all'osservatore i tempi raccolti da run_with_stage_times"""
+    if _stage_observer is not None:
+        for stage, elapsed in times:
+            _stage_observer(stage, elapsed)
+
+# Layout di un record STL binario: normale, tre vertici (v0, v1, v2) e attributo
+STL_HEADER_SIZE = 80
+STL_COUNT_SIZE = 4
+STL_DTYPE = np.dtype([
+    ('normals', '<f4', (3,)),
+    ('vectors', '<f4', (3, 3)),
+    ('attr', '<u2'),
+])
+
+_ASCII_VERTEX_RE = re.compile(rb'vertex\s+(\S+\s+\S+\s+\S+)')
+
+def _is_binary_stl(file_content: bytes) -> bool:
+    """Un file è binario se la dimensione coincide con il numero di triangoli dichiarato"""
+    data_start = STL_HEADER_SIZE + STL_COUNT_SIZE
+    if len(file_content) < data_start:
+        return False
+    count = int.from_bytes(file_content[STL_HEADER_SIZE:data_start], 'little')
+    return len(file_content) == data_start + count * STL_DTYPE.itemsize
+
+def _parse_binary_stl(file_content: bytes) -> NDArray:
+    """Vista strutturata sui record binari, senza copiare i byte"""
+    data_start = STL_HEADER_SIZE + STL_COUNT_SIZE
+    count = int.from_bytes(file_content[STL_HEADER_SIZE:data_start], 'little')
+    return np.frombuffer(file_content, dtype=STL_DTYPE, count=count, offset=data_start)
+
+def _parse_ascii_stl(file_content: bytes) -> NDArray:
+    """Estrae le coordinate di tutte le righe 'vertex' in un unico passaggio"""
+    coords = _ASCII_VERTEX_RE.findall(file_content)
+    if not coords or len(coords) % 3:
+        raise ValueError("File STL ASCII non valido")
+    vectors = np.array(b' '.join(coords).split(), dtype=np.float32).reshape(-1, 3, 3)
+
+    records = np.zeros(len(vectors), dtype=STL_DTYPE)
+    records['vectors'] = vectors
+    return records
+
+def parse_stl(file_content: bytes) -> NDArray:
+    """
+    Legge un file STL (binario o ASCII) direttamente dalla memoria
 
     Args:
         file_content: Binary content of the STL file
 
     Returns:
-        tuple: (volume in cm³, vertices array for plotting, dimensions in mm)
+        NDArray: array strutturato con campi (normals, vectors, attr); per i file
+        binari è una vista in sola lettura su file_content
+    """
+    if _is_binary_stl(file_content):
+        records = _parse_binary_stl(file_content)
+    elif file_content.lstrip()[:5].lower() == b'solid':
+        records = _parse_ascii_stl(file_content)
+    else:
+        raise ValueError("Formato STL non riconosciuto o file troncato")
+
+    if len(records) == 0:
+        raise ValueError("Il file STL non contiene triangoli")
+    return records
+
+# Byte esaminati per distinguere un STL ASCII da uno binario quando la dimensione non è nota
+STL_SNIFF_SIZE = 1024
+_TEXT_BYTES = bytes(range(32, 127)) + b'\t\n\r\f\v'
+
+# Formati accettati oltre all'STL: compressi (gzip, zstd) e indicizzati (3MF, PLY, OBJ).
+# Limite alla dimensione decompressa contro i file malevoli e blocchi di decompressione
+MESH_EXTENSIONS = ('.stl', '.3mf', '.ply', '.obj', '.gz', '.zst')
+MAX_DECOMPRESSED_SIZE = int(os.getenv("MAX_DECOMPRESSED_MB", "2048")) * 1024 * 1024
+DECOMPRESS_CHUNK_SIZE = 4 * 1024 * 1024
+
+_GZIP_MAGIC = b'\x1f\x8b'
+_ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+_ZIP_MAGIC = b'PK\x03\x04'
+_OBJ_LINE_RE = re.compile(rb'^(?:v|vn|vt|f|o|g|s|mtllib|usemtl)[ \t]', re.M)
+
+def mesh_format(head: bytes, size: int | None = None) -> str:
+    """
+    Formato di un file mesh dai primi byte (almeno 84 per riconoscere gli STL binari)
+
+    Returns:
+        str: 'gzip', 'zstd', '3mf', 'ply', 'obj' o 'stl'
+    """
+    data_start = STL_HEADER_SIZE + STL_COUNT_SIZE
+    if size is not None and len(head) >= data_start:
+        count = int.from_bytes(head[STL_HEADER_SIZE:data_start], 'little')
+        if size == data_start + count * STL_DTYPE.itemsize:
+            return 'stl'
+    if head.startswith(_GZIP_MAGIC):
+        return 'gzip'
+    if head.startswith(_ZSTD_MAGIC):
+        return 'zstd'
+    if head.startswith(_ZIP_MAGIC):
+        return '3mf'
+    if head[:3] == b'ply' and head[3:4] in (b'\n', b'\r'):
+        return 'ply'
+    # Testo (anche UTF-8) con righe OBJ e non un STL ASCII
+    if head.lstrip()[:5].lower() != b'solid' and not head.translate(None, _TEXT_BYTES + bytes(range(128, 256))) \
+            and _OBJ_LINE_RE.search(head):
+        return 'obj'
+    return 'stl'
+
+def iter_decompressed(chunks: Iterable[bytes], compression: str,
+                      max_size: int = MAX_DECOMPRESSED_SIZE) -> Iterator[bytes]:
+    """
+    Decomprime uno stream gzip o zstd blocco per blocco, senza tenerlo tutto in memoria
+
+    Args:
+        chunks: Blocchi del file compresso
+        compression: 'gzip' o 'zstd' (da mesh_format)
+        max_size: Dimensione decompressa massima in byte
+
+    Yields:
+        bytes: blocchi decompressi di al più DECOMPRESS_CHUNK_SIZE byte
+    """
+    if compression == 'zstd':
+        if zstandard is None:
+            raise ValueError("File zstd non supportati: installare il pacchetto zstandard")
+        new_decoder = lambda: zstandard.ZstdDecompressor().decompressobj()
+    else:
+        new_decoder = lambda: zlib.decompressobj(zlib.MAX_WBITS | 16)
+
+    decoder = new_decoder()
+    pending = False  # un membro (gzip) o frame (zstd) è iniziato ma non è finito
+    total = 0
+    for chunk in chunks:
+        data = chunk
+        while data:
+            if compression == 'zstd':
+                out, data = decoder.decompress(data), b''
+            else:
+                out = decoder.decompress(data, DECOMPRESS_CHUNK_SIZE)
+                data = decoder.unconsumed_tail
+            pending = True
+            total += len(out)
+            if total > max_size:
+                raise ValueError("File decompresso troppo grande")
+            if out:
+                yield out
+            if decoder.eof:
+                # Più membri concatenati: si riparte dai byte non consumati
+                data = decoder.unused_data + data
+                decoder, pending = new_decoder(), False
+    if pending:
+        raise ValueError(f"File {compression} troncato")
+
+def decompress_mesh(file_content: bytes) -> bytes:
+    """Contenuto decompresso di un file gzip o zstd; gli altri file sono restituiti così come sono"""
+    compression = mesh_format(file_content[:STL_SNIFF_SIZE], len(file_content))
+    if compression not in ('gzip', 'zstd'):
+        return file_content
+    return b''.join(iter_decompressed([file_content], compression))
+
+# Unità del 3MF convertite in mm
+_3MF_UNITS = {'micron': 0.001, 'millimeter': 1.0, 'centimeter': 10.0, 'inch': 25.4, 'foot': 304.8, 'meter': 1000.0}
+
+def _3mf_transform(transform: str | None) -> NDArray | None:
+    """Matrice 4x3 del 3MF (righe: assi x, y, z e traslazione) o None se identità"""
+    if not transform:
+        return None
+    return np.array(transform.split(), dtype=np.float64).reshape(4, 3)
+
+def _parse_3mf(file_content: bytes) -> NDArray:
+    """
+    Triangoli di tutti gli oggetti della build di un 3MF, con trasformazioni e componenti
+
+    Il modello XML è letto in streaming dallo ZIP con iterparse; vertici e indici
+    sono convertiti in array per oggetto e i triangoli ricavati per indicizzazione.
+    """
+    with zipfile.ZipFile(io.BytesIO(file_content)) as archive:
+        models = [name for name in archive.namelist() if name.lower().endswith('.model')]
+        if not models:
+            raise ValueError("Nessun modello 3D nel file 3MF")
+        main = '3D/3dmodel.model' if '3D/3dmodel.model' in models else models[0]
+
+        scale = 1.0
+        objects = {}  # id -> (vertici, facce, componenti)
+        items = []  # (id oggetto, trasformazione)
+        vertices, faces, components = [], [], []
+        with archive.open(main) as stream:
+            for event, element in ElementTree.iterparse(stream, events=('start', 'end')):
+                tag = element.tag.rsplit('}', 1)[-1]
+                attrib = element.attrib
+                if event == 'start':
+                    if tag == 'model':
+                        scale = _3MF_UNITS.get(attrib.get('unit', 'millimeter'), 1.0)
+                    elif tag == 'object':
+                        vertices, faces, components = [], [], []
+                    continue
+                if tag == 'vertex':
+                    vertices += (attrib['x'], attrib['y'], attrib['z'])
+                elif tag == 'triangle':
+                    faces += (attrib['v1'], attrib['v2'], attrib['v3'])
+                elif tag == 'component':
+                    components.append((attrib['objectid'], _3mf_transform(attrib.get('transform'))))
+                elif tag == 'object':
+                    objects[attrib['id']] = (
+                        np.array(vertices, dtype=np.float64).reshape(-1, 3),
+                        np.array(faces, dtype=np.int64).reshape(-1, 3),
+                        components
+                    )
+                elif tag == 'item':
+                    items.append((attrib['objectid'], _3mf_transform(attrib.get('transform'))))
+                if tag in ('vertex', 'triangle', 'component', 'object'):
+                    element.clear()
+
+    def resolve(object_id: str, depth: int = 0) -> list[NDArray]:
+        if object_id not in objects or depth > 16:
+            raise ValueError(f"Oggetto 3MF {object_id} non valido")
+        obj_vertices, obj_faces, obj_components = objects[object_id]
+        if len(obj_faces) and (obj_faces.min() < 0 or obj_faces.max() >= len(obj_vertices)):
+            raise ValueError(f"Indici dei vertici fuori range nell'oggetto 3MF {object_id}")
+        parts = [obj_vertices[obj_faces]] if len(obj_faces) else []
+        for component_id, transform in obj_components:
+            parts += [_apply_transform(part, transform) for part in resolve(component_id, depth + 1)]
+        return parts
+
+    # Senza build si prendono gli oggetti non usati come componenti
+    if not items:
+        used = {cid for _, _, obj_components in objects.values() for cid, _ in obj_components}
+        items = [(object_id, None) for object_id in objects if object_id not in used]
+    parts = [_apply_transform(part, transform) for object_id, transform in items for part in resolve(object_id)]
+    if not parts:
+        raise ValueError("Il file 3MF non contiene triangoli")
+    return (np.concatenate(parts) * scale).astype(np.float32)
+
+def _apply_transform(triangles: NDArray, transform: NDArray | None) -> NDArray:
+    if transform is None:
+        return triangles
+    return triangles @ transform[:3] + transform[3]
+
+def _fan_triangulate(indices: NDArray, counts: NDArray) -> NDArray:
+    """Facce poligonali (indici concatenati, vertici per faccia) -> triangoli a ventaglio (m, 3)"""
+    if np.any(counts < 3):
+        raise ValueError("Faccia con meno di tre vertici")
+    first = np.cumsum(counts) - counts
+    per_face = counts - 2
+    face = np.repeat(np.arange(len(counts)), per_face)
+    step = np.arange(len(face)) - np.repeat(np.cumsum(per_face) - per_face, per_face) + 1
+    base = first[face]
+    return np.stack([indices[base], indices[base + step], indices[base + step + 1]], axis=1)
+
+# Tipi scalari del PLY
+_PLY_TYPES = {
+    'char': 'i1', 'int8': 'i1', 'uchar': 'u1', 'uint8': 'u1',
+    'short': 'i2', 'int16': 'i2', 'ushort': 'u2', 'uint16': 'u2',
+    'int': 'i4', 'int32': 'i4', 'uint': 'u4', 'uint32': 'u4',
+    'float': 'f4', 'float32': 'f4', 'double': 'f8', 'float64': 'f8',
+}
+
+def _parse_ply(file_content: bytes) -> NDArray:
+    """
+    Triangoli di un PLY binario (little o big endian)
+
+    Vertici e facce sono letti con np.frombuffer; se tutte le facce sono triangoli
+    la lettura è un'unica vista a record fissi, altrimenti le facce sono lette in
+    sequenza e triangolate a ventaglio.
     """
+    end = file_content.find(b'end_header')
+    if end < 0:
+        raise ValueError("Intestazione PLY non valida")
+    body = file_content.index(b'\n', end) + 1
+    header = file_content[:end].decode('ascii', 'replace').split('\n')
+
+    byte_order = None
+    elements = []  # [nome, numero, [(nome, tipo) o (nome, tipo conteggio, tipo elemento)]]
+    for line in header:
+        words = line.split()
+        if not words:
+            continue
+        if words[0] == 'format':
+            byte_order = {'binary_little_endian': '<', 'binary_big_endian': '>'}.get(words[1])
+            if byte_order is None:
+                raise ValueError("PLY ASCII non supportato: esportare il file in formato binario")
+        elif words[0] == 'element':
+            elements.append([words[1], int(words[2]), []])
+        elif words[0] == 'property' and elements:
+            if words[1] == 'list':
+                elements[-1][2].append((words[4], _PLY_TYPES[words[2]], _PLY_TYPES[words[3]]))
+            else:
+                elements[-1][2].append((words[2], _PLY_TYPES[words[1]]))
+
+    offset = body
+    vertices = faces = None
+    for name, count, properties in elements:
+        lists = [p for p in properties if len(p) == 3]
+        if not lists:
+            dtype = np.dtype([(p[0], byte_order + p[1]) for p in properties])
+            data = np.frombuffer(file_content, dtype=dtype, count=count, offset=offset)
+            offset += count * dtype.itemsize
+            if name == 'vertex':
+                vertices = np.stack([data['x'], data['y'], data['z']], axis=1).astype(np.float64)
+            continue
+        if name != 'face' or len(lists) != 1:
+            raise ValueError(f"Elemento PLY {name} non supportato")
+
+        # Caso comune: solo triangoli, record di dimensione fissa
+        fields = [(p[0], byte_order + p[1]) if len(p) == 2 else ('count', byte_order + p[1]) for p in properties]
+        list_index = next(i for i, p in enumerate(properties) if len(p) == 3)
+        fields.insert(list_index + 1, ('indices', byte_order + lists[0][2], (3,)))
+        dtype = np.dtype(fields)
+        data = None
+        if offset + count * dtype.itemsize <= len(file_content):
+            data = np.frombuffer(file_content, dtype=dtype, count=count, offset=offset)
+            if not np.all(data['count'] == 3):
+                data = None
+        if data is not None:
+            faces = data['indices'].astype(np.int64)
+            offset += count * dtype.itemsize
+            continue
+
+        # Poligoni misti: lettura sequenziale dei conteggi
+        count_type = np.dtype(byte_order + lists[0][1])
+        index_type = np.dtype(byte_order + lists[0][2])
+        before = sum(np.dtype(p[1]).itemsize for p in properties[:list_index])
+        after = sum(np.dtype(p[1]).itemsize for p in properties[list_index + 1:])
+        counts = np.empty(count, dtype=np.int64)
+        starts = np.empty(count, dtype=np.int64)
+        for i in range(count):
+            position = offset + before
+            counts[i] = np.frombuffer(file_content, dtype=count_type, count=1, offset=position)[0]
+            starts[i] = position + count_type.itemsize
+            offset = starts[i] + counts[i] * index_type.itemsize + after
+        # Gli indici di ogni faccia sono contigui: li si raccoglie con un'unica gather sui byte
+        sizes = counts * index_type.itemsize
+        byte_index = np.repeat(starts - (np.cumsum(sizes) - sizes), sizes) + np.arange(sizes.sum())
+        raw = np.frombuffer(file_content, dtype=np.uint8)
+        indices = raw[byte_index].view(index_type).astype(np.int64)
+        faces = _fan_triangulate(indices, counts)
+
+    if vertices is None or faces is None or len(faces) == 0:
+        raise ValueError("Il file PLY non contiene triangoli")
+    if faces.min() < 0 or faces.max() >= len(vertices):
+        raise ValueError("Indici dei vertici fuori range nel file PLY")
+    return vertices[faces].astype(np.float32)
+
+_OBJ_VERTEX_RE = re.compile(rb'^v[ \t]+(\S+[ \t]+\S+[ \t]+\S+)', re.M)
+_OBJ_FACE_RE = re.compile(rb'^f[ \t]+([^\r\n]+)', re.M)
+_OBJ_REFERENCE_RE = re.compile(rb'/\S*')
+
+def _parse_obj(file_content: bytes) -> NDArray:
+    """
+    Triangoli di un OBJ: vertici e facce estratti con una regex per tipo di riga,
+    riferimenti a texture e normali scartati e poligoni triangolati a ventaglio
+    """
+    coords = _OBJ_VERTEX_RE.findall(file_content)
+    if not coords:
+        raise ValueError("Il file OBJ non contiene vertici")
+    vertices = np.array(b' '.join(coords).split(), dtype=np.float64).reshape(-1, 3)
+
+    rows = _OBJ_REFERENCE_RE.sub(b'', b'\n'.join(_OBJ_FACE_RE.findall(file_content))).split(b'\n')
+    counts = np.array([len(row.split()) for row in rows], dtype=np.int64)
+    indices = np.array(b' '.join(rows).split(), dtype=np.int64)
+    if len(indices) == 0:
+        raise ValueError("Il file OBJ non contiene facce")
+
+    if np.any(indices < 0):
+        # Indici relativi: contano all'indietro dai vertici definiti prima della faccia
+        vertex_positions = np.array([m.start() for m in _OBJ_VERTEX_RE.finditer(file_content)])
+        face_positions = np.array([m.start() for m in _OBJ_FACE_RE.finditer(file_content)])
+        defined = np.repeat(np.searchsorted(vertex_positions, face_positions), counts)
+        indices = np.where(indices < 0, indices + defined, indices - 1)
+    else:
+        indices -= 1
+
+    faces = _fan_triangulate(indices, counts)
+    if faces.min() < 0 or faces.max() >= len(vertices):
+        raise ValueError("Indici dei vertici fuori range nel file OBJ")
+    return vertices[faces].astype(np.float32)
+
+def load_mesh(file_content: bytes) -> NDArray:
+    """
+    Triangoli (n, 3, 3) di un file STL, 3MF, PLY binario od OBJ, anche compresso gzip o zstd
+
+    Il formato è riconosciuto dal contenuto, non dal nome del file; per gli STL binari
+    il risultato è una vista in sola lettura su file_content.
+    """
+    file_format = mesh_format(file_content[:STL_SNIFF_SIZE], len(file_content))
+    if file_format in ('gzip', 'zstd'):
+        file_content = b''.join(iter_decompressed([file_content], file_format))
+        file_format = mesh_format(file_content[:STL_SNIFF_SIZE], len(file_content))
+        if file_format in ('gzip', 'zstd'):
+            raise ValueError("File compresso più volte")
+
+    if file_format == 'stl':
+        return parse_stl(file_content)['vectors']
+    loader = {'3mf': _parse_3mf, 'ply': _parse_ply, 'obj': _parse_obj}[file_format]
     try:
-        # Create a temporary file
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.stl') as tmp_file:
-            # Write the binary content to the temporary file
-            tmp_file.write(file_content)
-            tmp_file.flush()
-            tmp_file_path = tmp_file.name
+        return loader(file_content)
+    except (KeyError, IndexError, zipfile.BadZipFile, ElementTree.ParseError) as e:
+        raise ValueError(f"File {file_format.upper()} non valido: {str(e)}")
 
-        try:
-            # Load STL file from the temporary path
-            stl_mesh = mesh.Mesh.from_file(tmp_file_path)
+def mesh_volume(triangles: NDArray) -> float:
+    """
+    Volume con segno (mm³) come somma dei tetraedri rispetto all'origine
 
-            # Calculate volume (converts from mm³ to cm³)
-            volume = abs(stl_mesh.get_mass_properties()[0]) / 1000
+    Il prodotto vettoriale è calcolato in float64, a blocchi: in float32 i termini dei
+    pezzi lontani dall'origine si cancellano male e il volume perde cifre significative.
+    """
+    total = 0.0
+    for start in range(0, len(triangles), MESH_CHUNK_SIZE):
+        chunk = np.asarray(triangles[start:start + MESH_CHUNK_SIZE], dtype=np.float64)
+        total += float(np.einsum('ij,ij->', chunk[:, 0], np.cross(chunk[:, 1], chunk[:, 2])))
+    return total / 6.0
 
-            # Get vertices for visualization
-            vertices = stl_mesh.vectors.reshape(-1, 3)
+# Triangoli letti per blocco nei calcoli a memoria costante
+MESH_CHUNK_SIZE = 500_000
 
-            # Calculate dimensions in mm
-            dimensions = {
-                'width': round(np.max(vertices[:, 0]) - np.min(vertices[:, 0]), 2),
-                'depth': round(np.max(vertices[:, 1]) - np.min(vertices[:, 1]), 2),
-                'height': round(np.max(vertices[:, 2]) - np.min(vertices[:, 2]), 2)
-            }
+class MeshAccumulator:
+    """
+    Proprietà di massa di una mesh accumulate blocco per blocco in float64
 
-            return volume, vertices, dimensions
-        finally:
-            # Clean up the temporary file
-            if os.path.exists(tmp_file_path):
-                os.unlink(tmp_file_path)
+    Volume con segno (somma dei tetraedri origine-faccia), area superficiale,
+    baricentro del solido, bounding box e numero di triangoli: i blocchi possono
+    arrivare da uno stream, da un memmap o da un array in memoria.
+    """
+
+    def __init__(self):
+        self.triangle_count = 0
+        self.signed_volume = 0.0  # mm³
+        self.surface_area = 0.0  # mm²
+        self.lower = np.full(3, np.inf)
+        self.upper = np.full(3, -np.inf)
+        self._moment = np.zeros(3)  # somma di volume × baricentro dei tetraedri
+
+    def update(self, vectors: NDArray):
+        """Aggiunge un blocco di triangoli (n, 3, 3)"""
+        if len(vectors) == 0:
+            return
+        vectors = np.asarray(vectors, dtype=np.float64)
+        v0, v1, v2 = vectors[:, 0], vectors[:, 1], vectors[:, 2]
+        # v0 · ((v1 - v0) × (v2 - v0)) = v0 · (v1 × v2): una sola normale per area e volume
+        normal = np.cross(v1 - v0, v2 - v0)
+        tetra = np.einsum('ij,ij->i', v0, normal) / 6
+
+        self.triangle_count += len(vectors)
+        self.signed_volume += float(tetra.sum())
+        self.surface_area += float(0.5 * np.sqrt(np.einsum('ij,ij->i', normal, normal)).sum())
+        self._moment += tetra @ (v0 + v1 + v2) / 4
+        lower, upper = _axis_bounds(vectors.reshape(-1, 3))
+        self.lower = np.minimum(self.lower, lower)
+        self.upper = np.maximum(self.upper, upper)
+
+    @property
+    def volume(self) -> float:
+        """Volume in cm³"""
+        return abs(self.signed_volume) / 1000
+
+    @property
+    def centroid(self) -> list[float]:
+        """Baricentro del solido in mm (centro del bounding box per mesh senza volume)"""
+        if abs(self.signed_volume) > 1e-12:
+            centroid = self._moment / self.signed_volume
+        else:
+            centroid = (self.lower + self.upper) / 2
+        return [round(float(c), 3) for c in centroid]
+
+    @property
+    def dimensions(self) -> dict:
+        size = self.upper - self.lower
+        return {
+            'width': round(float(size[0]), 2),
+            'depth': round(float(size[1]), 2),
+            'height': round(float(size[2]), 2)
+        }
+
+def mesh_properties(triangles: NDArray, chunk_size: int | None = None) -> MeshAccumulator:
+    """Proprietà di massa calcolate a blocchi di chunk_size triangoli"""
+    chunk_size = chunk_size or MESH_CHUNK_SIZE
+    accumulator = MeshAccumulator()
+    for start in range(0, len(triangles), chunk_size):
+        accumulator.update(triangles[start:start + chunk_size])
+    return accumulator
+
+class StreamingSTLParser:
+    """
+    Parser STL (binario o ASCII) incrementale, per file che arrivano a blocchi
+
+    Ogni blocco passato a feed aggiorna hash del contenuto, numero di triangoli,
+    volume con segno, bounding box e impronta sul piatto; in memoria resta solo il
+    residuo di un record (binario) o di una faccetta (ASCII) e l'inviluppo degli
+    angoli dell'impronta, per cui la memoria non dipende dalla dimensione del file.
+    Il volume è quello della mesh così com'è, senza riparazione.
+
+    Args:
+        expected_size: Dimensione totale del file, se nota: permette di riconoscere
+            i file binari con un header che inizia per 'solid' con la stessa regola
+            di parse_stl
+        ascii_vectors: File binario in cui scrivere i triangoli di uno STL ASCII come
+            float32 (n, 3, 3), da rileggere tramite memmap senza riconvertire il testo
+    """
+
+    def __init__(self, expected_size: int | None = None, ascii_vectors: BinaryIO | None = None):
+        self.expected_size = expected_size
+        self.ascii_vectors = ascii_vectors
+        self.format = None
+        self.size = 0
+        self.declared_count = None
+        self._hash = hashlib.sha256()
+        self._buffer = bytearray()
+        self._mesh = MeshAccumulator()
+        self._corners = []
+        self._corner_count = 0
+
+    def _update(self, vectors: NDArray):
+        self._mesh.update(vectors)
+        corners = _footprint_corners(vectors)
+        self._corners.append(corners)
+        self._corner_count += len(corners)
+        # L'inviluppo degli angoli già visti li sostituisce: stessa impronta, memoria limitata
+        if self._corner_count > 8 * FOOTPRINT_BINS:
+            self._corners = [_convex_hull(np.concatenate(self._corners))]
+            self._corner_count = len(self._corners[0])
+
+    def _detect_format(self, final: bool = False):
+        head = bytes(self._buffer[:STL_SNIFF_SIZE])
+        data_start = STL_HEADER_SIZE + STL_COUNT_SIZE
+        if self.expected_size is not None and len(head) >= data_start:
+            count = int.from_bytes(head[STL_HEADER_SIZE:data_start], 'little')
+            binary = self.expected_size == data_start + count * STL_DTYPE.itemsize
+        elif len(head) < STL_SNIFF_SIZE and not final:
+            return
+        else:
+            # Un file binario ha quasi sempre byte non testuali tra conteggio e primi vertici
+            binary = not (head.lstrip()[:5].lower() == b'solid' and not head.translate(None, _TEXT_BYTES))
+        self.format = 'binary' if binary else 'ascii'
+
+    @property
+    def triangle_count(self) -> int:
+        return self._mesh.triangle_count
+
+    def _consume_binary(self):
+        data_start = STL_HEADER_SIZE + STL_COUNT_SIZE
+        if self.declared_count is None:
+            if len(self._buffer) < data_start:
+                return
+            self.declared_count = int.from_bytes(self._buffer[STL_HEADER_SIZE:data_start], 'little')
+            del self._buffer[:data_start]
+
+        # I byte oltre il numero di triangoli dichiarato vengono ignorati
+        remaining = self.declared_count - self.triangle_count
+        n = min(len(self._buffer) // STL_DTYPE.itemsize, remaining)
+        if n == 0:
+            if remaining == 0:
+                self._buffer.clear()
+            return
+        used = n * STL_DTYPE.itemsize
+        data = bytes(self._buffer[:used])
+        del self._buffer[:used]
+        self._update(np.frombuffer(data, dtype=STL_DTYPE)['vectors'])
+
+    def _consume_ascii(self, final: bool = False):
+        # Si elaborano solo faccette complete: il resto attende il blocco successivo
+        end = len(self._buffer) if final else self._buffer.rfind(b'endloop')
+        if end <= 0:
+            return
+        data = bytes(self._buffer[:end])
+        del self._buffer[:end]
+        coords = _ASCII_VERTEX_RE.findall(data)
+        if len(coords) % 3:
+            raise ValueError("File STL ASCII non valido")
+        if coords:
+            vectors = np.array(b' '.join(coords).split(), dtype=np.float32).reshape(-1, 3, 3)
+            if self.ascii_vectors is not None:
+                self.ascii_vectors.write(vectors.tobytes())
+            self._update(vectors)
+
+    def feed(self, chunk: bytes):
+        """Aggiunge un blocco del file"""
+        self._hash.update(chunk)
+        self.size += len(chunk)
+        self._buffer += chunk
+        if self.format is None:
+            self._detect_format()
+        if self.format == 'binary':
+            self._consume_binary()
+        elif self.format == 'ascii':
+            self._consume_ascii()
+
+    def finish(self) -> dict:
+        """
+        Chiude il parsing dopo l'ultimo blocco
 
+        Returns:
+            dict: hash del contenuto, dimensione in byte, formato, numero di triangoli,
+                volume in cm³, dimensioni in mm, intervallo di z in mm, area in mm²,
+                baricentro in mm e inviluppo convesso dell'impronta
+        """
+        if self.format is None:
+            self._detect_format(final=True)
+        if self.format == 'binary':
+            self._consume_binary()
+            if self.declared_count is None or self.triangle_count < self.declared_count:
+                raise ValueError("File STL binario troncato")
+        else:
+            self._consume_ascii(final=True)
+        if self.triangle_count == 0:
+            raise ValueError("Il file STL non contiene triangoli")
+
+        return {
+            'hash': self._hash.hexdigest(),
+            'size': self.size,
+            'format': self.format,
+            'triangle_count': self.triangle_count,
+            'volume': self._mesh.volume,
+            'dimensions': self._mesh.dimensions,
+            'z_range': (float(self._mesh.lower[2]), float(self._mesh.upper[2])),
+            'surface_area': round(self._mesh.surface_area, 2),
+            'centroid': self._mesh.centroid,
+            'footprint': _hull_from_corners(np.concatenate(self._corners))
+        }
+
+# Parametri del modello di tempo per layer
+SLICE_RESOLUTION = 0.05  # mm, passo del profilo salvato nell'analisi
+MAX_SLICES = 8000  # limite ai campioni del profilo per pezzi molto alti
+SLICE_CHUNK_SIZE = 250_000  # triangoli elaborati per blocco
+LINE_WIDTH = 0.4  # mm
+PERIMETER_COUNT = 2
+INFILL_DENSITY = 0.2
+LAYER_CHANGE_TIME = 2  # secondi per layer per movimenti
+
+def _slice_chunk(triangles: NDArray, z_min: float, layer_height: float, area: NDArray, perimeter: NDArray):
+    """Accumula area e perimetro delle sezioni di un blocco di triangoli"""
+    n_layers = len(area)
+    normals = np.cross(triangles[:, 1] - triangles[:, 0], triangles[:, 2] - triangles[:, 0])
+
+    # Vertici ordinati per z: a <= b <= c
+    order = np.argsort(triangles[:, :, 2], axis=1)
+    ordered = np.take_along_axis(triangles, order[:, :, None], axis=1)
+    a, b, c = ordered[:, 0], ordered[:, 1], ordered[:, 2]
+
+    # Piani z_k = z_min + (k + 0.5) * h con a_z <= z_k < c_z: intervallo di layer di ogni triangolo
+    k_lo = np.maximum(np.ceil((a[:, 2] - z_min) / layer_height - 0.5).astype(np.int64), 0)
+    k_hi = np.minimum(np.ceil((c[:, 2] - z_min) / layer_height - 0.5).astype(np.int64) - 1, n_layers - 1)
+    counts = np.maximum(k_hi - k_lo + 1, 0)
+    total = int(counts.sum())
+    if total == 0:
+        return
+
+    # Una riga per ogni coppia (triangolo, layer) intersecata
+    tri_idx = np.repeat(np.arange(len(triangles)), counts)
+    offsets = np.cumsum(counts) - counts
+    layer = k_lo[tri_idx] + np.arange(total) - offsets[tri_idx]
+    z = z_min + (layer + 0.5) * layer_height
+    a, b, c = a[tri_idx], b[tri_idx], c[tri_idx]
+
+    # Un estremo del segmento sta sul lato a-c, l'altro su a-b o b-c
+    p1 = a + ((z - a[:, 2]) / (c[:, 2] - a[:, 2]))[:, None] * (c - a)
+    lower = (z < b[:, 2])[:, None]
+    start = np.where(lower, a, b)
+    end = np.where(lower, b, c)
+    p2 = start + ((z - start[:, 2]) / (end[:, 2] - start[:, 2]))[:, None] * (end - start)
+
+    # Orienta i segmenti in senso antiorario usando la normale della faccia
+    d = p2 - p1
+    n = normals[tri_idx]
+    sign = np.where(d[:, 1] * n[:, 0] - d[:, 0] * n[:, 1] < 0, -1.0, 1.0)
+    shoelace = sign * (p1[:, 0] * p2[:, 1] - p2[:, 0] * p1[:, 1])
+
+    area += np.bincount(layer, weights=shoelace, minlength=n_layers) / 2
+    perimeter += np.bincount(layer, weights=np.hypot(d[:, 0], d[:, 1]), minlength=n_layers)
+
+def slice_mesh(triangles: NDArray, layer_height: float, z_range: tuple[float, float] | None = None) -> dict:
+    """
+    Seziona la mesh con tutti i piani di layer, senza cicli Python per layer
+
+    Args:
+        triangles: Array (n, 3, 3) dei vertici in mm, anche su memmap: è letto a blocchi
+        layer_height: Altezza layer in mm
+        z_range: Quote minima e massima della mesh, se già note
+
+    Returns:
+        dict: quote dei piani 'z', 'area' delle sezioni in mm², 'perimeter' in mm,
+        e i limiti 'z_min'/'z_max' della mesh
+    """
+    if z_range is None:
+        z_range = (triangles[:, :, 2].min(), triangles[:, :, 2].max())
+    z_min, z_max = float(z_range[0]), float(z_range[1])
+    n_layers = max(1, int(np.ceil((z_max - z_min) / layer_height)))
+    area = np.zeros(n_layers)
+    perimeter = np.zeros(n_layers)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for start in range(0, len(triangles), SLICE_CHUNK_SIZE):
+            chunk = np.asarray(triangles[start:start + SLICE_CHUNK_SIZE], dtype=np.float64)
+            _slice_chunk(chunk, z_min, layer_height, area, perimeter)
+
+    return {
+        'z': z_min + (np.arange(n_layers) + 0.5) * layer_height,
+        'area': np.abs(area),
+        'perimeter': perimeter,
+        'z_min': z_min,
+        'z_max': z_max
+    }
+
+@stage_timer('slice_profile')
+def slice_profile(triangles: NDArray, z_range: tuple[float, float] | None = None) -> dict:
+    """Profilo di sezione a passo fine, ricampionato poi per ogni altezza layer"""
+    if z_range is None:
+        z_range = (triangles[:, :, 2].min(), triangles[:, :, 2].max())
+    height = float(z_range[1]) - float(z_range[0])
+    profile = slice_mesh(triangles, max(SLICE_RESOLUTION, height / MAX_SLICES), z_range)
+    for key in ('z', 'area', 'perimeter'):
+        profile[key] = profile[key].astype(np.float32)
+    return profile
+
+# Riparazione della mesh prima dell'analisi (disattivabile per file già verificati)
+STL_REPAIR = os.getenv("STL_REPAIR", "1") != "0"
+
+@stage_timer('process_stl')
+def process_stl(file_content: bytes, repair: bool = STL_REPAIR) -> tuple[float, NDArray, dict, dict | None]:
+    """
+    Process a mesh file and return volume, triangles, dimensions and repair report
+
+    I triangoli sono una vista (n, 3, 3), non l'array piatto di vertici restituito
+    in passato: per i vertici usare triangles.reshape(-1, 3).
+
+    Args:
+        file_content: Binary content of the mesh file (formati di load_mesh)
+        repair: Valida e ripara la mesh (repair_mesh) prima di calcolare il volume
+
+    Returns:
+        tuple: (volume in cm³, triangles array (n, 3, 3) for plotting, dimensions in mm,
+            report di repair_mesh o None)
+    """
+    try:
+        # Vista (n, 3, 3) sui vertici dei triangoli, nessuna copia per gli STL binari
+        with stage_timer('load_mesh'):
+            triangles = load_mesh(file_content)
+
+        # Con facce invertite, duplicate o degeneri il volume con segno non ha senso:
+        # la mesh riparata ha un verso coerente e volume positivo per ogni componente
+        report = None
+        if repair:
+            triangles, report = repair_mesh(triangles)
+            if report['repaired'] or not report['watertight']:
+                logger.warning("Mesh non valida: %s", report)
+
+        # Calculate volume (converts from mm³ to cm³)
+        volume = abs(mesh_volume(triangles)) / 1000
+
+        # Calculate dimensions in mm
+        lower = triangles.min(axis=(0, 1))
+        upper = triangles.max(axis=(0, 1))
+        dimensions = {
+            'width': round(float(upper[0] - lower[0]), 2),
+            'depth': round(float(upper[1] - lower[1]), 2),
+            'height': round(float(upper[2] - lower[2]), 2)
+        }
+
+        return volume, triangles, dimensions, report
+
+    except JobCancelled:
+        raise
     except Exception as e:
         raise ValueError(f"Errore nel processare il file STL: {str(e)}")
 
-def estimate_print_time(volume: float, layer_height: float, velocita_stampa: float = 60) -> float:
+# Validazione e riparazione: bit per asse della quantizzazione con cui si saldano
+# i vertici e area sotto cui una faccia è considerata degenere
+WELD_BITS = 21
+DEGENERATE_AREA = 1e-10  # mm²
+
+def _group_keys(keys: NDArray) -> tuple[NDArray, NDArray, NDArray, NDArray]:
+    """
+    Raggruppa chiavi intere uguali con un solo argsort (quicksort, non stabile)
+
+    Returns:
+        tuple: (ordinamento, inizio di ogni gruppo nell'ordinamento, dimensione dei
+            gruppi, gruppo di ogni chiave)
+    """
+    order = np.argsort(keys)
+    sorted_keys = keys[order]
+    is_start = np.ones(len(keys), dtype=bool)
+    is_start[1:] = sorted_keys[1:] != sorted_keys[:-1]
+    starts = np.flatnonzero(is_start)
+    counts = np.diff(np.append(starts, len(keys)))
+    group = np.empty(len(keys), dtype=np.int64)
+    group[order] = np.cumsum(is_start) - 1
+    return order, starts, counts, group
+
+def _axis_bounds(points: NDArray) -> tuple[NDArray, NDArray]:
+    """Minimo e massimo per asse di punti (n, 3) contigui, a blocchi di 16 punti per riga"""
+    head = len(points) // 16 * 16
+    blocks = points[:head].reshape(-1, 48)
+    lower = np.vstack([blocks.min(axis=0, initial=np.inf).reshape(16, 3), points[head:]]).min(axis=0)
+    upper = np.vstack([blocks.max(axis=0, initial=-np.inf).reshape(16, 3), points[head:]]).max(axis=0)
+    return lower.astype(np.float64), upper.astype(np.float64)
+
+def weld_vertices(triangles: NDArray) -> tuple[NDArray, NDArray]:
+    """
+    Vertici unici e facce come indici (n, 3)
+
+    Le coordinate sono quantizzate su WELD_BITS bit per asse nel bounding box e
+    unite in una chiave int64: ordinare un solo array intero è molto più veloce di
+    np.unique(axis=0) sulle righe.
+    """
+    points = np.ascontiguousarray(triangles, dtype=np.float32).reshape(-1, 3)
+    lower, upper = _axis_bounds(points)
+    extent = np.maximum(upper - lower, 1e-12)
+    quantized = np.rint((points - lower) * ((2 ** WELD_BITS - 1) / extent)).astype(np.int64)
+    keys = (quantized[:, 0] << (2 * WELD_BITS)) | (quantized[:, 1] << WELD_BITS) | quantized[:, 2]
+    order, starts, _, group = _group_keys(keys)
+    return points[order[starts]], group.reshape(-1, 3)
+
+def _edge_groups(faces: NDArray, n_vertices: int) -> tuple[NDArray, NDArray, NDArray, NDArray]:
+    """Semispigoli (3 per faccia) raggruppati per spigolo non orientato, con il verso di percorrenza"""
+    start = faces.reshape(-1)
+    end = np.roll(faces, -1, axis=1).reshape(-1)
+    order, starts, counts, group = _group_keys(np.minimum(start, end) * n_vertices + np.maximum(start, end))
+    return order, starts, counts, start < end
+
+def _duplicate_faces(faces: NDArray) -> NDArray:
+    """
+    Maschera delle facce che ripetono una terna di vertici già vista, qualunque sia
+    il verso: il verso corretto viene poi ricavato dalle facce adiacenti
+    """
+    duplicate = np.zeros(len(faces), dtype=bool)
+    if len(faces) == 0:
+        return duplicate
+    ordered = np.sort(faces, axis=1)
+    order = np.lexsort((ordered[:, 2], ordered[:, 1], ordered[:, 0]))
+    sorted_faces = ordered[order]
+    duplicate[order[1:]] = np.all(sorted_faces[1:] == sorted_faces[:-1], axis=1)
+    return duplicate
+
+def _parity_union_find(n: int, a: NDArray, b: NDArray, parity: NDArray) -> tuple[NDArray, NDArray, int]:
+    """
+    Componenti connesse con parità: per ogni coppia (a, b), flip[a] ^ flip[b] deve
+    valere parity. Aggancio alla radice minore e pointer jumping, O(log n) passate.
+
+    Returns:
+        tuple: (radice di ogni nodo, flip rispetto alla radice, vincoli in conflitto)
+    """
+    parent = np.arange(n)
+    flip = np.zeros(n, dtype=bool)
+    constraints = (a, b, parity)
+    while True:
+        while True:
+            grandparent = parent[parent]
+            if np.array_equal(grandparent, parent):
+                break
+            flip ^= flip[parent]
+            parent = grandparent
+
+        root_a, root_b = parent[a], parent[b]
+        active = root_a != root_b
+        if not active.any():
+            break
+
+        # Solo i vincoli tra componenti ancora distinte restano per la passata successiva
+        a, b, parity = a[active], b[active], parity[active]
+        relation = flip[a] ^ flip[b] ^ parity
+        root_a, root_b = root_a[active], root_b[active]
+        high, low = np.maximum(root_a, root_b), np.minimum(root_a, root_b)
+        # Un solo vincolo per radice agganciata, scelto senza ordinare
+        winner = np.empty(n, dtype=np.int64)
+        winner[high] = np.arange(len(high))
+        chosen = winner[high] == np.arange(len(high))
+        parent[high[chosen]] = low[chosen]
+        flip[high[chosen]] = relation[chosen]
+
+    # I conflitti si contano su tutti i vincoli, anche quelli scartati nelle passate
+    # precedenti perché tra nodi già nella stessa componente
+    a, b, parity = constraints
+    return parent, flip, int(np.count_nonzero(flip[a] ^ flip[b] ^ parity))
+
+# Annidamento dei gusci: oltre questo numero di confronti punto-faccia (o celle
+# coperte dalle facce) si rinuncia alle cavità e il verso resta quello del file
+NESTING_MAX_TESTS = int(os.getenv("STL_NESTING_MAX_TESTS", "10000000"))
+# Prima riga: direzione dei raggi, generica perché un raggio parallelo agli assi
+# passerebbe sugli spigoli delle mesh allineate; le altre due: base del piano ortogonale
+_RAY_BASIS = np.linalg.qr(np.array([[1.0, 0.0, 0.0], [0.3741, 1.0, 0.0], [0.2168, 0.0, 1.0]]))[0].T
+
+def _covered_cells(first_cell: NDArray, spans: NDArray) -> tuple[NDArray, NDArray]:
+    """Celle di griglia coperte da ogni box: (box di ogni cella, coordinate della cella)"""
+    sizes = spans.prod(axis=1)
+    box = np.repeat(np.arange(len(spans)), sizes)
+    local = np.arange(sizes.sum()) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+    cells = np.empty((len(box), spans.shape[1]), dtype=np.int64)
+    for axis in range(spans.shape[1]):
+        span = spans[box, axis]
+        cells[:, axis] = first_cell[box, axis] + local % span
+        local = local // span
+    return box, cells
+
+def _matching_keys(keys: NDArray, queries: NDArray, limit: int | None = None) -> tuple[NDArray, NDArray] | None:
+    """
+    Coppie (query, chiave) con lo stesso valore, con un ordinamento e due ricerche binarie
+
+    Returns:
+        tuple: (indice della query, indice della chiave), o None oltre limit coppie
+    """
+    order = np.argsort(keys)
+    sorted_keys = keys[order]
+    first = np.searchsorted(sorted_keys, queries)
+    found = np.searchsorted(sorted_keys, queries, side='right') - first
+    total = int(found.sum())
+    if limit is not None and total > limit:
+        return None
+    query = np.repeat(np.arange(len(queries)), found)
+    key = order[np.repeat(first - (np.cumsum(found) - found), found) + np.arange(total)]
+    return query, key
+
+def _containment_pairs(points: NDArray, lower: NDArray, upper: NDArray) -> tuple[NDArray, NDArray]:
+    """
+    Coppie (esterno, interno) di box con il box interno contenuto in quello esterno
+
+    points[i] è un punto del box i. Su una griglia uniforme con circa una cella per
+    box, ogni box elenca le celle che copre e i punti che vi cadono: solo queste coppie
+    vengono confrontate, invece di tutte le n² possibili.
+    """
+    origin = lower.min(axis=0)
+    extent = np.maximum(upper.max(axis=0) - origin, 1e-9)
+    cell = np.cbrt(np.prod(extent) / len(points))
+    shape = (extent // cell).astype(np.int64) + 1
+    first_cell = ((lower - origin) // cell).astype(np.int64)
+    spans = ((upper - origin) // cell).astype(np.int64) - first_cell + 1
+    box, cells = _covered_cells(first_cell, spans)
+    point_cells = ((points - origin) // cell).astype(np.int64)
+    entry, inner = _matching_keys(np.ravel_multi_index(tuple(point_cells.T), shape),
+                                  np.ravel_multi_index(tuple(cells.T), shape))
+    outer = box[entry]
+    contained = (outer != inner) & np.all((lower[inner] >= lower[outer]) & (upper[inner] <= upper[outer]), axis=1)
+    return outer[contained], inner[contained]
+
+def _ray_parity(origins: NDArray, owner: NDArray, vertices: NDArray, faces: NDArray, face_owner: NDArray,
+                n_owners: int, limit: int) -> NDArray | None:
+    """
+    Per ogni raggio, se attraversa un numero dispari di facce del proprio guscio
+
+    Coordinate già ruotate con _RAY_BASIS: i raggi partono da origins lungo +x.
+    Ogni guscio ha una griglia nel piano (y, z) con circa una cella per faccia; con le
+    somme cumulate dei raggi per cella si scartano in O(1) le facce senza raggi nelle
+    celle che coprono, e le altre si confrontano solo con i raggi delle stesse celle.
+
+    Args:
+        origins: Origine di ogni raggio (r, 3)
+        owner: Guscio di ogni raggio
+        vertices: Vertici ruotati
+        faces: Facce dei gusci come indici nei vertici
+        face_owner: Guscio di ogni faccia
+        n_owners: Numero di gusci
+        limit: Massimo di celle coperte e di confronti raggio-faccia
+
+    Returns:
+        NDArray: parità per raggio, o None oltre limit
+    """
+    y, z = (np.ascontiguousarray(vertices[:, axis])[faces] for axis in (1, 2))
+    face_lower = np.stack([np.minimum(np.minimum(c[:, 0], c[:, 1]), c[:, 2]) for c in (y, z)], axis=1)
+    face_upper = np.stack([np.maximum(np.maximum(c[:, 0], c[:, 1]), c[:, 2]) for c in (y, z)], axis=1)
+    lower = np.full((n_owners, 2), np.inf)
+    upper = np.full((n_owners, 2), -np.inf)
+    for axis in range(2):
+        np.minimum.at(lower[:, axis], face_owner, face_lower[:, axis])
+        np.maximum.at(upper[:, axis], face_owner, face_upper[:, axis])
+    extent = np.maximum(upper - lower, 1e-9)
+    cell = np.sqrt(extent.prod(axis=1) / np.maximum(np.bincount(face_owner, minlength=n_owners), 1))
+    shape = (extent // cell[:, None]).astype(np.int64) + 1
+    offset = np.cumsum(shape.prod(axis=1)) - shape.prod(axis=1)
+    first_cell = ((face_lower - lower[face_owner]) // cell[face_owner, None]).astype(np.int64)
+    last_cell = ((face_upper - lower[face_owner]) // cell[face_owner, None]).astype(np.int64)
+
+    # I raggi fuori dalla griglia del proprio guscio non lo attraversano
+    ray_cells = ((origins[:, 1:] - lower[owner]) // cell[owner, None]).astype(np.int64)
+    on_grid = np.all((ray_cells >= 0) & (ray_cells < shape[owner]), axis=1)
+    ray_keys = np.where(on_grid, offset[owner] + ray_cells[:, 0] * shape[owner, 1] + ray_cells[:, 1], -1)
+
+    # Raggi per cella come somme cumulate (summed-area table) con una riga e una
+    # colonna di zeri in testa a ogni guscio
+    padded = shape + 1
+    padded_offset = np.cumsum(padded.prod(axis=1)) - padded.prod(axis=1)
+    table = np.bincount(padded_offset[owner[on_grid]] + (ray_cells[on_grid, 0] + 1) * padded[owner[on_grid], 1]
+                        + ray_cells[on_grid, 1] + 1, minlength=int(padded.prod(axis=1).sum()))
+    for shell in np.unique(owner[on_grid]):
+        block = table[padded_offset[shell]:padded_offset[shell] + padded[shell].prod()].reshape(padded[shell])
+        np.cumsum(block, axis=0, out=block)
+        np.cumsum(block, axis=1, out=block)
+    base, width = padded_offset[face_owner], padded[face_owner, 1]
+    y0, z0 = first_cell.T
+    y1, z1 = last_cell.T + 1
+    rays = (table[base + y1 * width + z1] - table[base + y0 * width + z1]
+            - table[base + y1 * width + z0] + table[base + y0 * width + z0])
+    candidates = np.flatnonzero(rays)
+
+    spans = last_cell[candidates] - first_cell[candidates] + 1
+    if spans.prod(axis=1).sum() > limit:
+        return None
+    entry_face, cells = _covered_cells(first_cell[candidates], spans)
+    entry_face = candidates[entry_face]
+    entry_keys = offset[face_owner[entry_face]] + cells[:, 0] * shape[face_owner[entry_face], 1] + cells[:, 1]
+    match = _matching_keys(ray_keys, entry_keys, limit)
+    if match is None:
+        return None
+
+    entry, ray = match
+    face = entry_face[entry]
+    x = np.ascontiguousarray(vertices[:, 0])
+    crossings = np.zeros(len(origins), dtype=np.int64)
+    for start in range(0, len(ray), MESH_CHUNK_SIZE):
+        r, f = ray[start:start + MESH_CHUNK_SIZE], face[start:start + MESH_CHUNK_SIZE]
+        dy, dz = y[f] - origins[r, 1, None], z[f] - origins[r, 2, None]
+        # Coordinate baricentriche (non normalizzate) dell'origine proiettata
+        weights = dy[:, [1, 2, 0]] * dz[:, [2, 0, 1]] - dz[:, [1, 2, 0]] * dy[:, [2, 0, 1]]
+        inside = np.all(weights > 0, axis=1) | np.all(weights < 0, axis=1)
+        total = np.where(inside, weights.sum(axis=1), 1.0)
+        hit = inside & ((weights * x[faces[f]]).sum(axis=1) / total > origins[r, 0])
+        crossings += np.bincount(r[hit], minlength=len(origins))
+    return crossings % 2 == 1
+
+def _nesting_depth(vertices: NDArray, faces: NDArray, root: NDArray, closed: NDArray) -> NDArray | None:
+    """
+    Per ogni componente chiusa, quante altre componenti chiuse la racchiudono
+
+    Due gusci chiusi che non si intersecano sono annidati se un punto dell'uno è
+    dentro l'altro: un raggio dal baricentro di una sua faccia attraversa l'altro un
+    numero dispari di volte. I raggi si lanciano solo per le coppie con un bounding
+    box contenuto nell'altro.
+
+    Args:
+        vertices: Vertici saldati
+        faces: Facce come indici nei vertici
+        root: Radice della componente di ogni faccia
+        closed: Per ogni faccia, se la sua componente è chiusa
+
+    Returns:
+        NDArray: profondità per radice (0 per le componenti aperte), o None se il
+            test richiede più di NESTING_MAX_TESTS confronti
+    """
+    depth = np.zeros(len(faces), dtype=np.int64)
+    shells = np.flatnonzero(closed & (root == np.arange(len(faces))))
+    if len(shells) < 2:
+        return depth
+
+    # Bounding box per componente senza ordinare le facce
+    closed_faces, closed_root = faces[closed], root[closed]
+    lower = np.full((len(faces), 3), np.inf, dtype=vertices.dtype)
+    upper = np.full((len(faces), 3), -np.inf, dtype=vertices.dtype)
+    for axis in range(3):
+        coordinate = np.ascontiguousarray(vertices[:, axis])
+        a, b, c = (coordinate[closed_faces[:, i]] for i in range(3))
+        np.minimum.at(lower[:, axis], closed_root, np.minimum(np.minimum(a, b), c))
+        np.maximum.at(upper[:, axis], closed_root, np.maximum(np.maximum(a, b), c))
+    points = vertices[faces[shells]].astype(np.float64).mean(axis=1)
+    outer, inner = _containment_pairs(points, lower[shells], upper[shells])
+    if not len(outer):
+        return depth
+
+    # Un raggio per coppia, contro le sole facce dei gusci esterni
+    shell_index = np.full(len(faces), -1)
+    shell_index[shells] = np.arange(len(shells))
+    is_outer = np.zeros(len(shells), dtype=bool)
+    is_outer[outer] = True
+    outer_faces = np.flatnonzero(closed)
+    outer_faces = outer_faces[is_outer[shell_index[root[outer_faces]]]]
+    enclosed = _ray_parity(points[inner] @ _RAY_BASIS.T, outer, vertices.astype(np.float64) @ _RAY_BASIS.T,
+                           faces[outer_faces], shell_index[root[outer_faces]], len(shells), NESTING_MAX_TESTS)
+    if enclosed is None:
+        return None
+    np.add.at(depth, shells[inner[enclosed]], 1)
+    return depth
+
+@stage_timer('repair_mesh')
+def repair_mesh(triangles: NDArray) -> tuple[NDArray, dict]:
+    """
+    Valida e ripara una mesh triangolare con sole primitive NumPy, in O(n log n)
+
+    Salda i vertici, elimina facce degeneri e duplicate, classifica gli spigoli
+    (aperti, manifold, non manifold) raggruppando le chiavi degli spigoli e orienta
+    le facce in modo coerente per componente, con il verso che dà volume positivo
+    (negativo per le cavità chiuse dentro un altro guscio).
+    I buchi non vengono chiusi: il report lo segnala.
+
+    Returns:
+        tuple: (triangoli riparati (m, 3, 3) float32, report)
+    """
+    n_input = len(triangles)
+    if n_input == 0:
+        raise ValueError("La mesh non contiene triangoli")
+    vertices, faces = weld_vertices(triangles)
+
+    # Normale non normalizzata: dà area e volume con segno di ogni faccia
+    v0, v1, v2 = (triangles[:, i].astype(np.float64) for i in range(3))
+    normal = np.cross(v1 - v0, v2 - v0)
+    area = 0.5 * np.sqrt(np.einsum('ij,ij->i', normal, normal))
+    volumes = np.einsum('ij,ij->i', v0, normal) / 6
+    del v0, v1, v2, normal
+
+    # Facce degeneri: vertici coincidenti dopo la saldatura o area nulla
+    collapsed = (faces[:, 0] == faces[:, 1]) | (faces[:, 1] == faces[:, 2]) | (faces[:, 0] == faces[:, 2])
+    degenerate = collapsed | (area <= DEGENERATE_AREA)
+    faces, volumes = faces[~degenerate], volumes[~degenerate]
+
+    order, starts, counts, forward = _edge_groups(faces, len(vertices))
+
+    # Le facce duplicate rendono non manifold i propri spigoli: si cercano solo lì
+    duplicates = 0
+    irregular = counts > 2
+    if irregular.any():
+        group_starts, group_counts = starts[irregular], counts[irregular]
+        offsets = np.cumsum(group_counts) - group_counts
+        halfedges = order[np.repeat(group_starts - offsets, group_counts) + np.arange(group_counts.sum())]
+        candidates = np.unique(halfedges // 3)
+        duplicate = candidates[_duplicate_faces(faces[candidates])]
+        if len(duplicate):
+            duplicates = len(duplicate)
+            keep = np.ones(len(faces), dtype=bool)
+            keep[duplicate] = False
+            faces, volumes = faces[keep], volumes[keep]
+            order, starts, counts, forward = _edge_groups(faces, len(vertices))
+
+    # Facce adiacenti lungo gli spigoli manifold: due semispigoli con lo stesso
+    # verso indicano facce con orientamento opposto
+    manifold = starts[counts == 2]
+    first, second = order[manifold], order[manifold + 1]
+    root, flip, conflicts = _parity_union_find(
+        len(faces), first // 3, second // 3, forward[first] == forward[second]
+    )
+
+    # Verso di ogni componente: volume positivo, ma negativo per le cavità, cioè i
+    # gusci chiusi racchiusi da un numero dispari di altri gusci
+    oriented = np.where(flip, -volumes, volumes)
+    component_volume = np.bincount(root, weights=oriented, minlength=len(faces))
+    halfedge_counts = np.empty(len(order), dtype=np.int64)
+    halfedge_counts[order] = np.repeat(counts, counts)
+    open_faces = np.any(halfedge_counts.reshape(-1, 3) != 2, axis=1)
+    closed = np.bincount(root, weights=open_faces, minlength=len(faces))[root] == 0
+    depth = _nesting_depth(vertices, faces, root, closed)
+    if depth is None:
+        # Troppi gusci annidati da verificare: ogni componente tiene il verso della
+        # maggioranza delle sue facce nel file, e il volume vale se il file è coerente
+        logger.warning("Annidamento dei gusci non verificato: oltre %s confronti", NESTING_MAX_TESTS)
+        majority = 2 * np.bincount(root, weights=flip, minlength=len(faces)) > np.bincount(root, minlength=len(faces))
+        flip ^= majority[root]
+    else:
+        flip ^= (component_volume < 0)[root] ^ (depth % 2 == 1)[root]
+    flipped = int(np.count_nonzero(flip))
+    if flipped:
+        faces[flip] = faces[flip][:, [0, 2, 1]]
+
+    open_edges = int(np.count_nonzero(counts == 1))
+    non_manifold_edges = int(np.count_nonzero(counts > 2))
+    report = {
+        'triangles': n_input,
+        'vertices': len(vertices),
+        'degenerate': int(np.count_nonzero(degenerate)),
+        'duplicates': duplicates,
+        'flipped': flipped,
+        'components': int(np.count_nonzero(root == np.arange(len(faces)))),
+        'open_edges': open_edges,
+        'non_manifold_edges': non_manifold_edges,
+        'non_orientable_edges': conflicts,
+        'watertight': open_edges == 0 and non_manifold_edges == 0,
+    }
+    report['repaired'] = bool(report['degenerate'] or duplicates or flipped)
+    return vertices[faces], report
+
+FOOTPRINT_BINS = 512  # colonne usate per ridurre i vertici prima dell'inviluppo convesso
+
+def _convex_hull(points: NDArray) -> NDArray:
+    """Inviluppo convesso 2D (monotone chain), vertici in senso antiorario"""
+    points = np.unique(points, axis=0)
+    if len(points) < 3:
+        return points
+
+    def half(sequence):
+        hull = []
+        for p in sequence:
+            while len(hull) >= 2 and (
+                (hull[-1][0] - hull[-2][0]) * (p[1] - hull[-2][1]) -
+                (hull[-1][1] - hull[-2][1]) * (p[0] - hull[-2][0])
+            ) <= 0:
+                hull.pop()
+            hull.append(p)
+        return hull[:-1]
+
+    pts = points.tolist()
+    return np.array(half(pts) + half(reversed(pts)))
+
+@stage_timer('footprint_hull')
+def footprint_hull(triangles: NDArray) -> NDArray:
+    """
+    Inviluppo convesso della proiezione della mesh sul piatto, in mm dall'angolo
+    minimo del bounding box
+
+    Per ogni colonna di FOOTPRINT_BINS si tengono solo y minima e massima agli estremi
+    della colonna: l'inviluppo risultante contiene quello esatto e ne differisce al
+    più di una colonna.
+    """
+    return _hull_from_corners(_footprint_corners(triangles))
+
+def _footprint_corners(triangles: NDArray) -> NDArray:
+    """Angoli (k, 2) dei rettangoli colonna per colonna che racchiudono la proiezione, in mm"""
+    x = triangles[:, :, 0].reshape(-1).astype(np.float64)
+    y = triangles[:, :, 1].reshape(-1).astype(np.float64)
+    x_min, x_max = x.min(), x.max()
+    bin_width = max((x_max - x_min) / FOOTPRINT_BINS, 1e-9)
+    bins = np.minimum(((x - x_min) / bin_width).astype(np.intp), FOOTPRINT_BINS - 1)
+
+    # Stesso dtype di y: ufunc.at resta sul percorso veloce
+    y_min = np.full(FOOTPRINT_BINS, np.inf)
+    y_max = np.full(FOOTPRINT_BINS, -np.inf)
+    np.minimum.at(y_min, bins, y)
+    np.maximum.at(y_max, bins, y)
+    used = np.flatnonzero(np.isfinite(y_min))
+
+    x0 = x_min + used * bin_width
+    x1 = np.minimum(x0 + bin_width, x_max)
+    y0, y1 = y_min[used], y_max[used]
+    return np.concatenate([
+        np.stack([x0, y0], 1), np.stack([x1, y0], 1), np.stack([x0, y1], 1), np.stack([x1, y1], 1)
+    ])
+
+def _hull_from_corners(corners: NDArray) -> NDArray:
+    """Inviluppo convesso degli angoli, riferito all'angolo minimo del bounding box"""
+    return _convex_hull(corners - corners.min(axis=0)).astype(np.float32)
+
+def analyze_stl(file_content: bytes) -> dict:
+    """
+    Analisi geometrica senza i vertici, adatta a essere eseguita in un processo separato
+
+    Args:
+        file_content: Binary content of the STL file
+
+    Returns:
+        dict: volume in cm³, dimensioni in mm, numero di triangoli, area in mm²,
+        baricentro in mm, profilo di sezione, inviluppo convesso dell'impronta sul
+        piatto e report della riparazione
+    """
+    volume, triangles, dimensions, report = process_stl(file_content)
+    mesh = mesh_properties(triangles)
+    return {
+        'volume': volume,
+        'dimensions': dimensions,
+        'triangle_count': len(triangles),
+        'surface_area': round(mesh.surface_area, 2),
+        'centroid': mesh.centroid,
+        'profile': slice_profile(triangles, (mesh.lower[2], mesh.upper[2])),
+        'footprint': footprint_hull(triangles),
+        'mesh_report': report
+    }
+
+# Oltre questa soglia di triangoli i file su disco sono analizzati a blocchi tramite
+# memmap invece di essere caricati interamente in memoria
+STL_OUT_OF_CORE_TRIANGLES = int(os.getenv("STL_OUT_OF_CORE_TRIANGLES", "2000000"))
+ASCII_BYTES_PER_TRIANGLE = 250  # stima per gli STL ASCII, che non dichiarano il numero di triangoli
+
+def stl_header_count(path: str) -> int | None:
+    """Numero di triangoli dichiarato da un STL binario su disco, None se il file non è binario"""
+    size = os.path.getsize(path)
+    if size < STL_HEADER_SIZE + STL_COUNT_SIZE:
+        return None
+    with open(path, 'rb') as f:
+        f.seek(STL_HEADER_SIZE)
+        count = int(np.frombuffer(f.read(STL_COUNT_SIZE), dtype='<u4')[0])
+    if size != STL_HEADER_SIZE + STL_COUNT_SIZE + count * STL_DTYPE.itemsize:
+        return None
+    return count
+
+def _analyze_memmap(path: str, count: int) -> dict:
+    """Analisi a memoria costante di un STL binario: due passate a blocchi sul memmap"""
+    vectors = np.memmap(path, dtype=STL_DTYPE, mode='r', offset=STL_HEADER_SIZE + STL_COUNT_SIZE,
+                        shape=(count,))['vectors']
+    mesh = MeshAccumulator()
+    corners = []
+    with stage_timer('load_mesh'):
+        for start in range(0, count, MESH_CHUNK_SIZE):
+            chunk = np.asarray(vectors[start:start + MESH_CHUNK_SIZE])
+            mesh.update(chunk)
+            corners.append(_footprint_corners(chunk))
+    return {
+        'volume': mesh.volume,
+        'dimensions': mesh.dimensions,
+        'triangle_count': count,
+        'surface_area': round(mesh.surface_area, 2),
+        'centroid': mesh.centroid,
+        'profile': slice_profile(vectors, (mesh.lower[2], mesh.upper[2])),
+        # L'inviluppo degli angoli di tutti i blocchi è l'inviluppo dell'intera mesh
+        'footprint': _hull_from_corners(np.concatenate(corners)),
+        # La riparazione richiede un ordinamento globale dei vertici
+        'mesh_report': None
+    }
+
+def _analyze_ascii_stream(path: str) -> dict:
+    """Analisi a memoria costante di un STL ASCII letto a blocchi"""
+    parser = StreamingSTLParser(expected_size=os.path.getsize(path))
+    with stage_timer('load_mesh'), open(path, 'rb') as f:
+        while chunk := f.read(MESH_CHUNK_SIZE * STL_DTYPE.itemsize):
+            parser.feed(chunk)
+        stats = parser.finish()
+    return analyze_streamed_stl(path, stats)
+
+def analyze_streamed_stl(path: str, stats: dict, ascii_vectors: str | None = None) -> dict:
+    """
+    Analisi di un STL su disco già letto per intero da StreamingSTLParser
+
+    Volume, dimensioni, area, baricentro e impronta vengono da finish(); resta solo
+    il profilo di sezione, che richiede l'intervallo di z completo: una passata a
+    blocchi sul memmap del file binario o dei triangoli scritti dal parser per uno
+    STL ASCII. Senza questi ultimi il profilo degli ASCII non è calcolato. La mesh
+    non è riparata, come nell'analisi a blocchi.
+
+    Args:
+        path: Percorso dell'STL
+        stats: Risultato di StreamingSTLParser.finish() sullo stesso file
+        ascii_vectors: File scritto dal parser con ascii_vectors, per gli STL ASCII
+
+    Returns:
+        dict: stesso formato di analyze_stl
+    """
+    vectors = None
+    if stats['format'] == 'binary':
+        vectors = np.memmap(path, dtype=STL_DTYPE, mode='r', offset=STL_HEADER_SIZE + STL_COUNT_SIZE,
+                            shape=(stats['triangle_count'],))['vectors']
+    elif ascii_vectors is not None:
+        vectors = np.memmap(ascii_vectors, dtype=np.float32, mode='r', shape=(stats['triangle_count'], 3, 3))
+    profile = slice_profile(vectors, stats['z_range']) if vectors is not None else None
+    return {
+        'volume': stats['volume'],
+        'dimensions': stats['dimensions'],
+        'triangle_count': stats['triangle_count'],
+        'surface_area': stats['surface_area'],
+        'centroid': stats['centroid'],
+        'profile': profile,
+        'footprint': stats['footprint'],
+        'mesh_report': None
+    }
+
+def analyze_stl_file(path: str, max_in_core: int | None = None) -> dict:
+    """
+    Analisi di un file mesh su disco, in memoria o a blocchi secondo il numero di triangoli
+
+    Il numero di triangoli di un STL è letto dall'intestazione (80 byte + uint32) senza
+    caricare il file; per gli ASCII è stimato dalla dimensione. Oltre max_in_core i binari
+    sono letti tramite np.memmap e gli ASCII tramite StreamingSTLParser: volume, dimensioni,
+    area, baricentro e impronta restano esatti, la riparazione della mesh è saltata.
+    I file gzip e zstd sono decompressi a blocchi in un file temporaneo; 3MF, PLY e OBJ,
+    già compatti perché indicizzati, sono analizzati in memoria.
+
+    Args:
+        path: Percorso del file mesh
+        max_in_core: Soglia di triangoli (default STL_OUT_OF_CORE_TRIANGLES)
+
+    Returns:
+        dict: stesso formato di analyze_stl
+    """
+    max_in_core = STL_OUT_OF_CORE_TRIANGLES if max_in_core is None else max_in_core
+    with open(path, 'rb') as f:
+        file_format = mesh_format(f.read(STL_SNIFF_SIZE), os.path.getsize(path))
+
+    if file_format in ('gzip', 'zstd'):
+        out = tempfile.NamedTemporaryFile(delete=False)
+        try:
+            with open(path, 'rb') as f, out:
+                for chunk in iter_decompressed(iter(lambda: f.read(DECOMPRESS_CHUNK_SIZE), b''), file_format):
+                    out.write(chunk)
+            with open(out.name, 'rb') as f:
+                if mesh_format(f.read(STL_SNIFF_SIZE)) in ('gzip', 'zstd'):
+                    raise ValueError("File compresso più volte")
+            return analyze_stl_file(out.name, max_in_core)
+        finally:
+            os.unlink(out.name)
+
+    if file_format != 'stl':
+        with open(path, 'rb') as f:
+            return analyze_stl(f.read())
+
+    count = stl_header_count(path)
+    estimate = count if count is not None else os.path.getsize(path) // ASCII_BYTES_PER_TRIANGLE
+    if estimate <= max_in_core:
+        with open(path, 'rb') as f:
+            return analyze_stl(f.read())
+
+    logger.info("Analisi a blocchi di %s: circa %s triangoli", path, estimate)
+    if count is not None:
+        return _analyze_memmap(path, count)
+    return _analyze_ascii_stream(path)
+
+# Versione del formato di analyze_stl: le voci su disco di versioni precedenti sono ignorate
+ANALYSIS_VERSION = 3
+
+def content_hash(file_content: bytes) -> str:
+    """Chiave di cache: SHA-256 dei byte del file"""
+    return hashlib.sha256(file_content).hexdigest()
+
+class AnalysisCache:
+    """
+    Cache LRU dei risultati di analisi, limitata in byte, con livello su disco opzionale
+
+    Le voci sono indicizzate per hash del contenuto: il livello su disco può essere
+    condiviso tra frontend e backend puntando alla stessa directory.
+    """
+
+    def __init__(self, max_bytes: int, disk_dir: str | None = None):
+        self.max_bytes = max_bytes
+        self.disk_dir = disk_dir
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # key -> (value, size)
+        self._lock = threading.Lock()
+        if disk_dir:
+            os.makedirs(disk_dir, exist_ok=True)
+
+    def _disk_path(self, key: str) -> str:
+        return os.path.join(self.disk_dir, f"v{ANALYSIS_VERSION}", key[:2], f"{key}.pkl")
+
+    def _encode(self, value) -> bytes:
+        return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def _decode(self, payload: bytes):
+        return pickle.loads(payload)
+
+    def _store_in_memory(self, key: str, value, size: int):
+        if size > self.max_bytes:
+            return
+        if key in self._entries:
+            self.current_bytes -= self._entries.pop(key)[1]
+        while self._entries and self.current_bytes + size > self.max_bytes:
+            _, (_, evicted_size) = self._entries.popitem(last=False)
+            self.current_bytes -= evicted_size
+        self._entries[key] = (value, size)
+        self.current_bytes += size
+
+    def get(self, key: str):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+
+        if self.disk_dir:
+            try:
+                with open(self._disk_path(key), 'rb') as f:
+                    payload = f.read()
+                value = self._decode(payload)
+                with self._lock:
+                    self._store_in_memory(key, value, len(payload))
+                    self.hits += 1
+                return value
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                logger.warning("Voce di cache su disco non leggibile %s: %s", key, e)
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, key: str, value):
+        payload = self._encode(value)
+        with self._lock:
+            self._store_in_memory(key, value, len(payload))
+
+        if self.disk_dir:
+            path = self._disk_path(key)
+            try:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                # Scrittura atomica: più processi possono condividere la directory
+                with tempfile.NamedTemporaryFile(dir=os.path.dirname(path), delete=False) as tmp:
+                    tmp.write(payload)
+                os.replace(tmp.name, path)
+            except Exception as e:
+                logger.warning("Impossibile salvare la voce di cache su disco %s: %s", key, e)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+# Cache condivisa dei risultati di analyze_stl
+analysis_cache = AnalysisCache(
+    max_bytes=int(os.getenv("STL_CACHE_MAX_BYTES", str(64 * 1024 * 1024))),
+    disk_dir=os.getenv("STL_CACHE_DIR") or None
+)
+
+def analyze_stl_cached(file_content: bytes, key: str | None = None) -> dict:
+    """
+    Come analyze_stl, ma riusa il risultato per file già analizzati
+
+    Args:
+        file_content: Binary content of the STL file
+        key: hash del contenuto, se già calcolato
+
+    Returns:
+        dict: volume in cm³, dimensioni in mm e numero di triangoli
+    """
+    key = key or content_hash(file_content)
+    analysis = analysis_cache.get(key)
+    if analysis is None:
+        analysis = analyze_stl(file_content)
+        analysis_cache.put(key, analysis)
+    return analysis
+
+PREVIEW_KEY = re.compile(r'[0-9a-f]{64}(-(br|gzip))?')
+
+def private_dir(path: str) -> str | None:
+    """
+    Crea (se serve) una directory accessibile solo all'utente corrente (0700)
+
+    Returns:
+        str | None: il percorso, o None se esiste già ma appartiene a un altro
+        utente o è un link simbolico: in quel caso non va usata
+    """
+    try:
+        os.makedirs(path, mode=0o700, exist_ok=True)
+        info = os.lstat(path)
+        if not os.path.isdir(path) or os.path.islink(path) or (hasattr(os, 'getuid') and info.st_uid != os.getuid()):
+            logger.warning("Directory %s non privata: livello su disco disattivato", path)
+            return None
+        if info.st_mode & 0o077:
+            os.chmod(path, 0o700)
+        return path
+    except OSError as e:
+        logger.warning("Directory %s non utilizzabile: %s", path, e)
+        return None
+
+class PreviewCache(AnalysisCache):
+    """
+    Cache delle anteprime GLB: byte grezzi in memoria e su disco, mai pickle
+
+    Le chiavi arrivano dagli URL: sono accettate solo quelle di preview_cache_key
+    (digest esadecimali, con il suffisso della codifica per le versioni compresse).
+    Il livello su disco sta in una directory privata e non supera disk_max_bytes:
+    oltre, i file letti meno di recente vengono eliminati.
+    """
+
+    def __init__(self, max_bytes: int, disk_dir: str | None, disk_max_bytes: int):
+        super().__init__(max_bytes)
+        self.disk_max_bytes = disk_max_bytes
+        self.disk_dir = private_dir(disk_dir) if disk_dir else None
+
+    def _disk_path(self, key: str) -> str:
+        return os.path.join(self.disk_dir, f"{key}.glb")
+
+    def _encode(self, value: bytes) -> bytes:
+        return value
+
+    def _decode(self, payload: bytes) -> bytes:
+        return payload
+
+    def get(self, key: str) -> bytes | None:
+        if not PREVIEW_KEY.fullmatch(key):
+            return None
+        value = super().get(key)
+        if value is not None and self.disk_dir:
+            try:
+                os.utime(self._disk_path(key))  # data di accesso per l'espulsione LRU
+            except OSError:
+                pass
+        return value
+
+    def put(self, key: str, value: bytes):
+        if not PREVIEW_KEY.fullmatch(key):
+            raise ValueError(f"Chiave di anteprima non valida: {key!r}")
+        super().put(key, value)
+        if self.disk_dir:
+            self._evict_disk()
+
+    def _evict_disk(self):
+        """Elimina i file meno recenti finché la directory non rientra in disk_max_bytes"""
+        entries = []
+        try:
+            with os.scandir(self.disk_dir) as scan:
+                for entry in scan:
+                    if entry.name.endswith('.glb') and entry.is_file(follow_symlinks=False):
+                        info = entry.stat(follow_symlinks=False)
+                        entries.append((info.st_mtime, info.st_size, entry.path))
+        except OSError as e:
+            logger.warning("Impossibile leggere la directory delle anteprime: %s", e)
+            return
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.disk_max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+
+# Budget di triangoli della mesh di anteprima e relativa cache. Le anteprime sono
+# salvate anche su disco, in una directory privata dell'applicazione: gli URL
+# restituiti dal backend devono restare validi per tutti i worker uvicorn e dopo
+# un'espulsione dalla memoria
+PREVIEW_MAX_TRIANGLES = int(os.getenv("PREVIEW_MAX_TRIANGLES", "100000"))
+APP_DATA_DIR = os.getenv("APP_DATA_DIR") or os.path.join(
+    os.getenv("XDG_DATA_HOME") or os.path.join(os.path.expanduser("~"), ".local", "share"), "edcalculator"
+)
+PREVIEW_CACHE_DIR = os.getenv("PREVIEW_CACHE_DIR") or os.path.join(APP_DATA_DIR, "previews")
+preview_cache = PreviewCache(
+    max_bytes=int(os.getenv("PREVIEW_CACHE_MAX_BYTES", str(128 * 1024 * 1024))),
+    disk_dir=PREVIEW_CACHE_DIR,
+    disk_max_bytes=int(os.getenv("PREVIEW_DISK_MAX_BYTES", str(1024 * 1024 * 1024)))
+)
+
+def write_stl(triangles: NDArray) -> bytes:
+    """Serializza i triangoli (n, 3, 3) come STL binario"""
+    records = np.zeros(len(triangles), dtype=STL_DTYPE)
+    records['vectors'] = triangles
+    normals = np.cross(triangles[:, 1] - triangles[:, 0], triangles[:, 2] - triangles[:, 0])
+    lengths = np.linalg.norm(normals, axis=1, keepdims=True)
+    records['normals'] = np.divide(normals, lengths, out=np.zeros_like(normals), where=lengths > 0)
+
+    header = b'edcalculator binary STL'.ljust(STL_HEADER_SIZE, b' ')
+    count = len(records).to_bytes(STL_COUNT_SIZE, 'little')
+    return header + count + records.tobytes()
+
+def decimate_mesh(triangles: NDArray, max_triangles: int) -> NDArray:
+    """
+    Semplifica la mesh per clustering dei vertici su una griglia regolare
+
+    La griglia parte da un passo stimato dal budget e viene resa più grossolana
+    finché il numero di triangoli rimasti non rientra in max_triangles.
+
+    Args:
+        triangles: Array (n, 3, 3) dei vertici in mm
+        max_triangles: Numero massimo di triangoli della mesh risultante
+
+    Returns:
+        NDArray: triangoli (m, 3, 3) con m <= max_triangles
+    """
+    if len(triangles) <= max_triangles:
+        return triangles
+
+    vertices = triangles.reshape(-1, 3)
+    lower = vertices.min(axis=0)
+    extent = float(np.ptp(vertices, axis=0).max()) or 1.0
+    cell = extent * 2 / np.sqrt(max_triangles)
+
+    while True:
+        cells = np.floor((vertices - lower) / cell).astype(np.int64)
+        dims = cells.max(axis=0) + 1
+        cell_ids = (cells[:, 0] * dims[1] + cells[:, 1]) * dims[2] + cells[:, 2]
+        cluster_ids, inverse = np.unique(cell_ids, return_inverse=True)
+        n_clusters = len(cluster_ids)
+
+        # Le facce con due vertici nello stesso cluster degenerano e vengono scartate
+        faces = inverse.reshape(-1, 3)
+        faces = faces[(faces[:, 0] != faces[:, 1]) & (faces[:, 1] != faces[:, 2]) & (faces[:, 0] != faces[:, 2])]
+
+        # Elimina le facce duplicate, indipendentemente dall'ordine dei vertici
+        if n_clusters < 2 ** 21:
+            ordered = np.sort(faces, axis=1)
+            face_keys = (ordered[:, 0] << 42) | (ordered[:, 1] << 21) | ordered[:, 2]
+            _, first = np.unique(face_keys, return_index=True)
+            faces = faces[np.sort(first)]
+            if len(faces) <= max_triangles:
+                break
+        cell *= 1.25
+
+    # Ogni cluster è rappresentato dal baricentro dei suoi vertici
+    counts = np.bincount(inverse, minlength=n_clusters)
+    positions = np.stack([
+        np.bincount(inverse, weights=vertices[:, axis], minlength=n_clusters) / counts
+        for axis in range(3)
+    ], axis=1)
+    return positions[faces].astype(np.float32)
+
+def triangles_to_glb(triangles: NDArray) -> bytes:
+    """Converte i triangoli (n, 3, 3) in un modello GLB indicizzato"""
+    import trimesh  # usato solo per l'esportazione GLB
+
+    mesh = trimesh.Trimesh(
+        vertices=triangles.reshape(-1, 3),
+        faces=np.arange(len(triangles) * 3).reshape(-1, 3)
+    )
+    if mesh.is_empty:
+        raise ValueError("Mesh STL non valida")
+    return mesh.export(file_type='glb')
+
+def convert_stl_to_glb(stl_content: bytes) -> bytes:
+    """Converte il contenuto STL in GLB"""
+    try:
+        logger.info("Iniziando la conversione STL -> GLB")
+        glb_content = triangles_to_glb(load_mesh(stl_content))
+        logger.info("Conversione completata con successo")
+        return glb_content
+    except Exception as e:
+        logger.error("Errore durante la conversione: %s", e)
+        raise ValueError(f"Errore nella conversione STL->GLB: {str(e)}")
+
+def build_preview_glb(file_content: bytes, max_triangles: int = PREVIEW_MAX_TRIANGLES) -> bytes:
+    """
+    Modello GLB per l'anteprima 3D, semplificato entro max_triangles
+
+    La mesh ridotta serve solo alla visualizzazione: i calcoli di costo usano sempre
+    la geometria originale.
+    """
+    triangles = load_mesh(file_content)
+    preview = decimate_mesh(triangles, max_triangles)
+    if len(preview) < len(triangles):
+        logger.info("Anteprima ridotta da %s a %s triangoli", len(triangles), len(preview))
+    return triangles_to_glb(preview)
+
+def preview_cache_key(key: str, max_triangles: int = PREVIEW_MAX_TRIANGLES) -> str:
+    """Chiave dell'anteprima: digest dell'hash del contenuto e del budget di triangoli"""
+    return hashlib.sha256(f"{key}-{max_triangles}".encode()).hexdigest()
+
+def preview_glb(file_content: bytes, max_triangles: int = PREVIEW_MAX_TRIANGLES, key: str | None = None) -> bytes:
+    """
+    Come build_preview_glb, con il risultato in cache per hash del contenuto
+
+    Args:
+        file_content: Binary content of the STL file
+        max_triangles: Budget di triangoli dell'anteprima
+        key: hash del contenuto, se già calcolato
+
+    Returns:
+        bytes: modello GLB dell'anteprima
+    """
+    cache_key = preview_cache_key(key or content_hash(file_content), max_triangles)
+    preview = preview_cache.get(cache_key)
+    if preview is None:
+        preview = build_preview_glb(file_content, max_triangles)
+        preview_cache.put(cache_key, preview)
+    return preview
+
+# Pool di processi condiviso per l'analisi di più file, dimensionato sui core disponibili
+QUOTE_WORKERS = int(os.getenv("QUOTE_WORKERS", str(os.cpu_count() or 1)))
+_process_pool = None
+_process_pool_lock = threading.Lock()
+
+def get_process_pool() -> ProcessPoolExecutor:
+    """Restituisce il pool di processi condiviso, creandolo al primo utilizzo"""
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is None:
+            logger.info("Avvio pool di analisi con %s processi", QUOTE_WORKERS)
+            _process_pool = ProcessPoolExecutor(max_workers=QUOTE_WORKERS)
+        return _process_pool
+
+def shutdown_process_pool():
+    """Chiude il pool condiviso annullando le analisi in coda"""
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is not None:
+            _process_pool.shutdown(wait=False, cancel_futures=True)
+            _process_pool = None
+
+def extract_stl_files(filename: str, file_content: bytes, max_file_size: int | None = None) -> list[tuple[str, bytes]]:
+    """
+    Espande un archivio ZIP nei file mesh che contiene; un file mesh (anche 3MF, che è
+    a sua volta uno ZIP) viene restituito così com'è
+
+    Args:
+        filename: Nome del file caricato
+        file_content: Contenuto del file caricato
+        max_file_size: Dimensione massima decompressa di ogni file, in byte
+
+    Returns:
+        list: coppie (nome file, contenuto del file mesh)
+    """
+    if not file_content.startswith(_ZIP_MAGIC) or filename.lower().endswith('.3mf'):
+        return [(filename, file_content)]
+
+    files = []
+    with zipfile.ZipFile(io.BytesIO(file_content)) as archive:
+        if any(name.lower().endswith('.model') for name in archive.namelist()):
+            return [(filename, file_content)]
+        for info in archive.infolist():
+            name = info.filename
+            if info.is_dir() or name.startswith('__MACOSX/') or not name.lower().endswith(MESH_EXTENSIONS):
+                continue
+            if max_file_size is not None and info.file_size > max_file_size:
+                raise ValueError(f"File {name} nell'archivio troppo grande")
+            files.append((f"{filename}/{name}", archive.read(info)))
+
+    if not files:
+        raise ValueError(f"Nessun file mesh trovato in {filename}")
+    return files
+
+def analyze_stl_batch(files: Iterable[tuple[str, bytes]], executor=None) -> Iterator[tuple[str, dict | None, str | None]]:
+    """
+    Analizza più file in parallelo, restituendo i risultati man mano che sono pronti
+
+    Args:
+        files: coppie (nome file, contenuto STL)
+        executor: pool da usare, di default quello condiviso
+
+    Yields:
+        tuple: (nome file, analisi o None, messaggio di errore o None)
+    """
+    executor = executor or get_process_pool()
+    cached = []
+    futures = {}
+    for name, content in files:
+        key = content_hash(content)
+        analysis = analysis_cache.get(key)
+        if analysis is not None:
+            cached.append((name, analysis))
+        else:
+            futures[executor.submit(analyze_stl, content)] = (name, key)
+
+    for name, analysis in cached:
+        yield name, analysis, None
+
+    for future in as_completed(futures):
+        name, key = futures[future]
+        try:
+            analysis = future.result()
+        except Exception as e:
+            yield name, None, str(e)
+            continue
+        analysis_cache.put(key, analysis)
+        yield name, analysis, None
+
+def quote_row(name: str, analysis: dict, material_properties: dict, layer_height: float, copies: int = 1) -> dict:
+    """Preventivo di un singolo file di un ordine, a partire dalla sua analisi"""
+    calculations = calculate_print_cost(
+        analysis['volume'], material_properties, layer_height, profile=analysis.get('profile')
+    )
+    row = {
+        'file': name,
+        **calculations,
+        'dimensions': analysis['dimensions'],
+        'mesh_report': analysis.get('mesh_report'),
+        'copies': copies,
+        'plates': copies,
+        'per_plate': 1,
+        'order_tempo_stampa': round(calculations['tempo_stampa'] * copies, 2),
+        'order_total_cost': round(calculations['total_cost'] * copies, 2)
+    }
+    if copies > 1:
+        # Più copie condividono i piatti di stampa e i movimenti per layer
+        try:
+            plates = plate_quote(analysis, material_properties, layer_height, copies)
+            row.update(
+                plates=plates['plates'],
+                per_plate=plates['per_plate'],
+                order_tempo_stampa=plates['tempo_stampa'],
+                order_total_cost=plates['total_cost']
+            )
+        except ValueError as e:
+            logger.warning("%s: %s, copie prezzate come stampe separate", name, e)
+    return row
+
+def order_totals(rows: Iterable[dict]) -> dict:
+    """Totali di un ordine; le righe con 'error' sono contate ma non sommate"""
+    totals = {'files': 0, 'failed': 0, 'pieces': 0, 'plates': 0, 'weight_kg': 0.0, 'tempo_stampa': 0.0, 'total_cost': 0.0}
+    for row in rows:
+        totals['files'] += 1
+        if row.get('error'):
+            totals['failed'] += 1
+            continue
+        totals['pieces'] += row['copies']
+        totals['plates'] += row.get('plates', row['copies'])
+        totals['weight_kg'] += row['weight_kg'] * row['copies']
+        totals['tempo_stampa'] += row.get('order_tempo_stampa', row['tempo_stampa'] * row['copies'])
+        totals['total_cost'] += row['order_total_cost']
+
+    totals['weight_kg'] = round(totals['weight_kg'], 3)
+    totals['tempo_stampa'] = round(totals['tempo_stampa'], 2)
+    totals['total_cost'] = round(totals['total_cost'], 2)
+    return totals
+
+def estimate_layer_times(area: NDArray, perimeter: NDArray, velocita_stampa: float = 60) -> NDArray:
+    """
+    Tempo di stampa di ogni layer in secondi, dati area e perimetro della sezione
+
+    Ogni layer stampa PERIMETER_COUNT perimetri e riempie la parte interna con
+    INFILL_DENSITY, con linee larghe LINE_WIDTH, più LAYER_CHANGE_TIME di movimenti.
+    """
+    perimeter_path = perimeter * PERIMETER_COUNT
+    infill_area = np.maximum(area - perimeter_path * LINE_WIDTH, 0)
+    infill_path = infill_area * INFILL_DENSITY / LINE_WIDTH
+    return (perimeter_path + infill_path) / velocita_stampa + LAYER_CHANGE_TIME
+
+def estimate_print_time(volume: float, layer_height: float, velocita_stampa: float = 60, profile: dict | None = None) -> float:
     """
     Stima il tempo di stampa in ore
 
@@ -62,10 +1977,21 @@ def estimate_print_time(volume: float, layer_height: float, velocita_stampa: flo
         volume: Volume in cm³
         layer_height: Altezza layer in mm
         velocita_stampa: Velocità media di stampa in mm/s
+        profile: Profilo di sezione prodotto da slice_profile; senza profilo si usa
+            una stima basata solo sul volume
 
     Returns:
         float: Tempo stimato in ore
     """
+    if profile is not None:
+        # Ricampiona il profilo sui piani dell'altezza layer richiesta
+        height = profile['z_max'] - profile['z_min']
+        n_layers = max(1, int(round(height / layer_height)))
+        z = profile['z_min'] + (np.arange(n_layers) + 0.5) * layer_height
+        area = np.interp(z, profile['z'], profile['area'])
+        perimeter = np.interp(z, profile['z'], profile['perimeter'])
+        return float(estimate_layer_times(area, perimeter, velocita_stampa).sum()) / 3600
+
     # Stima la lunghezza del filamento (approssimativa)
     diametro_filamento = 1.75  # mm
     area_filamento = np.pi * (diametro_filamento/2)**2
@@ -77,11 +2003,12 @@ def estimate_print_time(volume: float, layer_height: float, velocita_stampa: flo
 
     # Tempo totale considerando movimenti non di stampa
     tempo_stampa = lunghezza_filamento / velocita_stampa  # secondi
-    tempo_movimento = numero_layer * 2  # 2 secondi per layer per movimenti
+    tempo_movimento = numero_layer * LAYER_CHANGE_TIME
 
     return (tempo_stampa + tempo_movimento) / 3600  # converti in ore
 
-def calculate_print_cost(volume: float, material_properties: dict, layer_height: float, velocita_stampa: float = 60) -> dict:
+@stage_timer('calculate_print_cost')
+def calculate_print_cost(volume: float, material_properties: dict, layer_height: float, velocita_stampa: float = 60, profile: dict | None = None) -> dict:
     """
     Calcola i costi di stampa basati su volume e proprietà del materiale
 
@@ -90,14 +2017,11 @@ def calculate_print_cost(volume: float, material_properties: dict, layer_height:
         material_properties: Dictionary con le proprietà del materiale
         layer_height: Altezza layer in mm
         velocita_stampa: Velocità media di stampa in mm/s
+        profile: Profilo di sezione della mesh, se disponibile
 
     Returns:
         dict: Dizionario con i calcoli dei costi
     """
-    # Log dei parametri di input
-    logger.info(f"Calcolo costi con parametri: volume={volume}, layer_height={layer_height}")
-    logger.info(f"Proprietà materiale: {material_properties}")
-
     # Calcola peso in kg
     weight = volume * material_properties['density'] / 1000
 
@@ -105,11 +2029,10 @@ def calculate_print_cost(volume: float, material_properties: dict, layer_height:
     material_cost = weight * material_properties['cost_per_kg']
 
     # Stima tempo di stampa
-    print_time = estimate_print_time(volume, layer_height, velocita_stampa)
+    print_time = estimate_print_time(volume, layer_height, velocita_stampa, profile)
 
     # Usa il costo orario specifico del materiale
     hourly_cost = material_properties.get('hourly_cost', 30)  # EUR/ora
-    logger.info(f"Usando costo orario macchina: {hourly_cost} EUR/h")
     machine_cost = print_time * hourly_cost
 
     result = {
@@ -120,5 +2043,242 @@ def calculate_print_cost(volume: float, material_properties: dict, layer_height:
         'machine_cost': round(machine_cost, 2),
         'total_cost': round(material_cost + machine_cost, 2)
     }
-    logger.info(f"Risultati calcolo: {result}")
-    return result
\ No newline at end of file
+    _pricing_log.debug("Costo: volume=%s, layer_height=%s, costo orario=%s EUR/h, materiale=%s -> %s",
+                       volume, layer_height, hourly_cost, material_properties, result)
+    return result
+
+def price_grid(volumes, materials: dict, layer_heights, copies=(1,), velocita_stampa: float = 60, profiles=None,
+               per_plate=None) -> dict:
+    """
+    Calcola in un solo passaggio i costi per ogni combinazione volume × materiale × layer × copie
+
+    Args:
+        volumes: Volumi in cm³, forma (V,)
+        materials: Dizionario nome -> proprietà del materiale, forma (M,)
+        layer_heights: Altezze layer in mm, forma (L,)
+        copies: Numeri di copie, forma (C,)
+        velocita_stampa: Velocità media di stampa in mm/s
+        profiles: Profili di sezione, uno per volume (opzionale)
+        per_plate: Copie per piatto, una per volume (da plate_quote); se indicato le
+            copie dello stesso piatto condividono i movimenti per layer
+
+    Returns:
+        dict: array per pezzo di forma (V, M, L) e 'order_total_cost' di forma (V, M, L, C);
+        le combinazioni con layer fuori dal range del materiale valgono NaN
+    """
+    volumes = np.atleast_1d(np.asarray(volumes, dtype=np.float64))
+    layer_heights = np.atleast_1d(np.asarray(layer_heights, dtype=np.float64))
+    copies = np.atleast_1d(np.asarray(copies, dtype=np.int64))
+    props = list(materials.values())
+
+    density = np.array([p['density'] for p in props], dtype=np.float64)
+    cost_per_kg = np.array([p['cost_per_kg'] for p in props], dtype=np.float64)
+    hourly_cost = np.array([p.get('hourly_cost', 30) for p in props], dtype=np.float64)
+    min_layer = np.array([p.get('min_layer_height', 0) for p in props], dtype=np.float64)
+    max_layer = np.array([p.get('max_layer_height', np.inf) for p in props], dtype=np.float64)
+
+    # Assi: volume (V), materiale (M), layer (L)
+    shape = (len(volumes), len(props), len(layer_heights))
+    weight = volumes[:, None, None] * density[None, :, None] / 1000
+    material_cost = weight * cost_per_kg[None, :, None]
+    if profiles is None:
+        print_time = estimate_print_time(volumes[:, None, None], layer_heights[None, None, :], velocita_stampa)
+    else:
+        # Il tempo dipende solo da volume e layer: una stima per coppia, non per materiale
+        print_time = np.array([
+            [estimate_print_time(volume, layer_height, velocita_stampa, profile) for layer_height in layer_heights]
+            for volume, profile in zip(volumes, profiles)
+        ])[:, None, :]
+    machine_cost = print_time * hourly_cost[None, :, None]
+    total_cost = material_cost + machine_cost
+
+    # Tolleranza per altezze layer prodotte da slider a passo decimale
+    valid = ((layer_heights[None, :] >= min_layer[:, None] - 1e-9) &
+             (layer_heights[None, :] <= max_layer[:, None] + 1e-9))
+
+    def masked(values):
+        return np.where(valid[None, :, :], np.broadcast_to(values, shape), np.nan)
+
+    total_cost = masked(total_cost)
+    if per_plate is None:
+        order_total_cost = total_cost[..., None] * copies
+    else:
+        if profiles is None:
+            overhead = layer_overhead_time(volumes[:, None, None], layer_heights[None, None, :])
+        else:
+            overhead = np.array([
+                layer_overhead_time(volume, layer_heights, profile) for volume, profile in zip(volumes, profiles)
+            ])[:, None, :]
+        per_plate = np.broadcast_to(np.asarray(per_plate, dtype=np.int64), volumes.shape)[:, None, None, None]
+        order_time = plates_print_time(print_time[..., None], overhead[..., None], copies, per_plate)
+        order_total_cost = material_cost[..., None] * copies + order_time * hourly_cost[None, :, None, None]
+        order_total_cost = np.where(valid[None, :, :, None], order_total_cost, np.nan)
+
+    return {
+        'materials': list(materials.keys()),
+        'layer_heights': layer_heights,
+        'copies': copies,
+        'valid': valid,
+        'weight_kg': masked(weight),
+        'material_cost': masked(material_cost),
+        'tempo_stampa': masked(print_time),
+        'machine_cost': masked(machine_cost),
+        'total_cost': total_cost,
+        'order_total_cost': order_total_cost
+    }
+
+# Piatto di stampa: dimensioni, distanza tra i pezzi e risoluzione della griglia di packing
+PLATE_WIDTH = float(os.getenv("PLATE_WIDTH", "220"))  # mm
+PLATE_DEPTH = float(os.getenv("PLATE_DEPTH", "220"))  # mm
+PART_SPACING = float(os.getenv("PART_SPACING", "5"))  # mm
+PACKING_RESOLUTION = float(os.getenv("PACKING_RESOLUTION", "1"))  # mm per cella
+PLATE_SETUP_TIME = float(os.getenv("PLATE_SETUP_TIME", "0"))  # secondi per piatto (riscaldamento, rimozione)
+
+def footprint_mask(dimensions: dict, hull: NDArray | None = None, spacing: float = PART_SPACING,
+                   resolution: float = PACKING_RESOLUTION) -> NDArray:
+    """
+    Impronta del pezzo sulla griglia di packing, allargata di spacing / 2 per lato
+
+    Senza inviluppo convesso l'impronta è il rettangolo larghezza × profondità.
+    Le celle sono marcate se il loro centro cade nel poligono allargato anche di mezza
+    diagonale di cella: l'impronta rasterizzata contiene sempre quella reale.
+    """
+    margin = spacing / 2
+    cols = int(np.ceil((dimensions['width'] + spacing) / resolution))
+    rows = int(np.ceil((dimensions['depth'] + spacing) / resolution))
+    if hull is None or len(hull) < 3:
+        return np.ones((rows, cols), dtype=bool)
+
+    # Centri delle celle nel sistema del pezzo (origine all'angolo del bounding box)
+    x = (np.arange(cols) + 0.5) * resolution - margin
+    y = (np.arange(rows) + 0.5) * resolution - margin
+    hull = np.asarray(hull, dtype=np.float64)
+    start, end = hull, np.roll(hull, -1, axis=0)
+    edge = end - start
+    length = np.maximum(np.hypot(edge[:, 0], edge[:, 1]), 1e-12)
+
+    # Distanza con segno dai lati (positiva all'interno, vertici in senso antiorario)
+    distance = (edge[:, 0] * (y[:, None, None] - start[:, 1]) -
+                edge[:, 1] * (x[None, :, None] - start[:, 0])) / length
+    return np.all(distance >= -(margin + resolution * np.sqrt(0.5)), axis=2)
+
+def _overlap_offsets(fixed: NDArray, moving: NDArray) -> NDArray:
+    """
+    Spostamenti relativi per cui moving si sovrappone a fixed (no-fit polygon rasterizzato)
+
+    L'elemento (i, j) corrisponde allo spostamento (i - rows(moving) + 1, j - cols(moving) + 1).
+    """
+    shape = (fixed.shape[0] + moving.shape[0] - 1, fixed.shape[1] + moving.shape[1] - 1)
+    spectrum = np.fft.rfft2(fixed, shape) * np.fft.rfft2(moving[::-1, ::-1], shape)
+    return np.fft.irfft2(spectrum, shape) > 0.5
+
+def pack_copies(mask: NDArray, count: int, plate_width: float = PLATE_WIDTH, plate_depth: float = PLATE_DEPTH,
+                spacing: float = PART_SPACING, resolution: float = PACKING_RESOLUTION,
+                allow_rotation: bool = True) -> list[tuple[float, float, bool]]:
+    """
+    Dispone fino a count copie dell'impronta sul piatto con strategia bottom-left
+
+    Per ogni orientamento si tiene una mappa booleana delle posizioni libere: ogni pezzo
+    piazzato la aggiorna con il proprio no-fit polygon precalcolato, per cui ogni copia
+    costa un argmax e qualche assegnazione su array, non un controllo pezzo per pezzo.
+
+    Returns:
+        list: (x, y, ruotato) in mm dell'angolo di ogni copia rispetto all'angolo del piatto
+    """
+    masks = [mask]
+    if allow_rotation and not np.array_equal(mask, np.rot90(mask)):
+        masks.append(np.rot90(mask))
+
+    # La griglia include mezza distanza oltre il bordo: i pezzi possono toccare il bordo
+    rows = int(np.floor((plate_depth + spacing) / resolution))
+    cols = int(np.floor((plate_width + spacing) / resolution))
+    free = [np.ones((max(rows - m.shape[0] + 1, 0), max(cols - m.shape[1] + 1, 0)), dtype=bool) for m in masks]
+    offsets = [[_overlap_offsets(fixed, moving) for moving in masks] for fixed in masks]
+
+    placements = []
+    while len(placements) < count:
+        best = None
+        for orientation, positions in enumerate(free):
+            if positions.size == 0:
+                continue
+            index = int(np.argmax(positions))
+            if positions.flat[index]:
+                candidate = divmod(index, positions.shape[1])
+                if best is None or candidate < best[:2]:
+                    best = (*candidate, orientation)
+        if best is None:
+            break
+
+        row, col, orientation = best
+        placements.append((col * resolution, row * resolution, orientation == 1))
+        for other, positions in enumerate(free):
+            blocked = offsets[orientation][other]
+            # Posizione d'origine dell'elemento (0, 0) del no-fit polygon
+            top = row - masks[other].shape[0] + 1
+            left = col - masks[other].shape[1] + 1
+            r0, c0 = max(top, 0), max(left, 0)
+            r1 = min(top + blocked.shape[0], positions.shape[0])
+            c1 = min(left + blocked.shape[1], positions.shape[1])
+            if r0 < r1 and c0 < c1:
+                positions[r0:r1, c0:c1] &= ~blocked[r0 - top:r1 - top, c0 - left:c1 - left]
+
+    return placements
+
+def layer_overhead_time(volume, layer_height, profile: dict | None = None):
+    """Tempo in ore dei movimenti per layer, condiviso da tutti i pezzi dello stesso piatto"""
+    if profile is not None:
+        n_layers = np.maximum(1, np.round((profile['z_max'] - profile['z_min']) / layer_height))
+    else:
+        n_layers = np.cbrt(np.asarray(volume) * 1000) / layer_height
+    return n_layers * LAYER_CHANGE_TIME / 3600
+
+def plates_print_time(unit_time, overhead_time, copies, per_plate):
+    """Ore totali per stampare copies pezzi a per_plate per piatto"""
+    plates = np.ceil(np.asarray(copies) / per_plate)
+    return copies * (unit_time - overhead_time) + plates * (overhead_time + PLATE_SETUP_TIME / 3600)
+
+@stage_timer('plate_quote')
+def plate_quote(analysis: dict, material_properties: dict, layer_height: float, copies: int,
+                plate_width: float = PLATE_WIDTH, plate_depth: float = PLATE_DEPTH,
+                spacing: float = PART_SPACING) -> dict:
+    """
+    Preventivo di copies pezzi disposti sui piatti di stampa
+
+    I pezzi dello stesso piatto condividono i movimenti per layer e l'eventuale
+    PLATE_SETUP_TIME, per cui il tempo non cresce linearmente con le copie.
+
+    Returns:
+        dict: per_plate, plates, layout (posizioni di un piatto pieno), tempo_stampa,
+            material_cost, machine_cost e total_cost dell'intero ordine
+    """
+    # L'inviluppo rasterizzato è conservativo: per pezzi quasi rettangolari il
+    # bounding box può starci meglio, si tiene la disposizione con più copie
+    layout = []
+    for hull in (analysis.get('footprint'), None):
+        mask = footprint_mask(analysis['dimensions'], hull, spacing)
+        candidate = pack_copies(mask, copies, plate_width, plate_depth, spacing)
+        if len(candidate) > len(layout):
+            layout = candidate
+        if hull is None or len(layout) == copies:
+            break
+    if not layout:
+        raise ValueError(f"Il pezzo non entra nel piatto di {plate_width:g} × {plate_depth:g} mm")
+
+    per_plate = len(layout)
+    profile = analysis.get('profile')
+    unit_time = estimate_print_time(analysis['volume'], layer_height, profile=profile)
+    overhead = float(layer_overhead_time(analysis['volume'], layer_height, profile))
+    print_time = float(plates_print_time(unit_time, overhead, copies, per_plate))
+
+    weight = analysis['volume'] * material_properties['density'] / 1000
+    material_cost = weight * material_properties['cost_per_kg'] * copies
+    machine_cost = print_time * material_properties.get('hourly_cost', 30)
+    return {
+        'per_plate': per_plate,
+        'plates': int(np.ceil(copies / per_plate)),
+        'layout': layout,
+        'tempo_stampa': round(print_time, 2),
+        'material_cost': round(material_cost, 2),
+        'machine_cost': round(machine_cost, 2),
+        'total_cost': round(material_cost + machine_cost, 2)
+    }
@@ -0,0 +1,18 @@
+import os
+import tempfile
+
+# Il backend sceglie database e directory dei dati all'import: prima di qualunque test
+os.environ.setdefault('DATABASE_URL', 'sqlite://')
+os.environ.setdefault('APP_DATA_DIR', tempfile.mkdtemp(prefix='edcalculator-tests-'))
+os.environ.pop('STL_CACHE_DIR', None)
+
+import pytest
+
+@pytest.fixture
+def client():
+    """Client HTTP dell'API sul database in memoria, con lo startup già eseguito"""
+    from fastapi.testclient import TestClient
+    from backend.api import app
+
+    with TestClient(app) as client:
+        yield client
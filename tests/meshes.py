@@ -0,0 +1,103 @@
+"""
+Mesh di prova deterministiche e scrittori minimi dei formati letti da load_mesh
+
+I test non dipendono da benchmark.py: qui ci sono solo le forme che servono ai
+test, con volumi noti, e la serializzazione in STL ASCII, OBJ, PLY binario e 3MF.
+"""
+import io
+import struct
+import zipfile
+
+import numpy as np
+from numpy.typing import NDArray
+
+def cube_faces(k: int) -> list[NDArray]:
+    """Superficie del cubo [-1, 1]³, k×k quadrati per faccia, triangoli orientati verso l'esterno"""
+    t = np.linspace(-1.0, 1.0, k + 1)
+    u, v = np.meshgrid(t, t, indexing='ij')
+    faces = []
+    for axis in range(3):
+        first, second = [a for a in range(3) if a != axis]
+        for sign in (-1.0, 1.0):
+            grid = np.empty((k + 1, k + 1, 3))
+            grid[..., axis] = sign
+            grid[..., first] = u
+            grid[..., second] = v
+            a, b, c, d = grid[:-1, :-1], grid[1:, :-1], grid[1:, 1:], grid[:-1, 1:]
+            triangles = np.concatenate([
+                np.stack([a, b, c], axis=-2).reshape(-1, 3, 3),
+                np.stack([a, c, d], axis=-2).reshape(-1, 3, 3)
+            ])
+            normal = np.cross(triangles[0, 1] - triangles[0, 0], triangles[0, 2] - triangles[0, 0])
+            if normal[axis] * sign < 0:
+                triangles = triangles[:, ::-1]
+            faces.append(triangles)
+    return faces
+
+def cube_mesh(size: float) -> NDArray:
+    """Cubo di lato size mm centrato nell'origine, facce verso l'esterno"""
+    return (np.concatenate(cube_faces(1)) * (size / 2)).astype(np.float32)
+
+def box_mesh(width: float, depth: float, height: float) -> NDArray:
+    """Parallelepipedo con l'angolo minimo nell'origine"""
+    scale = np.array([width, depth, height]) / 2
+    return ((np.concatenate(cube_faces(1)) + 1) * scale).astype(np.float32)
+
+def sphere_mesh(triangles: int, radius: float = 50.0) -> NDArray:
+    """Sfera chiusa da un cubo suddiviso e proiettato, circa triangles triangoli"""
+    k = max(1, int(round(np.sqrt(triangles / 12))))
+    parts = [face / np.linalg.norm(face, axis=-1, keepdims=True) * radius for face in cube_faces(k)]
+    return np.concatenate(parts).astype(np.float32)
+
+def nested_cubes(count_per_axis: int, spacing: float, seed: int = 0) -> NDArray:
+    """Cubi da 2 mm su una griglia centrata nell'origine, metà con il verso invertito"""
+    offsets = (np.arange(count_per_axis) - (count_per_axis - 1) / 2) * spacing
+    centers = np.stack(np.meshgrid(offsets, offsets, offsets, indexing='ij'), axis=-1).reshape(-1, 1, 1, 3)
+    cubes = cube_mesh(2.0)[None] + centers.astype(np.float32)
+    inverted = np.random.default_rng(seed).random(len(cubes)) < 0.5
+    cubes[inverted] = cubes[inverted][:, :, [0, 2, 1]]
+    return cubes.reshape(-1, 3, 3)
+
+def indexed(triangles: NDArray) -> tuple[NDArray, NDArray]:
+    """Vertici unici e facce come indici"""
+    vertices, faces = np.unique(triangles.reshape(-1, 3), axis=0, return_inverse=True)
+    return vertices, faces.reshape(-1, 3)
+
+def ascii_stl(triangles: NDArray) -> bytes:
+    facets = ''.join('facet normal 0 0 0\n outer loop\n' + ''.join(f'  vertex {x!r} {y!r} {z!r}\n' for x, y, z in t)
+                     + ' endloop\nendfacet\n' for t in triangles.tolist())
+    return f'solid test\n{facets}endsolid test\n'.encode()
+
+def obj_file(vertices: NDArray, polygons: list[list[int]]) -> bytes:
+    """OBJ con indici da 0 in polygons; riferimenti a texture e normali come nei file reali"""
+    lines = ['# test', 'o part'] + [f'v {x!r} {y!r} {z!r}' for x, y, z in vertices.tolist()] + ['vt 0 0', 'vn 0 0 1']
+    lines += ['f ' + ' '.join(f'{i + 1}/1/1' for i in polygon) for polygon in polygons]
+    return '\n'.join(lines).encode() + b'\n'
+
+def ply_file(vertices: NDArray, polygons: list[list[int]], byte_order: str = '<') -> bytes:
+    """PLY binario con coordinate float, colore per vertice e facce a lista uchar/int"""
+    name = {'<': 'binary_little_endian', '>': 'binary_big_endian'}[byte_order]
+    header = (f'ply\nformat {name} 1.0\ncomment test\nelement vertex {len(vertices)}\n'
+              'property float x\nproperty float y\nproperty float z\nproperty uchar red\n'
+              f'element face {len(polygons)}\nproperty list uchar int vertex_indices\nend_header\n').encode()
+    body = b''.join(struct.pack(byte_order + 'fffB', *v, 255) for v in vertices.tolist())
+    body += b''.join(struct.pack(f'{byte_order}B{len(p)}i', len(p), *p) for p in polygons)
+    return header + body
+
+def threemf_file(objects: dict[str, str], items: list[tuple[str, str | None]], unit: str = 'millimeter') -> bytes:
+    """3MF con gli oggetti (id -> XML di <mesh> o <components>) e gli elementi della build"""
+    build = ''.join(f'<item objectid="{object_id}"' + (f' transform="{transform}"' if transform else '') + '/>'
+                    for object_id, transform in items)
+    model = (f'<?xml version="1.0" encoding="UTF-8"?>'
+             f'<model unit="{unit}" xmlns="http://schemas.microsoft.com/3dmanufacturing/core/2015/02">'
+             '<resources>' + ''.join(f'<object id="{i}" type="model">{body}</object>' for i, body in objects.items())
+             + f'</resources><build>{build}</build></model>')
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w') as archive:
+        archive.writestr('3D/3dmodel.model', model)
+    return buffer.getvalue()
+
+def threemf_mesh(vertices: NDArray, faces: NDArray) -> str:
+    vertex_xml = ''.join(f'<vertex x="{x!r}" y="{y!r}" z="{z!r}"/>' for x, y, z in vertices.tolist())
+    triangle_xml = ''.join(f'<triangle v1="{a}" v2="{b}" v3="{c}"/>' for a, b, c in faces.tolist())
+    return f'<mesh><vertices>{vertex_xml}</vertices><triangles>{triangle_xml}</triangles></mesh>'
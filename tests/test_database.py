@@ -0,0 +1,33 @@
+import asyncio
+
+from sqlalchemy import func, select
+
+from backend import database, models
+
+def material(name: str) -> models.Material:
+    return models.Material(name=name, density=1.2, cost_per_kg=20, min_layer_height=0.1, max_layer_height=0.3)
+
+def test_memory_database_isolates_concurrent_sessions():
+    """In memoria le sessioni non condividono la transazione e i due engine lo stesso database"""
+    assert database.is_sqlite_memory(database.DATABASE_URL)
+    database.init_db()  # engine sincrono: tabelle e materiali predefiniti
+
+    async def scenario():
+        async def write(name: str, commit: bool, delay: float):
+            async with database.AsyncSessionLocal() as db:
+                db.add(material(name))
+                await db.flush()
+                await asyncio.sleep(delay)
+                await (db.commit() if commit else db.rollback())
+
+        await asyncio.gather(write('Isolation kept', True, 0.05), write('Isolation dropped', False, 0.01),
+                             write('Isolation kept 2', True, 0))
+        await database.async_engine.dispose()  # il database sopravvive alla chiusura del pool
+        async with database.AsyncSessionLocal() as db:
+            result = await db.execute(select(models.Material.name).where(models.Material.name.like('Isolation%')))
+            return sorted(result.scalars())
+
+    assert asyncio.run(scenario()) == ['Isolation kept', 'Isolation kept 2']
+    with database.SessionLocal() as db:
+        count = db.execute(select(func.count()).where(models.Material.name.like('Isolation%'))).scalar()
+    assert count == 2
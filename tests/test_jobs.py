@@ -0,0 +1,80 @@
+import asyncio
+import json
+import threading
+
+from backend.jobs import JobQueue
+from meshes import box_mesh
+from stl_processor import write_stl
+
+def test_price_runs_off_the_event_loop_and_cancellation_is_reported():
+    """Il calcolo dei costi gira in un thread; un job annullato in coda riporta l'errore"""
+    async def scenario():
+        queue = JobQueue(workers=1)
+        release = threading.Event()
+        loop_thread = threading.get_ident()
+        price_threads = []
+
+        def price(analysis):
+            price_threads.append(threading.get_ident())
+            release.wait(5)
+            return {'volume': analysis['volume']}
+
+        first = queue.submit(None, (), price, filename='a.stl', analysis={'volume': 1.0})
+        second = queue.submit(None, (), price, filename='b.stl', analysis={'volume': 2.0})
+        await asyncio.sleep(0.05)
+        # L'event loop resta libero mentre il primo job calcola i costi
+        assert first.status == 'running' and second.status == 'queued'
+        assert queue.cancel(second)
+        release.set()
+        await asyncio.wait_for(asyncio.gather(first.task, second.task), 5)
+        return first, second, price_threads, loop_thread
+
+    first, second, price_threads, loop_thread = asyncio.run(scenario())
+    assert first.summary()['status'] == 'done' and first.result == {'volume': 1.0}
+    assert price_threads and loop_thread not in price_threads
+    assert second.summary()['status'] == 'cancelled'
+    assert second.summary()['error'] == "Annullato in coda"
+
+def read_events(client, job_id: str, **headers) -> list[tuple[int, str, dict]]:
+    """Eventi SSE del job fino alla sua conclusione, come (id, tipo, dati)"""
+    events = []
+    with client.stream('GET', f'/jobs/{job_id}/events', headers=headers) as response:
+        assert response.status_code == 200
+        assert response.headers['content-type'].startswith('text/event-stream')
+        for block in response.read().decode().split('\n\n'):
+            fields = dict(line.split(': ', 1) for line in block.splitlines() if not line.startswith(':'))
+            if fields:
+                events.append((int(fields['id']), fields['event'], json.loads(fields['data'])))
+    return events
+
+def test_job_events_stream_and_resume(client):
+    """Un job accodato via API passa per tutte le fasi; Last-Event-ID riprende dall'evento successivo"""
+    material = client.get('/materials/').json()[0]
+    content = write_stl(box_mesh(12.0, 34.0, 5.0))
+    response = client.post('/jobs', files={'file': ('box.stl', content)},
+                           data={'material_id': material['id'], 'layer_height': 0.2, 'copies': 2})
+    assert response.status_code == 202, response.text
+    job_id = response.json()['id']
+
+    events = read_events(client, job_id)
+    assert [event_id for event_id, _, _ in events] == list(range(len(events)))
+    kinds = [kind for _, kind, _ in events]
+    assert kinds[:2] == ['queued', 'running'] and kinds[-1] == 'done'
+    assert [data['stage'] for _, kind, data in events if kind == 'progress'] == ['parse', 'validate', 'slice', 'price']
+    result = events[-1][2]['result']
+    assert result['volume_cm3'] == round(12 * 34 * 5 / 1000, 2) and result['copies'] == 2
+
+    job = client.get(f'/jobs/{job_id}').json()
+    assert job['status'] == 'done'
+    assert read_events(client, job_id, **{'Last-Event-ID': '2'}) == events[3:]
+    # Un job concluso non si può più annullare
+    assert client.delete(f'/jobs/{job_id}').status_code == 409
+
+def test_unknown_job_and_invalid_upload(client):
+    material = client.get('/materials/').json()[0]
+    assert client.get('/jobs/missing').status_code == 404
+    assert client.get('/jobs/missing/events').status_code == 404
+    assert client.delete('/jobs/missing').status_code == 404
+    response = client.post('/jobs', files={'file': ('empty.stl', b'solid empty\nendsolid empty\n')},
+                           data={'material_id': material['id'], 'layer_height': 0.2})
+    assert response.status_code == 422
@@ -0,0 +1,108 @@
+import csv
+import io
+import json
+import uuid
+
+def material(name: str, cost: float = 20.0) -> dict:
+    return {'name': name, 'density': 1.24, 'cost_per_kg': cost, 'min_layer_height': 0.1, 'max_layer_height': 0.3}
+
+def unique_prefix() -> str:
+    """Il database in memoria è condiviso fra i test: ogni test usa nomi propri"""
+    return f'test-{uuid.uuid4().hex[:8]}-'
+
+def exported(client, fmt: str, prefix: str) -> list[dict]:
+    response = client.get('/materials/export', params={'format': fmt})
+    assert response.status_code == 200
+    if fmt == 'csv':
+        rows = list(csv.DictReader(io.StringIO(response.text)))
+    else:
+        rows = [json.loads(line) for line in response.text.splitlines()]
+    return [row for row in rows if row['name'].startswith(prefix)]
+
+def test_import_and_export_round_trip(client):
+    """NDJSON e CSV importati in streaming ed esportati con tutte le colonne"""
+    prefix = unique_prefix()
+    ndjson = ''.join(json.dumps(material(f'{prefix}{i}', 10 + i)) + '\n' for i in range(3))
+    response = client.post('/materials/import', params={'format': 'ndjson'}, content=ndjson)
+    assert response.status_code == 200, response.text
+    assert response.json() == {'imported': 3}
+
+    # CSV con intestazione: i campi vuoti prendono il default dello schema
+    csv_body = ('name,density,cost_per_kg,min_layer_height,max_layer_height,hourly_cost\r\n'
+                f'{prefix}csv,1.1,15,0.08,0.28,\r\n')
+    response = client.post('/materials/import', content=csv_body, headers={'Content-Type': 'text/csv'})
+    assert response.json() == {'imported': 1}
+
+    rows = exported(client, 'ndjson', prefix)
+    assert [row['name'] for row in rows] == [f'{prefix}0', f'{prefix}1', f'{prefix}2', f'{prefix}csv']
+    assert rows[3]['hourly_cost'] == 30.0 and rows[3]['min_layer_height'] == 0.08
+    assert all(isinstance(row['id'], int) for row in rows)
+
+    csv_rows = exported(client, 'csv', prefix)
+    assert [row['name'] for row in csv_rows] == [row['name'] for row in rows]
+    assert float(csv_rows[1]['cost_per_kg']) == 11.0
+
+def test_invalid_or_duplicate_import_is_rolled_back(client):
+    prefix = unique_prefix()
+    rows = [material(f'{prefix}ok'), {**material(f'{prefix}bad'), 'density': -1}, material(f'{prefix}ok2')]
+    body = '\n'.join(json.dumps(row) for row in rows) + '\nnot json\n'
+    response = client.post('/materials/import', params={'format': 'ndjson'}, content=body)
+    assert response.status_code == 422
+    assert [error['line'] for error in response.json()['detail']] == [2, 4]
+
+    duplicates = json.dumps(material(f'{prefix}dup')) + '\n' + json.dumps(material(f'{prefix}dup')) + '\n'
+    response = client.post('/materials/import', params={'format': 'ndjson'}, content=duplicates)
+    assert response.status_code == 409
+    assert exported(client, 'ndjson', prefix) == []
+
+def test_cursor_pagination(client):
+    """Le pagine a cursore coprono tutti i materiali filtrati, senza duplicati, in entrambi i versi"""
+    prefix = unique_prefix()
+    names = [f'{prefix}{i:02d}' for i in range(7)]
+    body = ''.join(json.dumps(material(name, 20 + i % 3)) + '\n' for i, name in enumerate(names))
+    assert client.post('/materials/import', params={'format': 'ndjson'}, content=body).status_code == 200
+
+    for sort, order, expected in (('name', 'asc', names), ('name', 'desc', names[::-1])):
+        seen, cursor = [], None
+        while True:
+            params = {'sort': sort, 'order': order, 'limit': 3, 'name_prefix': prefix}
+            if cursor:
+                params['cursor'] = cursor
+            response = client.get('/materials/', params=params)
+            assert response.status_code == 200
+            seen += [m['name'] for m in response.json()]
+            cursor = response.headers.get('X-Next-Cursor')
+            if cursor is None:
+                break
+        assert seen == expected
+
+    # Ordinamento per costo con chiave (cost_per_kg, id): valori ripetuti non perdono elementi
+    seen, cursor = [], None
+    while True:
+        params = {'sort': 'cost_per_kg', 'limit': 2, 'name_prefix': prefix, **({'cursor': cursor} if cursor else {})}
+        response = client.get('/materials/', params=params)
+        seen += [(m['cost_per_kg'], m['id']) for m in response.json()]
+        cursor = response.headers.get('X-Next-Cursor')
+        if cursor is None:
+            break
+    assert seen == sorted(seen) and len(set(seen)) == 7
+
+    assert client.get('/materials/', params={'cursor': 'not-a-cursor'}).status_code == 422
+    assert client.get('/materials/', params={'sort': 'name', 'skip': 1}).status_code == 422
+
+def test_snapshot_etag(client):
+    """La lista senza filtri ha un ETag: 304 se invariata, ETag nuovo dopo una modifica"""
+    created = client.post('/materials/', json=material(unique_prefix() + 'etag')).json()
+    response = client.get('/materials/')
+    etag = response.headers['ETag']
+    assert any(m['id'] == created['id'] for m in response.json())
+
+    cached = client.get('/materials/', headers={'If-None-Match': etag})
+    assert cached.status_code == 304 and cached.headers['ETag'] == etag
+    # Pagine diverse hanno ETag diversi
+    assert client.get('/materials/', params={'skip': 1}).headers['ETag'] != etag
+
+    assert client.patch(f"/materials/{created['id']}", json={'cost_per_kg': 99.0}).status_code == 200
+    response = client.get('/materials/', headers={'If-None-Match': etag})
+    assert response.status_code == 200 and response.headers['ETag'] != etag
+    assert next(m for m in response.json() if m['id'] == created['id'])['cost_per_kg'] == 99.0
@@ -0,0 +1,95 @@
+import gzip
+
+import numpy as np
+import pytest
+
+from meshes import box_mesh, cube_mesh, indexed, obj_file, ply_file, threemf_file, threemf_mesh
+from stl_processor import analyze_stl, iter_decompressed, load_mesh, mesh_format, mesh_volume, write_stl
+
+def quads(vertices: np.ndarray) -> list[list[int]]:
+    """Facce quadrate del cubo indicizzato, in senso antiorario visto dall'esterno"""
+    index = {tuple(v): i for i, v in enumerate(np.sign(vertices).astype(int).tolist())}
+    polygons = []
+    for axis in range(3):
+        u, v = [a for a in range(3) if a != axis]
+        for sign in (-1, 1):
+            corners = []
+            for a, b in ((-1, -1), (1, -1), (1, 1), (-1, 1)):
+                key = [0, 0, 0]
+                key[axis], key[u], key[v] = sign, a, b
+                corners.append(index[tuple(key)])
+            polygons.append(corners if sign * (1 if (v - u) % 3 == 1 else -1) > 0 else corners[::-1])
+    return polygons
+
+def test_indexed_formats_match_stl():
+    """Stesso cubo da 10 mm in STL, OBJ, PLY e 3MF: stesso volume e stesse dimensioni"""
+    cube = cube_mesh(10.0)
+    vertices, faces = indexed(cube)
+    files = {
+        'stl': write_stl(cube),
+        'obj': obj_file(vertices, faces.tolist()),
+        'ply': ply_file(vertices, faces.tolist()),
+        'ply big endian': ply_file(vertices, faces.tolist(), byte_order='>'),
+        '3mf': threemf_file({'1': threemf_mesh(vertices, faces)}, [('1', None)]),
+    }
+    for name, content in files.items():
+        triangles = load_mesh(content)
+        assert triangles.shape == (12, 3, 3), name
+        assert abs(mesh_volume(triangles) - 1000) < 1e-3, name
+        assert analyze_stl(content)['dimensions'] == {'width': 10.0, 'depth': 10.0, 'height': 10.0}, name
+
+def test_polygons_are_fan_triangulated():
+    """OBJ e PLY con facce quadrate: due triangoli per faccia, volume conservato"""
+    vertices, _ = indexed(cube_mesh(10.0))
+    polygons = quads(vertices)
+    for content in (obj_file(vertices, polygons), ply_file(vertices, polygons)):
+        triangles = load_mesh(content)
+        assert len(triangles) == 12
+        assert abs(mesh_volume(triangles) - 1000) < 1e-3
+
+def test_obj_relative_indices():
+    content = b'v 0 0 0\nv 1 0 0\nv 0 1 0\nf -3 -2 -1\nv 0 0 1\nf 1 -3 -1\n'
+    triangles = load_mesh(content)
+    assert np.array_equal(triangles[1], [[0, 0, 0], [1, 0, 0], [0, 0, 1]])
+
+def test_3mf_units_components_and_transforms():
+    """Componenti e trasformazioni della build si applicano, l'unità è convertita in mm"""
+    vertices, faces = indexed(box_mesh(1.0, 2.0, 3.0))
+    objects = {
+        '1': threemf_mesh(vertices, faces),
+        '2': '<components><component objectid="1"/><component objectid="1" transform="1 0 0 0 1 0 0 0 1 5 0 0"/></components>',
+    }
+    content = threemf_file(objects, [('2', '2 0 0 0 1 0 0 0 1 0 0 0')], unit='centimeter')
+    triangles = load_mesh(content)
+    assert len(triangles) == 24
+    # Due scatole da 1×2×3 cm, raddoppiate in x dalla build: 2 × 12 cm³
+    assert abs(mesh_volume(triangles) / 1000 - 24) < 1e-6
+    assert np.allclose(triangles.reshape(-1, 3).max(axis=0), [120, 20, 30])
+
+def test_gzip_members_are_concatenated():
+    content = write_stl(cube_mesh(10.0))
+    compressed = gzip.compress(content[:100]) + gzip.compress(content[100:])
+    assert mesh_format(compressed[:1024], len(compressed)) == 'gzip'
+    assert abs(mesh_volume(load_mesh(compressed)) - 1000) < 1e-3
+    with pytest.raises(ValueError, match="compresso più volte"):
+        load_mesh(gzip.compress(compressed))
+    with pytest.raises(ValueError, match="troncato"):
+        load_mesh(compressed[:-20])
+    with pytest.raises(ValueError, match="troppo grande"):
+        list(iter_decompressed([compressed], 'gzip', max_size=len(content) - 1))
+
+def test_zstd_mesh():
+    zstandard = pytest.importorskip('zstandard')
+    content = write_stl(cube_mesh(10.0))
+    compressed = zstandard.ZstdCompressor().compress(content)
+    assert mesh_format(compressed[:1024], len(compressed)) == 'zstd'
+    assert abs(mesh_volume(load_mesh(compressed)) - 1000) < 1e-3
+
+def test_invalid_files_are_rejected():
+    vertices, faces = indexed(cube_mesh(10.0))
+    with pytest.raises(ValueError, match="fuori range"):
+        load_mesh(obj_file(vertices, (faces + 1).tolist()))
+    with pytest.raises(ValueError, match="fuori range"):
+        load_mesh(ply_file(vertices, (faces + 1).tolist()))
+    with pytest.raises(ValueError, match="Oggetto 3MF 7"):
+        load_mesh(threemf_file({'1': threemf_mesh(vertices, faces)}, [('7', None)]))
@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+
+from meshes import box_mesh
+from stl_processor import analyze_stl, footprint_mask, pack_copies, plate_quote, write_stl
+
+MATERIAL = {'density': 1.24, 'cost_per_kg': 20.0, 'hourly_cost': 30.0}
+
+def occupied(mask: np.ndarray, placements, resolution: float = 1.0) -> np.ndarray:
+    """Quante copie coprono ogni cella del piatto"""
+    plate = np.zeros((400, 400), dtype=np.int64)
+    for x, y, rotated in placements:
+        m = np.rot90(mask) if rotated else mask
+        row, col = int(round(y / resolution)), int(round(x / resolution))
+        plate[row:row + m.shape[0], col:col + m.shape[1]] += m
+    return plate
+
+def test_footprint_mask_contains_the_part():
+    """Il rettangolo senza inviluppo e un triangolo rasterizzato includono lo spacing"""
+    rectangle = footprint_mask({'width': 20, 'depth': 10}, spacing=4)
+    assert rectangle.shape == (14, 24) and rectangle.all()
+    triangle = footprint_mask({'width': 20, 'depth': 20}, np.array([[0, 0], [20, 0], [0, 20]]), spacing=0)
+    assert triangle[0, 0] and triangle[0, -1] and triangle[-1, 0]
+    assert not triangle[-1, -1]
+    assert 0.5 < triangle.mean() < 0.75
+
+def test_pack_copies_fills_the_plate_without_overlaps():
+    mask = footprint_mask({'width': 50, 'depth': 50}, spacing=5)
+    placements = pack_copies(mask, 100, plate_width=220, plate_depth=220, spacing=5)
+    # (220 + 5) / 55 = 4 copie per lato
+    assert len(placements) == 16
+    plate = occupied(mask, placements)
+    assert plate.max() == 1
+    assert all(0 <= x and x + mask.shape[1] <= 225 and 0 <= y and y + mask.shape[0] <= 225 for x, y, _ in placements)
+
+def test_pack_copies_rotates_to_fit_more():
+    """100 × 30 mm su un piatto 140 × 220: ruotando il pezzo ci stanno più copie"""
+    mask = footprint_mask({'width': 100, 'depth': 30}, spacing=5)
+    fixed = pack_copies(mask, 50, plate_width=140, plate_depth=220, spacing=5, allow_rotation=False)
+    rotated = pack_copies(mask, 50, plate_width=140, plate_depth=220, spacing=5)
+    assert len(fixed) == 6
+    assert len(rotated) > len(fixed)
+    assert any(r for _, _, r in rotated)
+    assert occupied(mask, rotated).max() == 1
+
+def test_plate_quote_shares_layer_overhead():
+    analysis = analyze_stl(write_stl(box_mesh(40, 40, 20)))
+    single = plate_quote(analysis, MATERIAL, 0.2, 1)
+    order = plate_quote(analysis, MATERIAL, 0.2, 30)
+    # (220 + 5) / 45 = 5 copie per lato
+    assert order['per_plate'] == 25 and order['plates'] == 2
+    assert len(order['layout']) == 25
+    assert order['material_cost'] == pytest.approx(30 * single['material_cost'], abs=30 * 0.005)
+    assert order['tempo_stampa'] < 30 * single['tempo_stampa']
+
+def test_plate_quote_rejects_parts_larger_than_the_plate():
+    analysis = analyze_stl(write_stl(box_mesh(300, 40, 20)))
+    with pytest.raises(ValueError, match="non entra nel piatto"):
+        plate_quote(analysis, MATERIAL, 0.2, 2)
@@ -0,0 +1,26 @@
+import os
+import time
+
+import pytest
+
+from stl_processor import PreviewCache, content_hash, preview_cache_key
+
+def test_preview_cache_is_private_bounded_and_rejects_foreign_keys(tmp_path):
+    """Byte grezzi in una directory 0700, espulsione LRU su disco, solo chiavi esadecimali"""
+    directory = tmp_path / "previews"
+    cache = PreviewCache(max_bytes=10, disk_dir=str(directory), disk_max_bytes=250)
+    assert directory.stat().st_mode & 0o777 == 0o700
+
+    keys = [preview_cache_key(content_hash(bytes([i]))) for i in range(5)]
+    for i, key in enumerate(keys):
+        cache.put(key, bytes([i]) * 100)
+        time.sleep(0.01)
+        assert cache.get(keys[0]) is not None  # la prima resta la più usata
+    assert sorted(os.listdir(directory)) == sorted(f"{key}.glb" for key in (keys[0], keys[4]))
+    assert (directory / f"{keys[4]}.glb").read_bytes() == bytes([4]) * 100
+
+    (directory / "evil.pkl").write_bytes(b"not a preview")
+    assert cache.get("evil") is None
+    assert cache.get("../previews/evil") is None
+    with pytest.raises(ValueError):
+        cache.put("evil", b"payload")
@@ -0,0 +1,40 @@
+import numpy as np
+
+from backend import api
+from meshes import ascii_stl, sphere_mesh
+from stl_processor import analysis_cache, write_stl
+
+def quote_params(client) -> dict:
+    material = client.get('/materials/').json()[0]
+    return {'material_id': material['id'], 'layer_height': material['min_layer_height'], 'copies': 4}
+
+def test_stream_quote_uses_the_streamed_analysis(client, monkeypatch):
+    """/quote/stream non rianalizza lo STL: il preventivo è quello dell'analisi in memoria"""
+    content = write_stl(sphere_mesh(20_000, radius=15.0))
+    params = quote_params(client)
+    monkeypatch.setattr(api, 'analyze_stl_file', None)  # il percorso in streaming non deve usarlo
+    streamed = client.post('/quote/stream', params=params, content=content)
+    assert streamed.status_code == 200, streamed.text
+
+    analysis_cache.clear()
+    buffered = client.post('/quote', data=params, files={'file': ('sphere.stl', content)})
+    assert buffered.status_code == 200, buffered.text
+    streamed, buffered = streamed.json(), buffered.json()
+    assert streamed['mesh_report'] is None
+    for field in ('volume_cm3', 'tempo_stampa', 'total_cost', 'plates', 'per_plate', 'order_total_cost'):
+        assert np.isclose(streamed[field], buffered[field], rtol=1e-6), field
+    assert streamed['dimensions'] == buffered['dimensions']
+
+def test_stream_quote_ascii_matches_binary(client):
+    """Uno STL ASCII in streaming ha anche il profilo di sezione: stesso preventivo del binario"""
+    sphere = sphere_mesh(4_000, radius=12.0)
+    params = quote_params(client)
+    binary = client.post('/quote/stream', params=params, content=write_stl(sphere)).json()
+    text = client.post('/quote/stream', params=params, content=ascii_stl(sphere)).json()
+    for field in ('volume_cm3', 'tempo_stampa', 'order_total_cost'):
+        assert np.isclose(text[field], binary[field], rtol=1e-6), field
+
+def test_stream_quote_rejects_truncated_stl(client):
+    content = write_stl(sphere_mesh(2_000, radius=10.0))
+    response = client.post('/quote/stream', params=quote_params(client), content=content[:-10])
+    assert response.status_code == 422
@@ -0,0 +1,37 @@
+import numpy as np
+
+from scheduler import schedule_jobs
+
+def test_lpt_balances_identical_printers():
+    """Lavori lunghi su stampanti diverse, makespan al limite inferiore"""
+    plan = schedule_jobs([3, 3, 2, 2, 2], [1, 1], [0.1, 0.1])
+    assert plan['makespan'] == plan['lower_bound'] == 6
+    assert np.allclose(np.bincount(plan['printer'], weights=[3, 3, 2, 2, 2]), plan['loads'])
+
+def test_critical_printer_without_jobs_stops_the_search():
+    """Se la stampante critica è occupata da prima, la ricerca locale si ferma senza errori"""
+    plan = schedule_jobs([1, 1, 1], [1, 1], [0.1, 0.1], 0, 0, [5, 0])
+    assert plan['makespan'] == 5
+    assert np.all(plan['printer'] == 1)
+    assert plan['moves'] == 0
+
+def test_cost_weight_prefers_cheaper_printer():
+    """Con cost_weight 0 conta solo il makespan; con un peso alto i lavori vanno sulla stampante economica"""
+    fast = schedule_jobs([1, 1, 1, 1], [1, 50], [0.1, 0.1])
+    assert fast['makespan'] == 2 and set(fast['printer']) == {0, 1}
+    cheap = schedule_jobs([1, 1, 1, 1], [1, 50], [0.1, 0.1], cost_weight=1)
+    assert np.all(cheap['printer'] == 0)
+    assert cheap['makespan'] == 4 and cheap['total_cost'] < fast['total_cost']
+    # L'energia entra nel costo orario
+    energy = schedule_jobs([1, 1], [1, 1], [0.1, 5], cost_per_kwh=1, cost_weight=1)
+    assert np.all(energy['printer'] == 0) and energy['energy_kwh'] == 0.2
+
+def test_schedule_endpoint_with_busy_printer(client):
+    printer = client.post('/printers/', json={'name': 'Busy', 'hourly_cost': 1, 'power_consumption': 0.1}).json()
+    client.post('/printers/', json={'name': 'Idle', 'hourly_cost': 1, 'power_consumption': 0.1})
+    response = client.post('/schedule', json={
+        'jobs': [{'id': 'part.stl', 'tempo_stampa': 1, 'copies': 3}],
+        'ready_hours': {str(printer['id']): 10},
+    })
+    assert response.status_code == 200, response.text
+    assert all(a['printer_id'] != printer['id'] for a in response.json()['assignments'])
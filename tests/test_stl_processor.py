@@ -0,0 +1,74 @@
+import numpy as np
+
+import stl_processor
+from meshes import cube_mesh, nested_cubes, sphere_mesh
+from stl_processor import MeshAccumulator, mesh_volume, process_stl, repair_mesh, write_stl
+
+def test_mesh_volume_far_from_origin():
+    """Sfera r=10 mm centrata in (800, 800, 300): il volume non deve dipendere dalla posizione"""
+    sphere = sphere_mesh(20_000, radius=10.0)
+    far = (sphere + np.array([800, 800, 300], dtype=np.float32)).astype(np.float32)
+
+    accumulator = MeshAccumulator()
+    accumulator.update(far)
+    assert abs(mesh_volume(far) - mesh_volume(sphere)) / mesh_volume(sphere) < 1e-4
+    assert abs(mesh_volume(far) / 1000 - accumulator.volume) < 1e-3
+    assert abs(process_stl(write_stl(far), repair=False)[0] - 4.18) < 0.01
+
+def test_repair_keeps_cavity_negative():
+    """Cubo da 20 mm con cavità da 10 mm: 8 - 1 = 7 cm³, qualunque sia il verso dei gusci"""
+    outer, inner = cube_mesh(20.0), cube_mesh(10.0)
+    for outer_shell in (outer, outer[:, [0, 2, 1]]):
+        for inner_shell in (inner[:, [0, 2, 1]], inner):
+            mesh = np.concatenate([outer_shell, inner_shell])
+            assert abs(process_stl(write_stl(mesh), repair=True)[0] - 7.0) < 1e-6
+            repaired, report = repair_mesh(mesh)
+            assert abs(mesh_volume(repaired) - 7000) < 1e-3
+            assert report['components'] == 2
+            assert report['non_orientable_edges'] == 0
+
+def test_repair_many_nested_cavities():
+    """Sfera che racchiude 1000 cubi cavi: ogni cubo si sottrae, con un raggio per cubo"""
+    sphere = sphere_mesh(200_000, radius=50.0)
+    mesh = np.concatenate([sphere, nested_cubes(10, 5.0)])
+    repaired, report = repair_mesh(mesh)
+    assert report['components'] == 1001
+    assert abs(mesh_volume(repaired) - (mesh_volume(sphere) - 8000)) < 1e-6 * mesh_volume(sphere)
+
+def test_repair_nesting_cap_keeps_file_orientation(monkeypatch):
+    """Oltre il limite di confronti ogni componente tiene il verso prevalente nel file"""
+    monkeypatch.setattr(stl_processor, 'NESTING_MAX_TESTS', 0)
+    outer, inner = cube_mesh(20.0), cube_mesh(10.0)[:, [0, 2, 1]]
+    outer[:2] = outer[:2, [0, 2, 1]]
+    repaired, report = repair_mesh(np.concatenate([outer, inner]))
+    assert report['flipped'] == 2
+    assert abs(mesh_volume(repaired) - 7000) < 1e-3
+
+def test_repair_counts_non_orientable_edges():
+    """
+    Un cubo con una faccia capovolta si riorienta; una striscia di Möbius no, anche
+    accanto a una sfera che richiede più passate dell'union-find
+    """
+    cube = cube_mesh(20.0)
+    cube[:2] = cube[:2, [0, 2, 1]]
+    repaired, report = repair_mesh(cube)
+    assert report['non_orientable_edges'] == 0 and report['flipped'] == 2
+    assert abs(mesh_volume(repaired) - 8000) < 1e-3
+
+    # Striscia di Möbius: l'ultimo segmento si richiude sul primo scambiando i lati
+    angles = np.linspace(0, 2 * np.pi, 7)[:-1]
+    def point(angle, side):
+        radius = 10 + 3 * side * np.cos(angle / 2)
+        return [radius * np.cos(angle), radius * np.sin(angle), 3 * side * np.sin(angle / 2)]
+    strip = []
+    for i, angle in enumerate(angles):
+        a, b = point(angle, -1), point(angle, 1)
+        if i + 1 < len(angles):
+            c, d = point(angles[i + 1], -1), point(angles[i + 1], 1)
+        else:
+            c, d = point(0, 1), point(0, -1)
+        strip += [[a, b, d], [a, d, c]]
+    sphere = sphere_mesh(2000, radius=5.0) + np.float32(40)
+    _, report = repair_mesh(np.concatenate([np.array(strip, dtype=np.float32), sphere]))
+    assert report['components'] == 2 and report['open_edges'] == 12
+    assert report['non_orientable_edges'] == 1
@@ -0,0 +1,68 @@
+import hashlib
+import io
+
+import numpy as np
+import pytest
+
+from meshes import ascii_stl, sphere_mesh
+from stl_processor import STL_HEADER_SIZE, StreamingSTLParser, _convex_hull, analyze_stl, write_stl
+
+def stream(content: bytes, chunk_size: int, expected_size: int | None = None, **kwargs) -> dict:
+    parser = StreamingSTLParser(expected_size, **kwargs)
+    for start in range(0, len(content), chunk_size):
+        parser.feed(content[start:start + chunk_size])
+    return parser.finish()
+
+def hull_area(hull: np.ndarray) -> float:
+    x, y = hull[:, 0].astype(np.float64), hull[:, 1].astype(np.float64)
+    return 0.5 * float(np.dot(x, np.roll(y, -1)) - np.dot(y, np.roll(x, -1)))
+
+def hull_distance(hull: np.ndarray, points: np.ndarray) -> np.ndarray:
+    """Minima distanza con segno dei punti dai lati dell'inviluppo antiorario, positiva all'interno"""
+    edge = np.roll(hull, -1, axis=0) - hull
+    cross = edge[:, 0] * (points[:, 1, None] - hull[:, 1]) - edge[:, 1] * (points[:, 0, None] - hull[:, 0])
+    return (cross / np.hypot(edge[:, 0], edge[:, 1])).min(axis=1)
+
+@pytest.mark.parametrize('chunk_size', [1, 49, 4096, 1 << 20])
+def test_chunked_stats_match_in_memory_analysis(chunk_size):
+    """Qualunque sia la dimensione dei blocchi, le statistiche sono quelle dell'analisi in memoria"""
+    sphere = sphere_mesh(600, radius=20.0) + np.float32(30)
+    for content in (write_stl(sphere), ascii_stl(sphere)):
+        stats = stream(content, chunk_size, len(content))
+        reference = analyze_stl(content)
+        assert stats['hash'] == hashlib.sha256(content).hexdigest()
+        assert stats['size'] == len(content)
+        assert stats['triangle_count'] == reference['triangle_count']
+        assert np.isclose(stats['volume'], reference['volume'], rtol=1e-6)
+        assert np.isclose(stats['surface_area'], reference['surface_area'], rtol=1e-6)
+        assert np.allclose(stats['centroid'], reference['centroid'], atol=1e-3)
+        assert stats['dimensions'] == reference['dimensions']
+        assert np.allclose(stats['z_range'], (sphere[:, :, 2].min(), sphere[:, :, 2].max()))
+        # Impronta per blocchi: contiene tutti i vertici, al più una colonna oltre l'inviluppo esatto
+        points = sphere[:, :, :2].reshape(-1, 2) - sphere[:, :, :2].reshape(-1, 2).min(axis=0)
+        assert np.all(hull_distance(stats['footprint'], points) >= -1e-4)
+        exact = hull_area(_convex_hull(points.astype(np.float64)))
+        assert exact <= hull_area(stats['footprint']) < 1.05 * exact
+
+def test_binary_header_starting_with_solid():
+    """Un header binario che inizia per 'solid' è riconosciuto dalla dimensione del file"""
+    content = bytearray(write_stl(sphere_mesh(300, radius=5.0)))
+    content[:STL_HEADER_SIZE] = b'solid exported by a CAD'.ljust(STL_HEADER_SIZE)
+    stats = stream(bytes(content), 1000, len(content))
+    assert stats['format'] == 'binary' and stats['triangle_count'] == 300
+
+def test_ascii_vectors_are_written_as_float32():
+    sphere = sphere_mesh(300, radius=5.0)
+    out = io.BytesIO()
+    stats = stream(ascii_stl(sphere), 777, ascii_vectors=out)
+    assert stats['format'] == 'ascii'
+    assert np.array_equal(np.frombuffer(out.getvalue(), dtype=np.float32).reshape(-1, 3, 3), sphere)
+
+def test_truncated_and_empty_files_are_rejected():
+    content = write_stl(sphere_mesh(300, radius=5.0))
+    with pytest.raises(ValueError, match="troncato"):
+        stream(content[:-1], 4096)
+    with pytest.raises(ValueError, match="non contiene triangoli"):
+        stream(b'solid empty\nendsolid empty\n', 4096)
+    with pytest.raises(ValueError, match="ASCII non valido"):
+        stream(b'solid broken\nfacet normal 0 0 1\n outer loop\n  vertex 0 0 0\n  vertex 1 0 0\n endloop\n', 4096)